@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+""" Compares encode/decode throughput & payload sizes of all available codecs
+    on the job payloads used across the test suite.
+
+Usage:
+    python benchmarks/bench_codecs.py [--repeats N]
+"""
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import argparse
+import os
+import sys
+import timeit
+
+# Libs
+
+
+# Custom
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, "tests"))
+from conftest import FEDERATED_CONFIG, enumerate_federated_conbinations
+from synmanager.compression import compress, SYNERGOS_DEFLATE_ENCODING
+from synmanager.serialization import CODECS
+
+##################
+# Configurations #
+##################
+
+JOB_KEY, JOB_KWARGS = next(
+    iter(enumerate_federated_conbinations(**FEDERATED_CONFIG).items())
+)
+PAYLOADS = {
+    'federated_config': FEDERATED_CONFIG,
+    'train_job': {
+        'process': 'train',
+        'combination_key': JOB_KEY,
+        'combination_params': JOB_KWARGS
+    }
+}
+
+###########
+# Helpers #
+###########
+
+def measure(codec, payload, repeats: int) -> dict:
+    """ Measures throughput (in ops/sec) & encoded sizes (in bytes) of a codec
+        on a single payload
+    """
+    encoded = codec.encode(payload)
+    encode_time = min(timeit.repeat(lambda: codec.encode(payload), number=repeats, repeat=3))
+    decode_time = min(timeit.repeat(lambda: codec.decode(encoded), number=repeats, repeat=3))
+    compressed, _ = compress(encoded, SYNERGOS_DEFLATE_ENCODING, threshold=0)
+    return {
+        'encode_ops': repeats / encode_time,
+        'decode_ops': repeats / decode_time,
+        'size': len(encoded),
+        'compressed_size': len(compressed)
+    }
+
+##########
+# Script #
+##########
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=20000)
+    args = parser.parse_args()
+
+    header = f"{'payload':<18}{'codec':<10}{'encode/s':>12}{'decode/s':>12}{'bytes':>8}{'deflated':>10}"
+    print(header)
+    print("-" * len(header))
+    for payload_name, payload in PAYLOADS.items():
+        for codec_name, codec in CODECS.items():
+            stats = measure(codec, payload, args.repeats)
+            print(
+                f"{payload_name:<18}{codec_name:<10}"
+                f"{stats['encode_ops']:>12,.0f}{stats['decode_ops']:>12,.0f}"
+                f"{stats['size']:>8}{stats['compressed_size']:>10}"
+            )
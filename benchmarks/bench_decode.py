@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+""" Measures memory allocated per message by the consumer decode path, against
+    the legacy path (i.e. decode to `str`, log in full, then parse), for 1 KB,
+    100 KB & 5 MB bodies. Transient allocations exclude the parsed kwargs that
+    are handed to the process function, & hence reflect the intermediate
+    copies made of each payload. Requires Python 3.9+ (`tracemalloc.reset_peak`).
+
+Usage:
+    python benchmarks/bench_decode.py [--repeats N]
+"""
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import argparse
+import json
+import logging
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, "tests"))
+from conftest import RUN_RECORD_1, EXPT_RECORD
+from synmanager.base import ConsumerOperator
+from synmanager.serialization import JSON_CONTENT_TYPE, get_decoder
+
+##################
+# Configurations #
+##################
+
+BODY_SIZES = {'1 KB': 2**10, '100 KB': 100 * 2**10, '5 MB': 5 * 2**20}
+
+# Render logs as usual, but discard them to keep console output readable
+logging.getLogger().handlers = [logging.StreamHandler(open(os.devnull, 'w'))]
+
+###########
+# Helpers #
+###########
+
+def generate_body(size: int) -> bytes:
+    """ Generates a job payload of approximately the specified size """
+    run_size = len(json.dumps(RUN_RECORD_1, sort_keys=True))
+    return json.dumps(
+        {'experiment': EXPT_RECORD, 'runs': [RUN_RECORD_1] * (size // run_size)},
+        sort_keys=True
+    ).encode()
+
+
+def legacy_path(body: bytes):
+    """ Decode path prior to zero-copy handling """
+    decoded_msg = body.decode()
+    logging.info(f"[x] key - Received: {decoded_msg}")
+    return json.loads(decoded_msg)
+
+
+def measure(path, body: bytes, repeats: int) -> tuple:
+    """ Measures mean peak & transient memory allocated (in bytes) per message
+    """
+    peaks = []
+    transients = []
+    tracemalloc.start()
+    for _ in range(repeats):
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        kwargs = path(body)
+        retained, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - baseline)
+        transients.append(peak - retained)
+        del kwargs
+    tracemalloc.stop()
+    return sum(peaks) / repeats, sum(transients) / repeats
+
+##########
+# Script #
+##########
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    consumer = ConsumerOperator(host="localhost", port=5672)
+    channel = SimpleNamespace(basic_ack=lambda **kwargs: None)
+    method = SimpleNamespace(routing_key="key", delivery_tag=1)
+
+    paths = {'legacy': legacy_path}
+    for content_type in (None, JSON_CONTENT_TYPE):
+        properties = SimpleNamespace(
+            content_encoding=None,
+            content_type=content_type,
+            headers=None,
+            message_id=None
+        )
+        received = []
+        callback = consumer.generate_callback(process_function=(
+            lambda received=received, **kwargs: received.append(kwargs)
+        ))
+        decoder = get_decoder(content_type).name if content_type else consumer.codec
+        paths[f'callback ({decoder})'] = (
+            lambda body, callback=callback, properties=properties, received=received:
+            callback(channel, method, properties, body) or received.pop()
+        )
+
+    header = f"{'body':<8}{'path':<20}{'peak/msg':>14}{'transient/msg':>16}{'x body':>8}"
+    print(header)
+    print("-" * len(header))
+    for size_name, size in BODY_SIZES.items():
+        body = generate_body(size)
+        for path_name, path in paths.items():
+            peak, transient = measure(path, body, args.repeats)
+            print(
+                f"{size_name:<8}{path_name:<20}"
+                f"{peak / 2**10:>11,.1f} KB{transient / 2**10:>13,.1f} KB"
+                f"{transient / len(body):>8.2f}"
+            )
@@ -45,6 +45,9 @@ setup(
     install_requires=[
         "pika"
     ],
+    extras_require={
+        "fast": ["orjson", "msgpack"]
+    },
     include_package_data=True,
     zip_safe=False
 )
\ No newline at end of file
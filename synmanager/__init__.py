@@ -12,6 +12,25 @@
 
 # Custom
 from . import base
+from . import blobs
+from . import combinations
+from . import jobs
+from . import compression
+from . import dedup
+from . import serialization
+from . import async_base
+from . import metrics
+from . import monitor
+from . import outbox
+from . import pool
+from . import prefetch
+from . import priority
+from . import recovery
+from . import retry
+from . import throttling
+from . import topology
+from . import tracing
+from . import workers
 from . import preprocess_operations as preprocess
 from . import train_operations as train
 from . import evaluate_operations as evaluate
@@ -0,0 +1,584 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+# Libs
+import pika
+from pika.adapters.asyncio_connection import AsyncioConnection
+
+# Custom
+from .base import BaseOperator
+from .serialization import get_codec
+
+##################
+# Configurations #
+##################
+
+logging.getLogger("pika").setLevel(logging.WARNING) # reduce log level
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.DEBUG)
+
+#################################################
+# Async Base Operator Class - AsyncBaseOperator #
+#################################################
+
+class AsyncBaseOperator(BaseOperator):
+    """ Contains baseline functionality to all asyncio-driven queue related
+        operations. Asynchronous operators run on the current event loop,
+        allowing a single loop to drive many concurrent publishes and
+        consumptions without dedicating a thread to each operator.
+
+    Attributes:
+        host (str): Address where queue is hosted on
+        port (int): Port where queue is hosted on
+        channel (pika.channel.Channel): Communication method used
+        connection (AsyncioConnection): Connection on which to communicate with
+            deployed RabbitMQ server
+        exchange_name (str): Name of exchange to operate on
+        exchange_type (str): Type of exchange (i.e. "direct", "fanout", "topic",
+            "headers"). Default: "topic"
+        durability (bool): Toggles if persistent messages are to be re-declared
+            when broker restarts after it had been taken down
+        routing_key (str): Message attribute of header
+        concurrency (int): Max no. of operations allowed in flight at once
+    """
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port)
+
+        # Optimisation attributes
+        self.concurrency = concurrency
+        self.semaphore = None
+        self._futures = set()   # unresolved broker replies
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _create_future(self) -> asyncio.Future:
+        """ Creates a future on the running loop that is failed automatically
+            should the channel or connection close before it is resolved
+
+        Returns:
+            Pending future (asyncio.Future)
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+
+    def _fail_futures(self, error: BaseException):
+        """ Fails all unresolved futures with a specified error
+
+        Args:
+            error (BaseException): Reason for failure
+        """
+        for future in list(self._futures):
+            if not future.done():
+                future.set_exception(error)
+
+
+    async def _rpc(self, method, *args, **kwargs):
+        """ Invokes a callback-based channel method & awaits its reply from
+            the broker
+
+        Args:
+            method (Callable): Channel method supporting a `callback` argument
+            *args: Positional arguments of channel method
+            **kwargs: Keyword arguments of channel method
+        Returns:
+            Reply frame (pika.frame.Method)
+        """
+        future = self._create_future()
+        method(
+            *args,
+            callback=lambda frame: (
+                None if future.done() else future.set_result(frame)
+            ),
+            **kwargs
+        )
+        return await future
+
+
+    def _on_channel_closed(self, channel, reason: BaseException):
+        """ Handles unexpected channel closures """
+        logging.info(f"Channel {channel.channel_number} closed: {reason}")
+        self.channel = None
+        self._fail_futures(reason)
+
+
+    def _on_connection_closed(self, connection, reason: BaseException):
+        """ Handles unexpected connection closures """
+        logging.info(f"Connection closed: {reason}")
+        self.channel = None
+        self.connection = None
+        self._fail_futures(reason)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    async def connect(self, heartbeat: int = 0):
+        """ Initiate connection with RabbitMQ exchange where queues exist
+
+        Args:
+            heartbeat (int): Heartbeat interval (in secs)
+        """
+        if not self.is_connected():
+            parameters = pika.ConnectionParameters(
+                host=self.host,
+                port=self.port,
+                heartbeat=heartbeat
+            )
+
+            loop = asyncio.get_running_loop()
+            opened = loop.create_future()
+            connection = AsyncioConnection(
+                parameters=parameters,
+                on_open_callback=lambda conn: (
+                    None if opened.done() else opened.set_result(conn)
+                ),
+                on_open_error_callback=lambda conn, error: (
+                    None if opened.done() else opened.set_exception(
+                        pika.exceptions.AMQPConnectionError(error)
+                    )
+                ),
+                on_close_callback=self._on_connection_closed,
+                custom_ioloop=loop
+            )
+            self.connection = await opened
+
+            channel = loop.create_future()
+            connection.channel(on_open_callback=channel.set_result)
+            self.channel = await channel
+            self.channel.add_on_close_callback(self._on_channel_closed)
+
+            await self._rpc(
+                self.channel.exchange_declare,
+                exchange=self.exchange_name,
+                exchange_type=self.exchange_type,
+                durable=self.durability
+            )
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+
+
+    async def process(self):
+        """ Sends an operation payload to a remote queue for linearising jobs
+            for a Synergos cluster
+        """
+        raise NotImplementedError
+
+
+    async def delete(self):
+        """ Removes an operation payload that had been sent to a remote queue
+            for job linearisation
+        """
+        raise NotImplementedError
+
+
+    async def disconnect(self):
+        """ Closes current channel & termiates connection with RabbitMQ
+            exchange where queues exist
+        """
+        if self.is_connected():
+            connection = self.connection
+            closed = asyncio.get_running_loop().create_future()
+            connection.add_on_close_callback(
+                lambda conn, reason: (
+                    None if closed.done() else closed.set_result(reason)
+                )
+            )
+            connection.close()  # implicitly closes all open channels
+            await closed
+
+            self.channel = None
+            self.connection = None
+
+
+
+#####################################################
+# Async Base Operator Class - AsyncProducerOperator #
+#####################################################
+
+class AsyncProducerOperator(AsyncBaseOperator):
+    """ Contains baseline functionality for all types of asynchronous message
+        producers in Synergos. Publications are confirmed by the broker
+        independently, so that many of them may be awaited concurrently.
+
+    Attributes:
+        host (str): Address where queue is hosted on
+        port (int): Port where queue is hosted on
+        channel (pika.channel.Channel): Communication method used
+        connection (AsyncioConnection): Connection on which to communicate with
+            deployed RabbitMQ server
+        exchange_name (str): Name of exchange to operate on
+        exchange_type (str): Type of exchange (i.e. "direct", "fanout", "topic",
+            "headers"). Default: "topic"
+        durability (bool): Toggles if persistent messages are to be re-declared
+            when broker restarts after it had been taken down
+        routing_key (str): Message attribute of header
+        concurrency (int): Max no. of unconfirmed publications in flight
+    """
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Optimisation attributes
+        self._delivery_tag = 0  # last tag issued on channel
+        self._pending = {}      # delivery tag -> confirmation future
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _on_delivery_confirmation(self, frame: pika.frame.Method):
+        """ Resolves the confirmation futures of deliveries acknowledged (or
+            rejected) by the broker
+
+        Args:
+            frame (pika.frame.Method): Basic.Ack/Basic.Nack frame from broker
+        """
+        is_acked = isinstance(frame.method, pika.spec.Basic.Ack)
+        delivery_tag = frame.method.delivery_tag
+
+        if frame.method.multiple:
+            confirmed_tags = [tag for tag in self._pending if tag <= delivery_tag]
+        else:
+            confirmed_tags = [delivery_tag]
+
+        for tag in confirmed_tags:
+            future = self._pending.pop(tag, None)
+            if future and not future.done():
+                future.set_result(is_acked)
+
+
+    async def publish_message(
+        self, 
+        message: Union[str, bytes], 
+        headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None,
+        message_id: Optional[str] = None
+    ) -> bool:
+        """ Publish single message specified queue in exchange
+
+        Args:
+            message (str/bytes): Message to be published
+            headers (dict): Headers to be attached to message, if any
+            priority (int): Delivery priority of message, if any
+            message_id (str): Message ID of message, if any
+        Returns:
+            True    if message was confirmed by broker
+            False   otherwise
+        """
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        body, content_encoding = self.compress_message(message)
+
+        async with self.semaphore:
+            confirmation = self._create_future()
+            self.channel.basic_publish(
+                exchange=self.exchange_name,
+                routing_key=self.routing_key,
+                body=body,
+                properties=pika.BasicProperties(
+                    delivery_mode=2,    # persist msgs
+                    content_type=get_codec(self.codec).content_type,
+                    content_encoding=content_encoding,
+                    headers=headers or None,
+                    priority=priority,
+                    message_id=message_id
+                )
+            )
+            self._delivery_tag += 1
+            self._pending[self._delivery_tag] = confirmation
+
+            is_confirmed = await confirmation
+
+        if is_confirmed:
+            logging.info('Message publish was confirmed')
+        else:
+            logging.info('Message could not be confirmed')
+
+        return is_confirmed
+
+    ##################
+    # Core Functions #
+    ##################
+
+    async def connect(self, heartbeat: int = 0):
+        """ Initiate connection with RabbitMQ exchange, and enable publisher
+            confirms on the declared channel
+
+        Args:
+            heartbeat (int): Heartbeat interval (in secs)
+        """
+        if not self.is_connected():
+            await super().connect(heartbeat=heartbeat)
+            self._delivery_tag = 0
+            self._pending.clear()
+            await self._rpc(
+                self.channel.confirm_delivery,
+                ack_nack_callback=self._on_delivery_confirmation
+            )
+
+
+    async def process(self, **kwargs) -> str:
+        """ Creates a single job message from specified kwargs & publishes it.
+
+        Args:
+            **kwargs: Any configurations of a single job
+        Returns:
+            Job message (str)
+        """
+        return await self.process_with(kwargs)
+
+
+    async def process_with(
+        self, 
+        kwargs: Dict[str, Any], 
+        priority: Optional[int] = None
+    ) -> str:
+        """ Publishes a single job with delivery options. Job configurations
+            are given as a dictionary, so that none of their fields are ever
+            mistaken for options.
+
+        Args:
+            kwargs (dict): Any configurations of a single job
+            priority (int): Delivery priority of job. If None, priority is 
+                assigned by the operator's priority policy, if any.
+        Returns:
+            Job message (str)
+        """
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        message = self.create_message(kwargs)
+        await self.publish_message(
+            message, 
+            headers=self.create_headers(kwargs),
+            priority=self.create_priority(kwargs, priority),
+            message_id=self.create_message_id(kwargs)
+        )
+
+        return message
+
+
+
+########################################
+# Async Delivery Class - AsyncDelivery #
+########################################
+
+class AsyncDelivery:
+    """ Handle to a single message delivered to an asynchronous consumer. Every
+        delivery holds a slot of its consumer's concurrency limit, which is only
+        released once the delivery is acknowledged or rejected.
+
+    Attributes:
+        method (pika.spec.Basic.Deliver): Meta information regarding delivery
+        properties (pika.spec.BasicProperties): Properties on the message
+        body (bytes): Raw message payload
+        kwargs (dict): Job configurations parsed from payload. Payloads are
+            only parsed upon first access, so that malformed messages raise to
+            the caller handling them (who should `.reject()` them), instead of
+            out of `listen_message`
+    """
+    def __init__(self, operator, method, properties, body: bytes):
+        self.method = method
+        self.properties = properties
+        self.body = body
+
+        self._kwargs = None
+        self._is_parsed = False
+        self._operator = operator
+        self._channel = operator.channel
+        self._is_settled = False
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __settle(self):
+        """ Releases concurrency slot held by this delivery """
+        self._is_settled = True
+        self._operator.semaphore.release()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    @property
+    def kwargs(self) -> dict:
+        """ Job configurations, parsed upon first access """
+        if not self._is_parsed:
+            self._kwargs = self._operator.parse_message(
+                self._operator.decompress_message(
+                    self.body, 
+                    self.properties.content_encoding
+                ),
+                content_type=self.properties.content_type
+            )
+            self._is_parsed = True
+
+        return self._kwargs
+
+
+    def ack(self):
+        """ Acknowledge delivery to complete consumption """
+        if not self._is_settled:
+            if not self._operator.auto_ack:
+                self._channel.basic_ack(delivery_tag=self.method.delivery_tag)
+            self.__settle()
+
+
+    def reject(self, requeue: bool = True):
+        """ Reject delivery, returning it to the queue if specified
+
+        Args:
+            requeue (bool): Toggles if message is to be requeued
+        """
+        if not self._is_settled:
+            if not self._operator.auto_ack:
+                self._channel.basic_reject(
+                    delivery_tag=self.method.delivery_tag,
+                    requeue=requeue
+                )
+            self.__settle()
+
+
+
+#####################################################
+# Async Base Operator Class - AsyncConsumerOperator #
+#####################################################
+
+class AsyncConsumerOperator(AsyncBaseOperator):
+    """ Contains baseline functionality for all types of asynchronous message
+        consumers in Synergos. Deliveries are handed out as they arrive, with
+        no more than `concurrency` of them unsettled at any one time.
+
+    Attributes:
+        host (str): Address where queue is hosted on
+        port (int): Port where queue is hosted on
+        channel (pika.channel.Channel): Communication method used
+        connection (AsyncioConnection): Connection on which to communicate with
+            deployed RabbitMQ server
+        exchange_name (str): Name of exchange to operate on
+        exchange_type (str): Type of exchange (i.e. "direct", "fanout", "topic",
+            "headers"). Default: "topic"
+        durability (bool): Toggles if persistent messages are to be re-declared
+            when broker restarts after it had been taken down
+        routing_key (str): Message attribute of header
+        queue (str): Name of queue to listen on
+        auto_ack (bool): Toggles if a message should be acknowledged before
+            callback process conpletion
+        concurrency (int): Max no. of unsettled deliveries at once
+    """
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.queue = None
+        self.auto_ack = False
+
+    ##################
+    # Core Functions #
+    ##################
+
+    async def connect(self, heartbeat: int = 0):
+        """ Initiate connection with RabbitMQ exchange while configuring a
+            prefetch threshold matching the concurrency limit
+
+        Args:
+            heartbeat (int): Heartbeat interval (in secs)
+        """
+        if not self.is_connected():
+            await super().connect(heartbeat=heartbeat)
+            await self._rpc(
+                self.channel.basic_qos,
+                prefetch_size=0,                    # no message size limit
+                prefetch_count=self.concurrency     # max no. of messages
+            )
+
+
+    async def listen_message(self) -> AsyncIterator[AsyncDelivery]:
+        """ Commence message consumption from queue on current consumer.
+            Deliveries are yielded as they arrive, and must be settled via
+            `.ack()` or `.reject()` to free up capacity for more.
+
+        Yields:
+            Received deliveries (AsyncDelivery)
+        """
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        # Queues are no longer predefined on the broker, & must exist before
+        # they can be bound
+        await self._rpc(
+            self.channel.queue_declare,
+            self.queue,
+            durable=self.durability,
+            arguments=self.create_queue_arguments()
+        )
+        await self._rpc(
+            self.channel.queue_bind,
+            exchange=self.exchange_name,
+            queue=self.queue,
+            routing_key=self.routing_key
+        )
+
+        deliveries = asyncio.Queue()
+        consumer_tag = self.channel.basic_consume(
+            queue=self.queue,
+            on_message_callback=lambda ch, method, properties, body: (
+                deliveries.put_nowait((method, properties, body))
+            ),
+            auto_ack=self.auto_ack
+        )
+        logging.info(f"Listening from {self.queue} queue: ")
+
+        try:
+            while True:
+                await self.semaphore.acquire()
+
+                closure = self._create_future()
+                retrieval = asyncio.ensure_future(deliveries.get())
+                await asyncio.wait(
+                    [retrieval, closure],
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not retrieval.done():
+                    retrieval.cancel()
+                    self.semaphore.release()
+                    closure.result()    # re-raise reason for closure
+
+                closure.cancel()
+                method, properties, body = retrieval.result()
+                logging.info(f"[x] {method.routing_key} - Received delivery {method.delivery_tag}")
+                yield AsyncDelivery(self, method, properties, body)
+
+        finally:
+            if self.is_connected() and self.channel.is_open:
+                self.channel.basic_cancel(consumer_tag)
+
+
+    async def check_message_count(self) -> int:
+        """ Check for the no. of remaining messages waiting in queue
+
+        Returns:
+            Queue message count (int)
+        """
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        declared_queue = await self._rpc(
+            self.channel.queue_declare,
+            self.queue,
+            passive=True,
+            durable=self.durability
+        )
+        return declared_queue.method.message_count
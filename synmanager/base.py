@@ -5,17 +5,39 @@
 ####################
 
 # Generic/Built-in
-import json
+import functools
 import logging
+import math
 import multiprocessing as mp
 import time
-from typing import Dict, List, Callable, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Callable, Any, Iterable, Optional, Tuple, Union
 
 # Libs
 import pika
 
 # Custom
 from .abstract import AbstractOperator
+from .compression import compress, decompress, COMPRESSION_THRESHOLD
+from .config import EXCHANGE_NAME, EXCHANGE_TYPE
+from .jobs import JobView, extract_job_key, generate_message_id
+from .metrics import PUBLISHED_AT_HEADER
+from .priority import clamp_priority
+from .recovery import (
+    RECOVERABLE_ERRORS,
+    RECONNECT_ATTEMPTS,
+    RECONNECT_BASE_DELAY,
+    RECONNECT_MAX_DELAY,
+    RecordingChannel,
+    TopologyRecord,
+    calculate_backoff
+)
+from .retry import ATTEMPT_HEADER, clear_retry_headers
+from .serialization import get_codec, get_decoder, DEFAULT_CODEC
+from .throttling import calculate_backlog_factor, watch_connection
+from .topology import Topology, clear_verified
+from .tracing import annotate_span
+from .workers import BatchAckChannel, ThreadsafeChannel
 
 ##################
 # Configurations #
@@ -24,6 +46,17 @@ from .abstract import AbstractOperator
 logging.getLogger("pika").setLevel(logging.WARNING) # reduce log level
 logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.DEBUG)
 
+LOG_PREVIEW_SIZE = 128  # max no. of payload bytes rendered in logs
+
+DELAY_RESOLUTION = 1        # secs; delays are rounded up to a multiple of this
+DELAY_QUEUE_EXPIRY = 600    # secs an idle staging queue outlives its TTL
+DELAY_QUEUE_REFRESH = 60    # secs between redeclarations of a staging queue
+
+DEPTH_CHECK_INTERVAL = 5    # secs between queue depth checks when throttling
+
+CONSUMER_HEARTBEAT = 30     # secs between heartbeats on consumer connections
+EVENT_POLL_INTERVAL = 1     # secs between I/O servicing while jobs are running
+
 ######################################
 # Base Operator Class - BaseOperator #
 ######################################
@@ -47,6 +80,48 @@ class BaseOperator(AbstractOperator):
         durability (bool): Toggles if persistent messages are to be re-declared 
             when broker restarts after it had been taken down
         routing_key (str): Message attribute of header
+        queue (str): Name of queue that messages are routed to
+        virtual_host (str): Virtual host on which queues are hosted on
+        pool (ConnectionPool): Pool to lease connections from. If specified,
+            connections are shared with other operators to the same broker &
+            only a channel is opened per operator. Otherwise, each operator
+            opens its own connection. Default: None
+        compression (str): Content encoding to compress published payloads
+            with (i.e. "deflate", "x-synergos-deflate-v1"). If None, payloads
+            are published uncompressed. Default: None
+        compression_threshold (int): Min payload size (in bytes) for which
+            compression is applied
+        codec (str): Name of codec to serialise payloads with (i.e. "json", 
+            "orjson", "msgpack"). Consumers detect the codec of received 
+            payloads from their content type. Default: "json"
+        claim_check (ClaimCheck): Claim check to store large sub-objects of
+            payloads with, sending only their digests. Consumers must be
+            configured with a claim check over the same blob store. 
+            Default: None
+        max_priority (int): Max priority supported by queue (i.e. declared
+            as `x-max-priority`). If None, queue is a plain FIFO queue & 
+            deliveries are sent without priority. Default: None
+        priority_policy (Callable): Maps job configurations to a priority,
+            for jobs submitted without an explicit one. Default: None
+        auto_reconnect (bool): Toggles if dropped connections are reopened
+            automatically, with their recorded topology replayed. 
+            Default: True
+        reconnect_attempts (int): Max no. of reconnection attempts before
+            giving up
+        reconnect_delay (float): Backoff (in secs) before the 1st attempt,
+            doubling with every attempt
+        reconnect_max_delay (float): Upper bound of backoff (in secs)
+        topology (TopologyRecord): Exchanges, queues, bindings, QoS &
+            consumers declared over this operator's channel
+        queue_monitor (QueueMonitor): Monitor to read queue depths from, in
+            place of polling the broker on every check. Can be shared by any
+            no. of operators. Default: None
+        metrics (MetricsRegistry): Registry to record counters & latencies
+            of every message handled into, labelled by queue. If None, 
+            operators are not instrumented. Default: None
+        tracer (Tracer): Tracer to record the path of every job through its
+            queues with. Trace context is carried in message headers. If None,
+            jobs are not traced. Default: None
     """
     def __init__(self, host: str, port: int):
         # General attributes
@@ -56,20 +131,37 @@ class BaseOperator(AbstractOperator):
         # Network attributes
         self.channel = None
         self.connection = None
-        self.exchange_name = 'SynMQ_topic_logs'
-        self.exchange_type = 'topic'
+        self.exchange_name = EXCHANGE_NAME
+        self.exchange_type = EXCHANGE_TYPE
         self.routing_key = 'default'
         self.durability = True
+        self.virtual_host = '/'
+        self.pool = None
+        self.queue = None
+        self.max_priority = None
+        self.auto_reconnect = True
+        self.reconnect_attempts = RECONNECT_ATTEMPTS
+        self.reconnect_delay = RECONNECT_BASE_DELAY
+        self.reconnect_max_delay = RECONNECT_MAX_DELAY
+        self.topology = TopologyRecord()
+        self.queue_monitor = None
         
 
         # Data attributes
         # e.g participant_id/run_id in specific format
+        self.codec = DEFAULT_CODEC
+        self.claim_check = None
+        self.priority_policy = None
+        self.compression = None
+        self.compression_threshold = COMPRESSION_THRESHOLD
 
         # Optimisation attributes
         # e.g multiprocess/asyncio if necessary for optimisation
 
         # Export Attributes 
         # e.g. any artifacts that are going to be exported eg Records
+        self.metrics = None
+        self.tracer = None
 
     
     ############
@@ -83,38 +175,255 @@ class BaseOperator(AbstractOperator):
             True    if ready
             False   otherwise
         """
-        return self.channel and self.connection
+        return bool(
+            self.connection and self.connection.is_open and
+            self.channel and self.channel.is_open
+        )
+
+
+    def is_recoverable(self) -> bool:
+        """ Checks if an operator has lost a connection that it should
+            reopen (i.e. one that was not closed via `.disconnect()`)
+
+        Returns:
+            True    if connection is to be reopened
+            False   otherwise
+        """
+        return bool(
+            self.auto_reconnect and 
+            self.connection is not None and 
+            not self.is_connected()
+        )
 
     ###########    
     # Helpers #
     ###########
 
-    def create_message(self, run_kwarg: dict) -> str:
+    def record_latency(self, stage: str, started_at: float):
+        """ Records the time taken by a stage of handling a message, if
+            metrics are enabled
+
+        Args:
+            stage (str): Name of stage (e.g. "serialize", "process")
+            started_at (float): `time.perf_counter()` at start of stage
+        """
+        if self.metrics:
+            self.metrics.observe(
+                f"synmq_{stage}_seconds",
+                time.perf_counter() - started_at,
+                queue=self.queue or self.routing_key
+            )
+
+
+    def record_event(self, event: str, **labels):
+        """ Counts an event of handling a message, if metrics are enabled
+
+        Args:
+            event (str): Name of event (e.g. "published", "consumed")
+            **labels: Additional labels of event (e.g. outcome="failed")
+        """
+        if self.metrics:
+            self.metrics.increment(
+                f"synmq_{event}_total",
+                queue=self.queue or self.routing_key,
+                **labels
+            )
+
+
+    def create_message(self, run_kwarg: dict) -> Union[str, bytes]:
         """ Creates an operation payload to be sent to a remote queue for 
             linearising jobs for a Synergos cluster
 
         Args:
             run_kwargs
         Returns:
-            Message string (str)
+            Message string (str) or bytes (bytes), depending on codec
         """
-        return json.dumps(run_kwarg, default=str, sort_keys=True)
+        if self.claim_check:
+            run_kwarg = self.claim_check.check_in(run_kwarg)
+        return get_codec(self.codec).encode(run_kwarg)
         
+
+    def create_headers(self, run_kwarg: dict) -> Dict[str, str]:
+        """ Creates the AMQP headers accompanying an operation payload. The
+            job key (i.e. collab_id, project_id, expt_id & run_id) is copied 
+            into headers, so that consumers can filter, deduplicate & route 
+            jobs without parsing their payloads.
+
+        Args:
+            run_kwarg (dict): Job configurations
+        Returns:
+            Message headers (dict)
+        """
+        return extract_job_key(run_kwarg)
+
+
+    def create_message_id(self, run_kwarg: dict) -> str:
+        """ Creates a deterministic message ID for an operation payload, 
+            allowing consumers to detect duplicate submissions & redeliveries
+
+        Args:
+            run_kwarg (dict): Job configurations
+        Returns:
+            Message ID (str)
+        """
+        return generate_message_id(run_kwarg)
+
+
+    def create_priority(
+        self, 
+        run_kwarg: dict, 
+        priority: Optional[int] = None
+    ) -> Optional[int]:
+        """ Resolves the delivery priority of an operation payload. Explicit
+            priorities take precedence over the operator's priority policy.
+
+        Args:
+            run_kwarg (dict): Job configurations
+            priority (int): Explicit priority of job, if any
+        Returns:
+            Priority (int) or None, if queue does not support priorities
+        """
+        if priority is None and self.priority_policy:
+            priority = self.priority_policy(run_kwarg)
+        return clamp_priority(priority, self.max_priority)
+
+
+    def create_queue_arguments(self) -> Dict[str, Any]:
+        """ Creates the arguments a queue is declared with. These must match
+            the broker definitions (see `definitions.json`) exactly, since
+            RabbitMQ rejects redeclarations with differing arguments.
+
+        Returns:
+            Queue arguments (dict)
+        """
+        arguments = {'x-queue-type': 'classic'}
+        if self.max_priority is not None:
+            arguments['x-max-priority'] = self.max_priority
+        return arguments
+
+
+    def create_topology(self) -> Topology:
+        """ Describes the entities this operator relies on, i.e. its exchange,
+            & its queue together with its binding, if it has one
+
+        Returns:
+            Topology of operator (Topology)
+        """
+        topology = Topology(vhost=self.virtual_host)
+        topology.add_exchange(
+            self.exchange_name,
+            type=self.exchange_type,
+            durable=self.durability
+        )
+        if self.queue:
+            topology.add_queue(
+                self.queue,
+                durable=self.durability,
+                arguments=self.create_queue_arguments()
+            )
+            topology.add_binding(self.exchange_name, self.queue, self.routing_key)
+        return topology
+
+
+    def declare_topology(self) -> int:
+        """ Verifies the topology of this operator against the broker. Each
+            entity is only declared once per process, so operators connecting
+            (or listening) after the first skip the round trips entirely.
+
+        Returns:
+            No. of entities declared (int)
+        """
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        return self.create_topology().declare(
+            self.channel,
+            broker=(self.host, self.port)
+        )
+
+
+    def check_message_count(self) -> int:
+        """ Check for the no. of remaining messages waiting in queue. If a
+            queue monitor watches the queue, its latest sample is read instead.
+        
+        Returns:
+            Queue message count (int)
+        """
+        if self.queue_monitor and self.queue in self.queue_monitor.queues:
+            return self.queue_monitor.get_message_count(self.queue)
+
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        declared_queue = self.channel.queue_declare(
+            self.queue, 
+            passive=True, 
+            durable=self.durability
+        )
+        queue_message_count = declared_queue.method.message_count
+
+        return queue_message_count
+
     
-    def parse_message(self, message: str) -> dict:
-        """ Decodes string message to dictionary
+    def parse_message(
+        self, 
+        message: Union[str, bytes], 
+        content_type: Optional[str] = None
+    ) -> dict:
+        """ Decodes message to dictionary
 
         Args:
-            message (str)
+            message (str/bytes)
+            content_type (str): Content type advertised on the message. If 
+                None, the operator's own codec is used.
         Returns:
-            Parsed JSON (dict)
+            Parsed payload (dict)
         """ 
-        return json.loads(message)
+        codec = get_decoder(content_type) if content_type else get_codec(self.codec)
+        payload = codec.decode(message)
+
+        if self.claim_check:
+            payload = self.claim_check.check_out(payload)
+        return payload
 
         # also need to do the unstr() of our msg
         # string representation of TinyDate() must be converted back 
         # to the same date format that was from database.json with start_proc 
 
+
+    def compress_message(
+        self, 
+        message: Union[str, bytes]
+    ) -> Tuple[Union[str, bytes], Optional[str]]:
+        """ Compresses message payload according to the operator's compression
+            settings. Payloads below the compression threshold are left raw.
+
+        Args:
+            message (str/bytes): Message to be compressed
+        Returns:
+            Payload (str/bytes)
+            Content encoding applied (str/None)
+        """
+        return compress(
+            message, 
+            encoding=self.compression, 
+            threshold=self.compression_threshold
+        )
+
+
+    def decompress_message(self, body: bytes, content_encoding: Optional[str]) -> bytes:
+        """ Restores received payload according to its advertised content
+            encoding
+
+        Args:
+            body (bytes): Received payload
+            content_encoding (str): Content encoding of payload, if any
+        Returns:
+            Raw payload (bytes)
+        """
+        return decompress(body, encoding=content_encoding)
+
     ##################
     # Core Functions #
     ##################
@@ -124,40 +433,120 @@ class BaseOperator(AbstractOperator):
         
         Args:
             heartbeat (int): Heartbeat interval (in secs)
+            blocked_connection_timeout (float): Max time (in secs) a connection
+                may remain blocked by the broker (e.g. on a memory alarm) 
+                before it is torn down. If None, blocked connections wait
+                indefinitely.
         """
-        if not self.is_connected(): 
+        if not self.is_connected() and self.pool:
+            self.connection = self.pool.acquire(
+                host=self.host,
+                port=self.port,
+                virtual_host=self.virtual_host,
+                heartbeat=heartbeat,
+                blocked_connection_timeout=blocked_connection_timeout
+            )
+            self.channel = RecordingChannel(self.connection.channel(), self.topology)
+            self.declare_topology()
+            self.channel.confirm_delivery()
+
+        elif not self.is_connected(): 
             parameters = pika.ConnectionParameters(
                 host=self.host, 
                 port=self.port,
+                virtual_host=self.virtual_host,
 
                 ###########################
                 # Implementation Footnote #
                 ###########################
 
                 # [Cause]
-                # 
+                # RabbitMQ blocks publishing connections whenever a resource
+                # alarm (e.g. memory or disk) is raised.
 
                 # [Problems]
-                
+                # Publishes on a blocked connection never complete, so 
+                # producers hang indefinitely until the alarm clears.
                 
                 # [Solution]
+                # Tear blocked connections down after a timeout, & let 
+                # producers watch Connection.Blocked to throttle themselves 
+                # before reaching it.
                 # Reference: https://github.com/php-amqplib/RabbitMqBundle/issues/301
                 
                 heartbeat=heartbeat,
-                
-                # blocked_connection_timeout=0#blocked_connection_timeout
+                blocked_connection_timeout=blocked_connection_timeout
             )
             self.connection = pika.BlockingConnection(parameters)
 
-            self.channel = self.connection.channel()
-            self.channel.exchange_declare(
-                exchange=self.exchange_name,
-                exchange_type=self.exchange_type,
-                durable=self.durability
-            )
+            self.channel = RecordingChannel(self.connection.channel(), self.topology)
+            self.declare_topology()
             self.channel.confirm_delivery()
 
 
+    def reconnect(self):
+        """ Reopens a dropped connection with jittered exponential backoff,
+            replaying the recorded topology (i.e. exchanges, queues, bindings,
+            QoS & consumers) onto the new channel
+        """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # Broker restarts & network partitions drop every open connection.
+
+        # [Problems]
+        # Operators kept their dead connections & channels, so every later
+        # operation failed until they were manually reconnected, & consumers
+        # stopped consuming altogether.
+
+        # [Solution]
+        # Record the topology declared over each channel, & on failure
+        # reconnect after a jittered backoff (so that operators do not all
+        # reconnect at once), replaying the record onto the new channel.
+
+        # Restarted brokers may have lost entities verified before
+        clear_verified((self.host, self.port))
+
+        # QoS adjusted since connecting (e.g. by adaptive prefetching) must
+        # not be reset to the defaults applied by `.connect()`
+        recorded_qos = self.topology.qos
+
+        started_at = time.monotonic()
+        for attempt in range(1, self.reconnect_attempts + 1):
+            self.disconnect()
+            time.sleep(
+                calculate_backoff(
+                    attempt, 
+                    self.reconnect_delay, 
+                    self.reconnect_max_delay
+                )
+            )
+            try:
+                self.connect()
+                if recorded_qos:
+                    self.topology.qos = recorded_qos
+                self.topology.replay(self.channel.channel)
+                logging.info(
+                    f"Reconnected to {self.host}:{self.port} after {attempt} "
+                    f"attempt(s) in {time.monotonic() - started_at:.1f}s"
+                )
+                return
+
+            except (pika.exceptions.AMQPError, OSError) as e:
+                logging.warning(
+                    f"Reconnection attempt {attempt}/{self.reconnect_attempts} "
+                    f"to {self.host}:{self.port} failed. Error: {e!r}"
+                )
+
+        self.disconnect()
+        raise pika.exceptions.AMQPConnectionError(
+            f"Failed to reconnect to {self.host}:{self.port} after "
+            f"{self.reconnect_attempts} attempts!"
+        )
+
+
     def process(self):
         """ Sends an operation payload to a remote queue for linearising jobs 
             for a Synergos cluster
@@ -176,12 +565,16 @@ class BaseOperator(AbstractOperator):
         """ Closes current channel & termiates connection with RabbitMQ 
             exchange where queues exist 
         """ 
-        if self.is_connected():
-
+        # Dropped connections are also cleared, so that they can be reopened
+        if self.channel and self.channel.is_open:
             self.channel.close()
-            self.channel = None
+        self.channel = None
 
-            self.connection.close()
+        if self.connection:
+            if self.pool:
+                self.pool.release(self.connection)
+            elif self.connection.is_open:
+                self.connection.close()
             self.connection = None
 
 
@@ -207,35 +600,634 @@ class ProducerOperator(BaseOperator):
         durability (bool): Toggles if persistent messages are to be re-declared 
             when broker restarts after it had been taken down
         routing_key (str): Message attribute of header
+        batch_channel (pika.channel.Channel): Dedicated channel used for 
+            windowed publishing of message batches
+        delay_resolution (float): Granularity (in secs) of delayed jobs. Each
+            distinct multiple corresponds to one staging queue on the broker.
+        rate_limiter (RateLimiter): Token bucket rate limits to publish under,
+            per routing key. Can be shared across producers. Default: None
+        max_queue_depth (int): Max no. of messages allowed in `queue` before 
+            publishing halts. Publishing slows down gradually (under a rate 
+            limiter) from half this depth onwards. Default: None
+        depth_check_interval (float): Min time (in secs) between queue depth
+            checks
+        outbox (Outbox): Durable local outbox to stage messages in. If set,
+            publishing returns once messages are appended to disk, & an 
+            `OutboxFlusher` (with a separate producer) publishes them to the
+            broker, even across outages. Default: None
     """
     def __init__(self, host: str, port: int):
         super().__init__(host=host, port=port)
+
+        # Network attributes
+        self.batch_channel = None
+        self.delay_resolution = DELAY_RESOLUTION
+        self._delay_queues = {}         # staging queue -> last declared
+        self.outbox = None
+
+        # Optimisation attributes
+        self._batch_delivery_tag = 0    # last tag issued on batch channel
+        self._batch_pending = {}        # delivery tag -> index in results
+        self._batch_published_at = {}   # delivery tag -> time of publish
+        self._batch_results = []        # confirmation statuses of batch
+
+        self.rate_limiter = None
+        self.max_queue_depth = None
+        self.depth_check_interval = DEPTH_CHECK_INTERVAL
+        self._flow_state = None         # flow control state of connection
+        self._queue_depth = 0           # last known depth of queue
+        self._depth_checked_at = None   # time of last queue depth check
+        self._throttled_since = None    # time at which throttling began
     
 
+    ############
+    # Checkers #
+    ############
+
+    def is_throttled(self) -> bool:
+        """ Checks if publishing is currently being held back, either by the
+            broker (i.e. a blocked connection) or by the producer itself (i.e.
+            rate limits & queue depth)
+
+        Returns:
+            True    if throttled
+            False   otherwise
+        """
+        is_blocked = self._flow_state is not None and self._flow_state.is_blocked
+        return is_blocked or self._throttled_since is not None
+
+
+    def get_throttled_duration(self) -> float:
+        """ Retrieves the length of the current spell of throttling
+
+        Returns:
+            Time (in secs) since throttling began, or 0 if not throttled (float)
+        """
+        throttled_since = [
+            timestamp 
+            for timestamp in (
+                self._throttled_since,
+                self._flow_state and self._flow_state.blocked_since
+            )
+            if timestamp is not None
+        ]
+        return time.monotonic() - min(throttled_since) if throttled_since else 0.0
+
+
     ###########    
     # Helpers #
     ###########
 
-    def publish_message(self, message: str):
+    def __on_batch_confirmation(self, frame: pika.frame.Method):
+        """ Records broker confirmations (Basic.Ack/Basic.Nack) received for
+            deliveries published over the batch channel
+
+        Args:
+            frame (pika.frame.Method): Confirmation frame sent by broker
+        """
+        is_acked = isinstance(frame.method, pika.spec.Basic.Ack)
+        delivery_tag = frame.method.delivery_tag
+
+        if frame.method.multiple:
+            confirmed_tags = [
+                tag for tag in self._batch_pending 
+                if tag <= delivery_tag
+            ]
+        else:
+            confirmed_tags = [delivery_tag]
+
+        for tag in confirmed_tags:
+            index = self._batch_pending.pop(tag, None)
+            if index is not None:
+                self._batch_results[index] = is_acked
+
+            published_at = self._batch_published_at.pop(tag, None)
+            if published_at is not None:
+                self.record_latency('confirm', published_at)
+                self.record_event(
+                    'published', 
+                    outcome='confirmed' if is_acked else 'nacked'
+                )
+
+
+    def __open_batch_channel(self):
+        """ Opens a dedicated channel in confirm mode for windowed publishing.
+            Confirmations on this channel are collected asynchronously, unlike
+            the main channel where every `basic_publish` blocks on its own 
+            confirmation.
+        """
+        if self.batch_channel and self.batch_channel.is_open:
+            return
+
+        self.batch_channel = self.connection.channel()
+        self._batch_delivery_tag = 0
+        self._batch_pending.clear()
+        self._batch_published_at.clear()
+
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # `BlockingChannel.confirm_delivery()` only supports waiting on a 
+        # single outstanding confirmation at a time.
+
+        # [Problems]
+        # Publishing through `BlockingChannel.basic_publish()` costs one 
+        # broker round trip per message.
+
+        # [Solution]
+        # Enable confirm mode on the underlying channel implementation, and
+        # relay every Basic.Ack/Basic.Nack into the blocking connection as a
+        # 0-delay timer, so that `process_data_events()` returns as soon as a 
+        # confirmation arrives.
+
+        select_ok = []
+        self.batch_channel._impl.confirm_delivery(
+            ack_nack_callback=lambda frame: self.connection.call_later(
+                0, functools.partial(self.__on_batch_confirmation, frame)
+            ),
+            callback=lambda frame: self.connection.call_later(
+                0, functools.partial(select_ok.append, frame)
+            )
+        )
+        while not select_ok:
+            self.connection.process_data_events(time_limit=None)
+
+
+    def __wait(self, duration: float):
+        """ Waits for a duration while continuing to service broker events 
+            (e.g. confirmations & flow control notifications)
+
+        Args:
+            duration (float): Time (in secs) to wait for
+        """
+        deadline = time.monotonic() + duration
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.connection.process_data_events(time_limit=remaining)
+
+
+    def __calculate_backlog_factor(self) -> float:
+        """ Calculates the fraction of the nominal publish rate warranted by
+            the backlog in `queue`, checking its depth at most once per 
+            `depth_check_interval`
+
+        Returns:
+            Backlog factor between 0 & 1 (float)
+        """
+        if self.max_queue_depth is None or self.queue is None:
+            return 1.0
+
+        is_stale = (
+            self._depth_checked_at is None or
+            time.monotonic() - self._depth_checked_at >= self.depth_check_interval
+        )
+        if is_stale:
+            self._queue_depth = self.check_message_count()
+            self._depth_checked_at = time.monotonic()
+
+        return calculate_backlog_factor(self._queue_depth, self.max_queue_depth)
+
+
+    def __throttle(self):
+        """ Holds back the next publish for as long as the broker blocks the
+            connection, `queue` is full, or rate limits are exceeded
+        """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # Under a resource alarm, RabbitMQ stops reading from publishing 
+        # connections altogether.
+
+        # [Problems]
+        # Producers only find out once a publish hangs (& are eventually
+        # torn down by `blocked_connection_timeout`).
+
+        # [Solution]
+        # Check flow control state, queue depth & token buckets before every
+        # publish, waiting on the connection (so that Connection.Unblocked & 
+        # confirmations are still serviced) until publishing may proceed.
+
+        is_held_back = False
+
+        while self._flow_state is not None and self._flow_state.is_blocked:
+            is_held_back = True
+            self.__wait(self.depth_check_interval)
+
+        backlog_factor = self.__calculate_backlog_factor()
+        while backlog_factor == 0:
+            is_held_back = True
+            if self._throttled_since is None:
+                self._throttled_since = time.monotonic()
+                logging.info(f"Queue {self.queue} is full. Throttling...")
+            self.__wait(self.depth_check_interval)
+            backlog_factor = self.__calculate_backlog_factor()
+
+        if self.rate_limiter:
+            wait = self.rate_limiter.reserve(
+                self.routing_key, 
+                rate_factor=backlog_factor
+            )
+            if wait > 0:
+                is_held_back = True
+                if self._throttled_since is None:
+                    self._throttled_since = time.monotonic()
+                self.__wait(wait)
+
+        if not is_held_back:
+            self._throttled_since = None
+
+
+    def __stage_in_outbox(
+        self,
+        message: Union[str, bytes],
+        headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None,
+        delay: Optional[float] = None,
+        message_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None
+    ):
+        """ Appends a message to the outbox, to be published by its flusher.
+            Delays are converted into release times, so that time spent in 
+            the outbox (e.g. during a broker outage) counts towards them.
+            Messages are staged compressed & labelled with this operator's
+            codec, so that flushers publish them exactly as they would have
+            been published by this operator.
+
+        Args:
+            message (str/bytes): Message to be published
+            headers (dict): Headers to be attached to message, if any
+            priority (int): Delivery priority of message, if any
+            delay (float): Time (in secs) to hold message back for, if any
+            message_id (str): Message ID of message, if any
+            content_type (str): Content type of message, if already encoded.
+                If None, message is encoded with this operator's settings.
+            content_encoding (str): Content encoding of message, if already
+                compressed
+        """
+        if content_type is None:
+            message, content_encoding = self.compress_message(message)
+            content_type = get_codec(self.codec).content_type
+
+        release_at = time.time() + delay if delay and delay > 0 else None
+        self.outbox.append(
+            message, 
+            headers=headers, 
+            priority=priority, 
+            release_at=release_at,
+            message_id=message_id,
+            content_type=content_type,
+            content_encoding=content_encoding
+        )
+
+
+    def __declare_delay_queue(self, delay: float) -> str:
+        """ Declares the staging queue holding jobs of a specific delay, 
+            until they are dead-lettered into this operator's exchange
+
+        Args:
+            delay (float): Delay (in secs) of job
+        Returns:
+            Name of staging queue (str)
+        """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # RabbitMQ only expires messages at the head of a queue.
+
+        # [Problems]
+        # Mixing jobs of different delays in a single queue (i.e. via per
+        # message TTLs) holds short delays hostage to longer ones ahead.
+
+        # [Solution]
+        # Round delays up into buckets, & give each bucket its own staging
+        # queue with a queue-wide TTL, so that jobs always expire in order.
+        # Idle staging queues delete themselves via `x-expires`, which is 
+        # pushed back whenever the queue is redeclared. Staging queues are
+        # declared over the raw channel, so that they are never recorded &
+        # resurrected by topology replays once expired; they are redeclared 
+        # on first use over every new channel instead.
+
+        buckets = max(1, math.ceil(delay / self.delay_resolution))
+        ttl = int(round(buckets * self.delay_resolution * 1000))  # in ms
+        queue = f"{self.routing_key}.delayed.{ttl}"
+
+        declared_at = self._delay_queues.get(queue)
+        if declared_at is None or time.monotonic() - declared_at > DELAY_QUEUE_REFRESH:
+            self.channel.channel.queue_declare(
+                queue,
+                durable=self.durability,
+                arguments={
+                    'x-message-ttl': ttl,
+                    'x-expires': ttl + DELAY_QUEUE_EXPIRY * 1000,
+                    'x-dead-letter-exchange': self.exchange_name,
+                    'x-dead-letter-routing-key': self.routing_key
+                }
+            )
+            self._delay_queues[queue] = time.monotonic()
+
+        return queue
+
+
+    def __resolve_route(self, delay: Optional[float] = None) -> Tuple[str, str]:
+        """ Resolves the exchange & routing key a delivery is published to.
+            Delayed deliveries are routed to their staging queues via the 
+            default exchange.
+
+        Args:
+            delay (float): Delay (in secs) of delivery, if any
+        Returns:
+            Exchange (str)
+            Routing key (str)
+        """
+        if delay is None or delay <= 0:
+            return self.exchange_name, self.routing_key
+        return '', self.__declare_delay_queue(delay)
+
+
+    def __prepare_delivery(
+        self, 
+        message: Union[str, bytes],
+        headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None,
+        message_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None
+    ) -> Tuple[Union[str, bytes], pika.BasicProperties]:
+        """ Converts a message into a payload & its accompanying properties,
+            ready for publishing. Messages given with a content type are 
+            taken as already encoded (e.g. by the producer that staged them
+            in an outbox), & are published as is.
+
+        Args:
+            message (str/bytes): Message to be published
+            headers (dict): Headers to be attached to message, if any
+            priority (int): Delivery priority of message, if any
+            message_id (str): Message ID of message, if any
+            content_type (str): Content type of message, if already encoded
+            content_encoding (str): Content encoding of message, if already
+                compressed
+        Returns:
+            Payload (str/bytes)
+            Message properties (pika.BasicProperties)
+        """
+        if content_type is None:
+            body, content_encoding = self.compress_message(message)
+            content_type = get_codec(self.codec).content_type
+        else:
+            body = message
+
+        # Publish times let consumers measure how long jobs waited in queue
+        if self.metrics:
+            headers = {**(headers or {}), PUBLISHED_AT_HEADER: time.time()}
+
+        properties = pika.BasicProperties(
+            delivery_mode=2,    # persist msgs
+            content_type=content_type,
+            content_encoding=content_encoding,
+            headers=headers or None,
+            priority=priority,
+            message_id=message_id
+        )
+        return body, properties
+
+
+    def publish_message(
+        self, 
+        message: Union[str, bytes], 
+        headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None,
+        delay: Optional[float] = None,
+        message_id: Optional[str] = None
+    ):
         """ Publish single message specified queue in exchange
         
         Args:
-            message (str): Message to be published
+            message (str/bytes): Message to be published
+            headers (dict): Headers to be attached to message, if any
+            priority (int): Delivery priority of message, if any
+            delay (float): Time (in secs) to hold message back for before it 
+                is routed to its queue, if any
+            message_id (str): Message ID of message, if any
         """
-        if not self.is_connected():
+        if not (self.is_connected() or self.outbox or self.is_recoverable()):
             raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
 
+        # Jobs published while processing another job join its trace
+        span = None
+        if self.tracer:
+            span = self.tracer.start_span(
+                f"publish {self.queue or self.routing_key}",
+                queue=self.queue or self.routing_key,
+                message_id=message_id
+            )
+            headers = span.inject(headers)
+
+        # Spans of failed publishes are finished here, whatever the error
         try:
-            self.channel.basic_publish(
-                exchange=self.exchange_name,
-                routing_key=self.routing_key,
-                body=message,
-                properties=pika.BasicProperties(delivery_mode=2) # persist msgs
+            if self.outbox:
+                self.__stage_in_outbox(message, headers, priority, delay, message_id)
+                if span:
+                    self.tracer.finish(span, outcome='staged')
+                logging.info('Message was staged in outbox')
+                return
+
+            if self.is_recoverable():
+                self.reconnect()
+
+            self.__throttle()
+            body, properties = self.__prepare_delivery(
+                message, 
+                headers, 
+                priority, 
+                message_id
             )
-            logging.info('Message publish was confirmed')
 
-        except pika.exceptions.UnroutableError:
-            logging.info('Message could not be confirmed')
+            # Publishes interrupted by a dropped connection are retried once, 
+            # after reconnecting. Consumers drop resulting duplicates by their
+            # message IDs.
+            for is_retry in (False, True):
+                try:
+                    exchange, routing_key = self.__resolve_route(delay)
+
+                    # Blocking publishes only return once confirmed
+                    published_at = time.perf_counter()
+                    self.channel.basic_publish(
+                        exchange=exchange,
+                        routing_key=routing_key,
+                        body=body,
+                        properties=properties
+                    )
+                    self.record_latency('confirm', published_at)
+                    self.record_event('published', outcome='confirmed')
+                    if span:
+                        self.tracer.finish(span, outcome='confirmed')
+                    logging.info('Message publish was confirmed')
+                    return
+
+                except pika.exceptions.UnroutableError:
+                    self.record_event('published', outcome='unroutable')
+                    if span:
+                        self.tracer.finish(span, outcome='unroutable')
+                    logging.info('Message could not be confirmed')
+                    return
+
+                except pika.exceptions.NackError:
+                    self.record_event('published', outcome='nacked')
+                    raise
+
+                except RECOVERABLE_ERRORS as e:
+                    if is_retry or not self.auto_reconnect:
+                        raise
+                    logging.warning(f"Connection lost while publishing. Error: {e!r}")
+                    self.reconnect()
+
+        except Exception as e:
+            if span:
+                self.tracer.finish(
+                    span, 
+                    outcome=(
+                        'nacked' if isinstance(e, pika.exceptions.NackError) 
+                        else 'failed'
+                    ),
+                    error=repr(e)
+                )
+            raise
+
+
+    def publish_batch(
+        self, 
+        messages: Iterable[Union[str, bytes, Tuple[Union[str, bytes], dict]]], 
+        window: int = 256,
+        timeout: float = 30
+    ) -> List[bool]:
+        """ Publish multiple messages to specified queue in exchange, keeping
+            a bounded window of unconfirmed deliveries in flight. In contrast 
+            with `.publish_message(...)`, which waits for a confirmation after
+            every message, bulk submissions here are bound by network 
+            throughput instead of broker round trips.
+
+        Args:
+            messages (Iterable): Messages to be published. Each message may
+                also be given as a tuple of (message, kwargs), where kwargs are
+                passed on to delivery preparation (i.e. `headers`, 
+                `priority`, `delay`, `message_id`, & `content_type` with
+                `content_encoding` for messages that are already encoded)
+            window (int): Max no. of unconfirmed deliveries in flight
+            timeout (float): Max time (in secs) to wait on outstanding
+                confirmations before they are declared as unconfirmed. 
+                Messages not yet published when the timeout elapses are not
+                sent at all, & are also declared as unconfirmed.
+        Returns:
+            Confirmation statuses, 1 for every message given & in the same
+            order (list(bool))
+        """
+        if not (self.is_connected() or self.outbox or self.is_recoverable()):
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        if window < 1:
+            raise ValueError(f"Window must be a positive integer! Got {window}")
+
+        if self.outbox:
+            results = []
+            for message in messages:
+                message, delivery_kwargs = (
+                    message if isinstance(message, tuple) else (message, {})
+                )
+                self.__stage_in_outbox(message, **delivery_kwargs)
+                results.append(True)
+
+            logging.info(f"Batch publish staged {len(results)} messages in outbox")
+            return results
+
+        if self.is_recoverable():
+            self.reconnect()
+
+        self.__open_batch_channel()
+        self._batch_results = []
+
+        def await_confirmations(threshold: int):
+            """ Processes broker events until no more than `threshold`
+                deliveries remain unconfirmed, or the timeout elapses
+            """
+            deadline = time.monotonic() + timeout
+            while len(self._batch_pending) > threshold:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.connection.process_data_events(time_limit=remaining)
+            return True
+
+        is_timed_out = False
+        for message in messages:
+            # Unsent messages are still reported, so that results line up
+            # with the messages given
+            if is_timed_out or not await_confirmations(threshold=window-1):
+                if not is_timed_out:
+                    logging.info('Batch publish timed out waiting on confirmations')
+                    is_timed_out = True
+                self._batch_results.append(False)
+                continue
+
+            message, delivery_kwargs = (
+                message if isinstance(message, tuple) else (message, {})
+            )
+            self.__throttle()
+            delivery_kwargs = dict(delivery_kwargs)
+            exchange, routing_key = self.__resolve_route(
+                delivery_kwargs.pop('delay', None)
+            )
+
+            # Batched deliveries are traced up to their hand-off
+            span = None
+            if self.tracer:
+                span = self.tracer.start_span(
+                    f"publish {self.queue or self.routing_key}",
+                    queue=self.queue or self.routing_key,
+                    message_id=delivery_kwargs.get('message_id')
+                )
+                delivery_kwargs['headers'] = span.inject(
+                    delivery_kwargs.get('headers')
+                )
+
+            body, properties = self.__prepare_delivery(message, **delivery_kwargs)
+
+            published_at = time.perf_counter()
+            self.batch_channel._impl.basic_publish(
+                exchange=exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=properties
+            )
+            self._batch_delivery_tag += 1
+            self._batch_pending[self._batch_delivery_tag] = len(self._batch_results)
+            self._batch_results.append(None)
+            if self.metrics:
+                self.record_latency('publish', published_at)
+                self._batch_published_at[self._batch_delivery_tag] = published_at
+            if span:
+                self.tracer.finish(span, outcome='published')
+
+        await_confirmations(threshold=0)
+
+        # Deliveries still outstanding after timeout are deemed unconfirmed
+        self._batch_pending.clear()
+        self._batch_published_at.clear()
+        results = [bool(status) for status in self._batch_results]
+        self._batch_results = []
+
+        logging.info(
+            f"Batch publish confirmed {sum(results)}/{len(results)} messages"
+        )
+        return results
 
     ##################
     # Core Functions #
@@ -250,15 +1242,145 @@ class ProducerOperator(BaseOperator):
         Returns:
             Job message (dict)
         """
-        if not self.is_connected():
+        return self.process_with(kwargs)
+
+
+    def process_with(
+        self, 
+        kwargs: Dict[str, Any],
+        priority: Optional[int] = None, 
+        delay: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """ Publishes a single job with delivery options. Job configurations
+            are given as a dictionary, so that none of their fields are ever
+            mistaken for options (e.g. a job's own `priority`).
+
+        Args:
+            kwargs (dict): Any configurations of a single job
+            priority (int): Delivery priority of job. If None, priority is 
+                assigned by the operator's priority policy, if any.
+            delay (float): Time (in secs) to hold job back for before it is 
+                released into its queue. Delays are held on the broker, & are
+                rounded up to a multiple of `delay_resolution`. Default: None
+        Returns:
+            Job message (dict)
+        """
+        if not (self.is_connected() or self.outbox or self.is_recoverable()):
             raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
 
+        serialize_started_at = time.perf_counter()
         message = self.create_message(kwargs)
-        self.publish_message(message)
+        self.record_latency('serialize', serialize_started_at)
+
+        self.publish_message(
+            message, 
+            headers=self.create_headers(kwargs),
+            priority=self.create_priority(kwargs, priority),
+            delay=delay,
+            message_id=self.create_message_id(kwargs)
+        )
 
         return message
 
 
+    def process_at(
+        self, 
+        timestamp: float, 
+        kwargs: Dict[str, Any],
+        priority: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """ Schedules a job to be released into its queue at a specific time.
+            Jobs scheduled in the past are released immediately.
+
+        Args:
+            timestamp (float): Unix timestamp (in secs) to release job at
+            kwargs (dict): Any configurations of a single job
+            priority (int): Delivery priority of job, if any
+        Returns:
+            Job message (dict)
+        """
+        return self.process_with(
+            kwargs,
+            priority=priority, 
+            delay=timestamp - time.time()
+        )
+
+
+    def process_many(
+        self, 
+        iterable_of_kwargs: Iterable[Dict[str, Any]],
+        window: int = 256,
+        timeout: float = 30,
+        priority: Optional[int] = None,
+        delay: Optional[float] = None
+    ) -> List[bool]:
+        """ Publishes one message for every set of job configurations given.
+            Messages are created lazily & published via `.publish_batch(...)`,
+            so that confirmations are awaited in bulk.
+
+        Args:
+            iterable_of_kwargs (Iterable[dict]): Configurations of all jobs
+            window (int): Max no. of unconfirmed deliveries in flight
+            timeout (float): Max time (in secs) to wait on outstanding
+                confirmations before they are declared as unconfirmed
+            priority (int): Delivery priority of all jobs. If None, priorities
+                are assigned by the operator's priority policy, if any.
+            delay (float): Time (in secs) to hold all jobs back for, if any
+        Returns:
+            Confirmation statuses, in order of submission (list(bool))
+        """
+        if not (self.is_connected() or self.outbox or self.is_recoverable()):
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        def create_messages():
+            """ Creates messages lazily, as the publish window advances """
+            for kwargs in iterable_of_kwargs:
+                serialize_started_at = time.perf_counter()
+                message = self.create_message(kwargs)
+                self.record_latency('serialize', serialize_started_at)
+
+                yield message, {
+                    'headers': self.create_headers(kwargs),
+                    'priority': self.create_priority(kwargs, priority),
+                    'delay': delay,
+                    'message_id': self.create_message_id(kwargs)
+                }
+
+        return self.publish_batch(create_messages(), window=window, timeout=timeout)
+
+
+    def connect(self, heartbeat: int = 0, blocked_connection_timeout=300):
+        """ Initiate connection with RabbitMQ exchange, while subscribing to
+            flow control notifications from the broker
+
+        Args:
+            heartbeat (int): Heartbeat interval (in secs)
+            blocked_connection_timeout (float): Max time (in secs) a connection
+                may remain blocked by the broker before it is torn down
+        """
+        super().connect(
+            heartbeat=heartbeat, 
+            blocked_connection_timeout=blocked_connection_timeout
+        )
+        self._flow_state = watch_connection(self.connection)
+
+        # Staging queues are not replayed, & may be gone on a new connection
+        self._delay_queues.clear()
+
+
+    def disconnect(self):
+        """ Closes current channel(s) & termiates connection with RabbitMQ 
+            exchange where queues exist 
+        """
+        if self.batch_channel and self.batch_channel.is_open:
+            self.batch_channel.close()
+        self.batch_channel = None
+
+        super().disconnect()
+        self._flow_state = None
+        self._throttled_since = None
+
+
 
 ##########################################
 # Base Operator Class - ConsumerOperator #
@@ -287,6 +1409,18 @@ class ConsumerOperator(BaseOperator):
             crashes. If False, RMQ server will only receive message ack after
             process is completed & any intermittent failures will result in 
             lost messages being restored after restart
+        prefetch_count (int): Max no. of unacknowledged messages delivered to
+            consumer at once. Default: 1
+        dedup_cache (DeduplicationCache): Index of jobs already in flight or
+            completed. If set, redelivered & resubmitted jobs bearing a known
+            message ID are acknowledged & dropped. Default: None
+        prefetch_controller (AdaptivePrefetch): Controller adjusting the
+            prefetch count to observed processing times while listening. If
+            None, the prefetch count is fixed. Default: None
+        retry_policy (RetryPolicy): Policy scheduling the retries of failed
+            jobs with exponential backoff, & quarantining jobs that exhaust
+            their attempts. If None, failed jobs are requeued immediately.
+            Default: None
     """
     def __init__(self, host: str, port: int):
         super().__init__(host=host, port=port)
@@ -295,15 +1429,19 @@ class ConsumerOperator(BaseOperator):
 
 
         # Network attributes
-        self.queue = None
         self.auto_ack = False
+        self.prefetch_count = 1
+        self.retry_policy = None
+        self._retry_queues = set()
 
         # Data attributes
         # e.g participant_id/run_id in specific format
+        self.dedup_cache = None
 
 
         # Optimisation attributes
         # e.g multiprocess/asyncio if necessary for optimisation
+        self.prefetch_controller = None
 
 
         # Export Attributes 
@@ -316,15 +1454,259 @@ class ConsumerOperator(BaseOperator):
 
     def __bind_consumer(self):
         """ Bind consumer to queue """
-        self.channel.queue_bind(
-            exchange=self.exchange_name,
-            queue=self.queue,
-            routing_key=self.routing_key
-        )
+        self.declare_topology()
+        self.__declare_retry_queues()
     
 
-    def generate_callback(self, process_function: Callable):
-        
+    def __declare_retry_queues(self):
+        """ Declares the retry & quarantine queues of the queue consumed
+            from, if a retry policy is set. Failed jobs are republished from
+            worker threads, which cannot declare queues themselves, so these
+            are declared before any job is consumed.
+        """
+        if not self.retry_policy:
+            return
+
+        retry_queues = self.retry_policy.get_retry_queues(self.queue)
+        retry_queues[self.retry_policy.get_quarantine_queue(self.queue)] = None
+        for retry_queue, arguments in retry_queues.items():
+            if retry_queue not in self._retry_queues:
+                self.channel.queue_declare(
+                    retry_queue,
+                    durable=self.durability,
+                    arguments=arguments
+                )
+                self._retry_queues.add(retry_queue)
+
+
+    def __retry_later(
+        self,
+        ch,
+        method: pika.spec.Basic.Deliver,
+        properties: pika.spec.BasicProperties,
+        body: bytes,
+        error: Exception
+    ):
+        """ Settles a failed delivery according to the retry policy, by
+            republishing it into the retry queue of its backoff level (or into
+            quarantine once its attempts are exhausted), before acknowledging
+            the original delivery
+        """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # Rejected deliveries are requeued at the head of their queue.
+
+        # [Problems]
+        # Jobs that can never succeed (i.e. poison jobs) are redelivered
+        # immediately & indefinitely, spinning consumers at full CPU while
+        # blocking healthy jobs behind them.
+
+        # [Solution]
+        # Count attempts in headers, & park failed jobs in TTL queues that
+        # dead-letter them back once their backoff elapses. Jobs exhausting
+        # their attempts are set aside in quarantine for inspection.
+
+        headers = self.retry_policy.create_headers(properties.headers or {}, error)
+        attempt = headers[ATTEMPT_HEADER]
+
+        if self.retry_policy.is_exhausted(attempt):
+            routing_key = self.retry_policy.get_quarantine_queue(self.queue)
+            logging.warning(
+                f"[x] {method.routing_key} - Quarantined after {attempt} attempts"
+            )
+        else:
+            routing_key = self.retry_policy.get_retry_queue(self.queue, attempt)
+            logging.info(
+                f"[x] {method.routing_key} - Retrying in "
+                f"{self.retry_policy.get_delay(attempt)}s (attempt {attempt})"
+            )
+
+        ch.basic_publish(
+            exchange='',    # default exchange routes to queues by name
+            routing_key=routing_key,
+            body=body,
+            properties=pika.BasicProperties(
+                delivery_mode=2,
+                content_type=properties.content_type,
+                content_encoding=properties.content_encoding,
+                headers=headers,
+                priority=properties.priority,
+                message_id=properties.message_id
+            )
+        )
+        ch.basic_ack(delivery_tag=method.delivery_tag)
+
+
+    def __settle_failure(
+        self,
+        ch,
+        method: pika.spec.Basic.Deliver,
+        properties: pika.spec.BasicProperties,
+        body: bytes,
+        error: Exception
+    ):
+        """ Settles a delivery whose job failed, either by scheduling it for
+            a retry, or by requeuing it immediately
+        """
+        if self.retry_policy:
+            self.__retry_later(ch, method, properties, body, error)
+        else:
+            ch.basic_reject(delivery_tag=method.delivery_tag)
+        logging.error(f"[x] {method.routing_key} - Process rejected. Error: {error}")
+
+
+    def __dispatch_to(
+        self,
+        executor: ThreadPoolExecutor,
+        message_callback: Callable
+    ) -> Callable:
+        """ Wraps a message callback so that deliveries are processed by a
+            pool of workers, rather than by the thread servicing the connection
+        """
+        def dispatch_callback(ch, method, properties, body):
+            # Deliveries are settled over the channel they arrived on, which
+            # changes whenever the connection is reopened
+            executor.submit(
+                self.__process_delivery,
+                message_callback,
+                ThreadsafeChannel(self.connection, ch),
+                method,
+                properties,
+                body
+            )
+
+        return dispatch_callback
+
+
+    def __adapt_prefetch(
+        self,
+        message_callback: Callable,
+        workers: int
+    ) -> Callable:
+        """ Wraps a message callback so that its deliveries are observed by
+            the prefetch controller, & the prefetch count is adjusted as they
+            are processed
+        """
+        controller = self.prefetch_controller
+
+        def adaptive_callback(ch, method, properties, body):
+            controller.record_arrival()
+            prefetch_count = controller.update(workers)
+            if prefetch_count:
+                # Deliveries arrive over the raw channel, so adjustments are
+                # recorded separately, to be replayed after reconnections
+                ch.basic_qos(prefetch_size=0, prefetch_count=prefetch_count)
+                self.topology.qos = {
+                    'prefetch_size': 0, 
+                    'prefetch_count': prefetch_count
+                }
+                logging.info(f"Prefetch count of {self.queue} adjusted to {prefetch_count}")
+
+            start_time = time.monotonic()
+            try:
+                return message_callback(ch, method, properties, body)
+            finally:
+                controller.record_completion(time.monotonic() - start_time)
+
+        return adaptive_callback
+
+
+    def __trace_deliveries(self, message_callback: Callable) -> Callable:
+        """ Wraps a message callback so that every delivery is processed
+            within a span continuing the trace carried by its headers. Jobs
+            published during processing (e.g. completed jobs) join the trace.
+        """
+        tracer = self.tracer
+
+        def traced_callback(ch, method, properties, body):
+            span = tracer.continue_trace(
+                properties.headers,
+                name=f"process {self.queue or self.routing_key}",
+                queue=self.queue or self.routing_key,
+                message_id=properties.message_id,
+                redelivered=getattr(method, 'redelivered', None)
+            )
+            with tracer.activate(span):
+                try:
+                    return message_callback(ch, method, properties, body)
+                except Exception as e:
+                    span.attributes.update(outcome='failed', error=repr(e))
+                    raise
+                finally:
+                    tracer.finish(span)
+
+        return traced_callback
+
+
+    def __process_delivery(
+        self,
+        message_callback: Callable,
+        ch,
+        method: pika.spec.Basic.Deliver,
+        properties: pika.spec.BasicProperties,
+        body: bytes
+    ) -> Any:
+        """ Executes a message callback on a worker thread. Deliveries that
+            cannot be handled at all (e.g. unparsable payloads) must still be
+            settled, since no exception reaches the connection thread.
+        """
+        try:
+            return message_callback(ch, method, properties, body)
+        except Exception as e:
+            self.__settle_failure(ch, method, properties, body, e)
+
+
+    def __run_off_thread(self, function: Callable, *args) -> Any:
+        """ Runs a function on a worker thread, while servicing connection
+            I/O (e.g. heartbeats & acknowledgements scheduled by the worker)
+            on the calling thread until it returns
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(function, *args)
+            future.add_done_callback(
+                lambda _: self.connection.add_callback_threadsafe(lambda: None)
+            )
+            while not future.done():
+                self.connection.process_data_events(time_limit=EVENT_POLL_INTERVAL)
+
+        # Flush operations scheduled by worker
+        self.connection.process_data_events(time_limit=0)
+        return future.result()
+
+
+    def __summarise_body(self, body: Union[bytes, memoryview]) -> str:
+        """ Summarises a received payload for logging, rendering at most
+            `LOG_PREVIEW_SIZE` bytes of it regardless of its actual size
+
+        Args:
+            body (bytes/memoryview): Received payload
+        Returns:
+            Summary (str)
+        """
+        preview = bytes(body[:LOG_PREVIEW_SIZE]).decode(errors='replace')
+        ellipsis = "..." if len(body) > LOG_PREVIEW_SIZE else ""
+        return f"{len(body)} bytes - {preview}{ellipsis}"
+
+
+    def generate_callback(
+        self, 
+        process_function: Callable, 
+        job_filter: Optional[Callable[[JobView], bool]] = None
+    ):
+        """ Generates the callback executed on every delivery
+
+        Args:
+            process_function (Callable): Callback function to be executed with
+                arguments retrieved from queue.
+            job_filter (Callable): Predicate on a lazy `JobView` of each
+                delivery. Jobs failing the filter are acknowledged & skipped
+                without their payloads being parsed. Default: None (no filter)
+        Returns:
+            Message callback (Callable)
+        """
         logging.debug(f"Process function specified for callback: {process_function}")
 
         def message_callback(ch, method, properties, body):
@@ -336,30 +1718,103 @@ class ConsumerOperator(BaseOperator):
                 properties: User-defined properties on the message
                 body: Additional data
             """
-            decoded_msg = body.decode()
-            logging.info(f"[x] {method.routing_key} - Received: {decoded_msg}") 
-
-            kwargs = self.parse_message(decoded_msg)
-
+            ###########################
+            # Implementation Footnote #
+            ###########################
+
+            # [Cause]
+            # Payloads can be several MBs large (e.g. experiment records).
+
+            # [Problems]
+            # Decoding `body` into an intermediate string & logging it in full 
+            # makes multiple copies of every payload per delivery.
+
+            # [Solution]
+            # Hand the received bytes straight to the codec (binary-capable 
+            # codecs parse them in place) & only log a bounded preview. Job 
+            # keys are read off headers, so skipped jobs are never parsed.
+
+            if self.metrics:
+                self.record_event('consumed')
+                published_at = (properties.headers or {}).get(PUBLISHED_AT_HEADER)
+                if published_at is not None:
+                    self.metrics.observe(
+                        'synmq_queue_wait_seconds',
+                        max(0.0, time.time() - published_at),
+                        queue=self.queue or self.routing_key
+                    )
+
+            job = JobView(self, method, properties, body)
+            job_key = job.key if job.has_key_headers() else ""
+
+            if job_filter and not job_filter(job):
+                ch.basic_ack(delivery_tag=method.delivery_tag)
+                self.record_event('skipped')
+                annotate_span(outcome='skipped')
+                logging.info(f"[x] {method.routing_key} - Skipped: {job_key}")
+                return None
+
+            is_tracked = bool(self.dedup_cache and job.message_id)
+            if is_tracked:
+                sighting = self.dedup_cache.check_in(job.message_id)
+                if sighting:
+                    ch.basic_ack(delivery_tag=method.delivery_tag)
+                    self.record_event('duplicates')
+                    annotate_span(outcome='duplicate')
+                    logging.info(
+                        f"[x] {method.routing_key} - Duplicate ({sighting}) "
+                        f"dropped: {job_key}"
+                    )
+                    return None
+
+            logging.info(
+                f"[x] {method.routing_key} - Received: {job_key} "
+                f"{self.__summarise_body(body)}"
+            ) 
+
+            # Unparsable jobs must also release their in-flight records, or
+            # their redeliveries are dropped as duplicates
             try:
+                parse_started_at = time.perf_counter()
+                kwargs = job.payload
+                self.record_latency('parse', parse_started_at)
+
+                process_started_at = time.perf_counter()
                 completed_job = process_function(**kwargs)
+                self.record_latency('process', process_started_at)
                 logging.info(f"[x] {method.routing_key} - Process completed.")
             
                 # Manually acknowledge message to complete consumption
+                ack_started_at = time.perf_counter()
                 ch.basic_ack(delivery_tag=method.delivery_tag) 
+                self.record_latency('ack', ack_started_at)
+                self.record_event('processed', outcome='completed')
+                annotate_span(outcome='completed')
+                if is_tracked:
+                    self.dedup_cache.complete(job.message_id)
                 logging.info(f"[x] {method.routing_key} - Delivered: {completed_job}")
 
                 return completed_job
 
             except Exception as e:
                 # Manually acknowledge message to complete consumption
-                ch.basic_reject(delivery_tag=method.delivery_tag) 
-                logging.error(f"[x] {method.routing_key} - Process rejected. Error: {e}")
+                self.record_event('processed', outcome='failed')
+                annotate_span(outcome='failed', error=repr(e))
+                if is_tracked:
+                    self.dedup_cache.release(job.message_id)
+                self.__settle_failure(ch, method, properties, body, e)
                 
+        if self.tracer:
+            return self.__trace_deliveries(message_callback)
         return message_callback
 
         
-    def listen_message(self, process_function: Callable):
+    def listen_message(
+        self, 
+        process_function: Callable, 
+        job_filter: Optional[Callable[[JobView], bool]] = None,
+        workers: int = 1
+    ):
         """ Commence message consumption from queue on current consumer. This
             opens a long running channel that listens to a specific queue, in
             contrast with `.poll_message(...)` which only consumes a single
@@ -368,25 +1823,103 @@ class ConsumerOperator(BaseOperator):
         Args:
             process_function (Callable): Callback function to be executed with
                 arguments retrieved from queue.
+            job_filter (Callable): Predicate on a lazy `JobView` of each
+                delivery. Jobs failing the filter are acknowledged & skipped.
+            workers (int): No. of jobs to process concurrently. Jobs always
+                run on worker threads, so that the connection keeps servicing
+                heartbeats. If more than 1, the prefetch count is raised to
+                match. Default: 1
         """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # Jobs (e.g. training) can run for hours, while lightweight jobs (e.g.
+        # evaluation) leave a consumer process mostly idle, since only 1 job
+        # is prefetched & processed at a time.
+
+        # [Problems]
+        # Jobs running on the thread servicing the connection stall its I/O,
+        # so heartbeats had to be disabled, & dead consumers held on to their
+        # jobs until their sockets timed out. Yet processing jobs on other
+        # threads is unsafe by default, since pika connections are not
+        # thread-safe & acknowledgements must be sent by the thread servicing
+        # the connection.
+
+        # [Solution]
+        # Keep the connection on the calling thread, where it keeps servicing
+        # heartbeats, & hand workers a channel proxy that schedules their
+        # acks/rejects back onto it. Prefetch just enough deliveries to keep
+        # every worker busy.
+
+        if self.is_recoverable():
+            self.reconnect()
+
         if not self.is_connected():
             raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
 
+        if workers < 1:
+            raise ValueError(f"No. of workers must be at least 1! Got {workers}")
+
         self.__bind_consumer()
 
+        message_callback = self.generate_callback(
+            process_function=process_function,
+            job_filter=job_filter
+        )
+
+        prefetch_count = workers
+        if self.prefetch_controller:
+            prefetch_count = self.prefetch_controller.reset(workers)
+            message_callback = self.__adapt_prefetch(message_callback, workers)
+
+        if prefetch_count > 1:
+            self.channel.basic_qos(prefetch_size=0, prefetch_count=prefetch_count)
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=f"{self.queue}-worker"
+        )
+        message_callback = self.__dispatch_to(executor, message_callback)
+
         self.channel.basic_consume(
             queue=self.queue,
-            on_message_callback=self.generate_callback(
-                process_function=process_function
-            ),
+            on_message_callback=message_callback,
             auto_ack=self.auto_ack
         )
 
-        logging.info(f"Listening from {self.queue} queue: ")
-        self.channel.start_consuming()
-
-
-    def poll_message(self, process_function: Callable):
+        logging.info(f"Listening from {self.queue} queue with {workers} worker(s): ")
+        try:
+            while True:
+                try:
+                    self.channel.start_consuming()
+                    break
+
+                except RECOVERABLE_ERRORS as e:
+                    if not self.auto_reconnect:
+                        raise
+                    # Consumer is resumed when the topology is replayed
+                    logging.warning(f"Connection lost while listening. Error: {e!r}")
+                    self.reconnect()
+
+        finally:
+            # Let in-flight jobs finish & flush their pending acks
+            executor.shutdown(wait=True)
+            if self.is_connected():
+                self.connection.process_data_events(time_limit=0)
+
+            # Stopped consumers are not to be resumed on later reconnections
+            for consumer_tag, subscription in list(self.topology.consumers.items()):
+                if subscription['on_message_callback'] is message_callback:
+                    self.topology.consumers.pop(consumer_tag)
+
+
+    def poll_message(
+        self, 
+        process_function: Callable, 
+        job_filter: Optional[Callable[[JobView], bool]] = None
+    ):
         """ Synchronous call to the broker for an individual message. This only 
             consumes a single message, in contrast with `.listen_message(...)` 
             which opens a long running channel that listens to a specific queue. 
@@ -394,10 +1927,17 @@ class ConsumerOperator(BaseOperator):
         Args:
             process_function (Callable): Callback function to be executed with
                 arguments retrieved from queue.
+            job_filter (Callable): Predicate on a lazy `JobView` of each
+                delivery. Jobs failing the filter are acknowledged & skipped.
         """
+        if self.is_recoverable():
+            self.reconnect()
+
         if not self.is_connected():
             raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
 
+        self.__declare_retry_queues()
+
         method, properties, body = self.channel.basic_get(
             queue=self.queue, 
             auto_ack=self.auto_ack
@@ -405,42 +1945,282 @@ class ConsumerOperator(BaseOperator):
         
         if body:
             message_callback = self.generate_callback(
-                process_function=process_function
+                process_function=process_function,
+                job_filter=job_filter
+            )
+
+            return self.__run_off_thread(
+                message_callback,
+                ThreadsafeChannel(self.connection, self.channel),
+                method,
+                properties,
+                body
             )
-            return message_callback(self.channel, method, properties, body)
 
         else:
             logging.info(f"No message received in {self.queue}")
 
 
-    def check_message_count(self) -> int:
-        """ Check for the no. of remaining messages waiting in queue
-        
+    def poll_messages(
+        self,
+        process_function: Callable,
+        n: int,
+        timeout: float = 1,
+        job_filter: Optional[Callable[[JobView], bool]] = None
+    ) -> List[Any]:
+        """ Synchronous call to the broker for a batch of messages. Up to `n`
+            messages are retrieved, or as many as arrive within the timeout,
+            & are processed in order before being acknowledged together.
+
+        Args:
+            process_function (Callable): Callback function to be executed with
+                arguments retrieved from queue.
+            n (int): Max no. of messages to retrieve
+            timeout (float): Max time (in secs) to wait for messages
+            job_filter (Callable): Predicate on a lazy `JobView` of each
+                delivery. Jobs failing the filter are acknowledged & skipped.
         Returns:
-            Queue message count (int)
+            Results of process function for each message retrieved (list)
         """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # Schedulers drain queues in batches of many small jobs.
+
+        # [Problems]
+        # `.poll_message(...)` costs a `basic_get` round trip, a new callback
+        # & an acknowledgement frame for every single message.
+
+        # [Solution]
+        # Stream the batch through a single consumer (prefetching the whole
+        # batch), process it with a single callback, & settle all successful
+        # jobs with 1 cumulative acknowledgement. Messages delivered beyond
+        # the batch are returned to the queue when the consumer is cancelled.
+
+        if self.is_recoverable():
+            self.reconnect()
+
         if not self.is_connected():
             raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
 
-        declared_queue = self.channel.queue_declare(
-            self.queue, 
-            passive=True, 
-            durable=self.durability
+        # A prefetch count of 0 would lift the prefetch limit altogether
+        if n < 1:
+            raise ValueError(f"No. of messages must be at least 1! Got {n}")
+
+        self.__declare_retry_queues()
+
+        # QoS in force (e.g. set by `listen_message(...)`) is restored after
+        previous_qos = self.topology.qos or {
+            'prefetch_size': 0, 
+            'prefetch_count': self.prefetch_count
+        }
+
+        deliveries = []
+        deadline = time.monotonic() + timeout
+        self.channel.basic_qos(prefetch_size=0, prefetch_count=n)
+        try:
+            for method, properties, body in self.channel.consume(
+                queue=self.queue,
+                auto_ack=self.auto_ack,
+                inactivity_timeout=min(timeout, EVENT_POLL_INTERVAL)
+            ):
+                if method:
+                    deliveries.append((method, properties, body))
+                if len(deliveries) >= n or time.monotonic() >= deadline:
+                    break
+        finally:
+            self.channel.cancel()
+            self.channel.basic_qos(**previous_qos)
+
+        if not deliveries:
+            logging.info(f"No message received in {self.queue}")
+            return []
+
+        message_callback = self.generate_callback(
+            process_function=process_function,
+            job_filter=job_filter
+        )
+        batch_channel = BatchAckChannel(
+            ThreadsafeChannel(self.connection, self.channel)
+        )
+
+        def process_batch():
+            return [
+                self.__process_delivery(
+                    message_callback,
+                    batch_channel,
+                    method,
+                    properties,
+                    body
+                )
+                for method, properties, body in deliveries
+            ]
+
+        completed_jobs = self.__run_off_thread(process_batch)
+        acknowledged = batch_channel.flush()
+        logging.info(
+            f"Acknowledged {acknowledged}/{len(deliveries)} messages from "
+            f"{self.queue}"
+        )
+        return completed_jobs
+
+
+    def inspect_quarantine(self, limit: int = 100) -> List[JobView]:
+        """ Retrieves jobs held in quarantine without removing them. Each job
+            carries the no. of attempts made (i.e. `x-attempt` header) & the
+            error raised by its last attempt (i.e. `x-last-error` header).
+
+        Args:
+            limit (int): Max no. of jobs to retrieve
+        Returns:
+            Lazy views of quarantined jobs (list(JobView))
+        """
+        if self.is_recoverable():
+            self.reconnect()
+
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        if not self.retry_policy:
+            raise RuntimeError("No retry policy set! Jobs are never quarantined.")
+
+        self.__declare_retry_queues()
+        quarantine = self.retry_policy.get_quarantine_queue(self.queue)
+
+        jobs = []
+        while len(jobs) < limit:
+            method, properties, body = self.channel.basic_get(
+                queue=quarantine,
+                auto_ack=False
+            )
+            if method is None:
+                break
+            jobs.append(JobView(self, method, properties, body))
+
+        # Return all jobs to quarantine in their original order
+        if jobs:
+            self.channel.basic_nack(
+                delivery_tag=jobs[-1].delivery_tag,
+                multiple=True,
+                requeue=True
+            )
+        return jobs
+
+
+    def replay_quarantine(
+        self,
+        limit: Optional[int] = None,
+        job_filter: Optional[Callable[[JobView], bool]] = None
+    ) -> int:
+        """ Republishes jobs held in quarantine into the queue consumed from,
+            with their attempts reset. Each job is only removed from quarantine
+            once its republication is confirmed by the broker.
+
+        Args:
+            limit (int): Max no. of jobs to replay. If None, all jobs are
+                replayed. Default: None
+            job_filter (Callable): Predicate on a lazy `JobView` of each
+                quarantined job. Jobs failing the filter stay in quarantine.
+        Returns:
+            No. of jobs replayed (int)
+        """
+        if self.is_recoverable():
+            self.reconnect()
+
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        if not self.retry_policy:
+            raise RuntimeError("No retry policy set! Jobs are never quarantined.")
+
+        self.__declare_retry_queues()
+        quarantine = self.retry_policy.get_quarantine_queue(self.queue)
+
+        replayed = 0
+        last_skipped = None
+        while limit is None or replayed < limit:
+            method, properties, body = self.channel.basic_get(
+                queue=quarantine,
+                auto_ack=False
+            )
+            if method is None:
+                break
+
+            job = JobView(self, method, properties, body)
+            if job_filter and not job_filter(job):
+                last_skipped = method.delivery_tag
+                continue
+
+            self.channel.basic_publish(
+                exchange='',
+                routing_key=self.queue,
+                body=body,
+                properties=pika.BasicProperties(
+                    delivery_mode=2,
+                    content_type=properties.content_type,
+                    content_encoding=properties.content_encoding,
+                    headers=clear_retry_headers(job.headers) or None,
+                    priority=properties.priority,
+                    message_id=properties.message_id
+                )
+            )
+            self.channel.basic_ack(delivery_tag=method.delivery_tag)
+            replayed += 1
+
+        # Return skipped jobs to quarantine
+        if last_skipped is not None:
+            self.channel.basic_nack(
+                delivery_tag=last_skipped,
+                multiple=True,
+                requeue=True
+            )
+
+        logging.info(f"Replayed {replayed} jobs from {quarantine}")
+        return replayed
+
+
+    def declare_queue(self):
+        """ Declares the queue consumed from, together with its arguments.
+            Priority queues must be declared with `x-max-priority` before any
+            message is routed to them, or priorities are silently ignored.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Operator is not connected! Run '.connect()' and try again!")
+
+        self.channel.queue_declare(
+            self.queue,
+            durable=self.durability,
+            arguments=self.create_queue_arguments()
         )
-        queue_message_count = declared_queue.method.message_count
 
-        return queue_message_count
 
     ##################
     # Core Functions #
     ##################
 
-    def connect(self):
+    def connect(
+        self, 
+        heartbeat: int = CONSUMER_HEARTBEAT, 
+        blocked_connection_timeout=300
+    ):
         """ Initiate connection with RabbitMQ exchange while configuring a
-            prefetch threshold to prevent consumers from overloading
+            prefetch threshold to prevent consumers from overloading. Since
+            jobs run off the thread servicing the connection, heartbeats are
+            enabled, so that dead consumers are detected & their jobs are
+            redelivered within seconds.
+
+        Args:
+            heartbeat (int): Heartbeat interval (in secs)
+            blocked_connection_timeout (float): Max time (in secs) a connection
+                may remain blocked by the broker before it is torn down
         """
-        super().connect()
+        super().connect(
+            heartbeat=heartbeat,
+            blocked_connection_timeout=blocked_connection_timeout
+        )
         self.channel.basic_qos(
-            prefetch_size=0,    # no message size limit
-            prefetch_count=1    # max no. of messages to accumulate
+            prefetch_size=0,                    # no message size limit
+            prefetch_count=self.prefetch_count  # max no. of messages to accumulate
         )
\ No newline at end of file
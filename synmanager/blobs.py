@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Iterable
+
+# Libs
+
+
+# Custom
+from .serialization import get_codec
+
+##################
+# Configurations #
+##################
+
+CLAIM_MARKER = '$claim'
+CLAIM_KEYS = ('experiment', 'experiments')
+CLAIM_THRESHOLD = 512   # bytes below which sub-objects are sent inline
+CLAIM_CACHE_SIZE = 128  # no. of blobs kept in memory by consumers
+
+DIGEST_PATTERN = re.compile(r'sha256:[0-9a-f]{64}')
+
+#############
+# Functions #
+#############
+
+def validate_digest(digest: Any) -> str:
+    """ Checks that a digest is well-formed. Digests are read from received
+        messages, & must never be trusted as paths or keys as is.
+
+    Args:
+        digest (Any): Content digest of blob
+    Returns:
+        Validated digest (str)
+    """
+    if not (isinstance(digest, str) and DIGEST_PATTERN.fullmatch(digest)):
+        raise ValueError(f"Invalid blob digest {digest!r}!")
+    return digest
+
+####################################
+# Blob Store Class - BaseBlobStore #
+####################################
+
+class BaseBlobStore:
+    """ Contains baseline functionality for all content-addressed stores that
+        hold the sub-objects checked out of job payloads
+    """
+
+    ############
+    # Checkers #
+    ############
+
+    def exists(self, digest: str) -> bool:
+        """ Checks if a blob has already been stored
+
+        Args:
+            digest (str): Content digest of blob
+        Returns:
+            True    if blob exists
+            False   otherwise
+        """
+        raise NotImplementedError
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def put(self, digest: str, data: bytes):
+        """ Stores a blob under its content digest
+
+        Args:
+            digest (str): Content digest of blob
+            data (bytes): Blob contents
+        """
+        raise NotImplementedError
+
+
+    def get(self, digest: str) -> bytes:
+        """ Retrieves a blob by its content digest
+
+        Args:
+            digest (str): Content digest of blob
+        Returns:
+            Blob contents (bytes)
+        """
+        raise NotImplementedError
+
+
+
+#####################################
+# Blob Store Class - LocalBlobStore #
+#####################################
+
+class LocalBlobStore(BaseBlobStore):
+    """ Blob store backed by a local directory (or a shared volume mounted on
+        both producers & consumers). Blobs are sharded by digest prefix, and
+        written atomically so that concurrent writers never expose partial
+        blobs to readers.
+
+    Attributes:
+        directory (str): Root directory of store
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __generate_path(self, digest: str) -> str:
+        """ Generates the path a blob is stored at """
+        algorithm, _, hexdigest = validate_digest(digest).partition(':')
+        return os.path.join(self.directory, algorithm, hexdigest[:2], hexdigest)
+
+    ############
+    # Checkers #
+    ############
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.__generate_path(digest))
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def put(self, digest: str, data: bytes):
+        path = self.__generate_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+    def get(self, digest: str) -> bytes:
+        try:
+            with open(self.__generate_path(digest), 'rb') as blob:
+                return blob.read()
+        except FileNotFoundError:
+            raise KeyError(f"Blob {digest} does not exist in {self.directory}!")
+
+
+
+##################################
+# Claim Check Class - ClaimCheck #
+##################################
+
+class ClaimCheck:
+    """ Implements the claim-check pattern for job payloads. Large sub-objects
+        (e.g. experiment records, which are repeated across every run of an
+        experiment) are stored once in a blob store, & replaced in-message by
+        their content digests. Consumers resolve digests back into their
+        original sub-objects, so process functions receive the same kwargs.
+
+    Attributes:
+        store (BaseBlobStore): Store holding checked out sub-objects
+        keys (tuple(str)): Names of fields whose values are to be checked out
+        threshold (int): Min size (in bytes) of sub-objects to be checked out
+        cache_size (int): Max no. of blobs kept in memory for resolution
+    """
+    def __init__(
+        self,
+        store: BaseBlobStore,
+        keys: Iterable[str] = CLAIM_KEYS,
+        threshold: int = CLAIM_THRESHOLD,
+        cache_size: int = CLAIM_CACHE_SIZE
+    ):
+        self.store = store
+        self.keys = tuple(keys)
+        self.threshold = threshold
+        self.cache_size = cache_size
+
+        self._codec = get_codec('json')     # canonical encoding for hashing
+        self._stored = set()                # digests known to exist in store
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __check_in_value(self, value: Any) -> Any:
+        """ Stores a single sub-object, returning a claim on it if it is large
+            enough to warrant one
+        """
+        data = self._codec.encode(value).encode()
+        if len(data) < self.threshold:
+            return value
+
+        digest = f"sha256:{hashlib.sha256(data).hexdigest()}"
+        if digest not in self._stored:
+            if not self.store.exists(digest):
+                self.store.put(digest, data)
+            self._stored.add(digest)
+
+        return {CLAIM_MARKER: digest}
+
+
+    def __retrieve(self, digest: str) -> bytes:
+        """ Retrieves a blob, preferring the in-memory LRU cache. Blobs
+            are verified against their digests before they are cached.
+        """
+        validate_digest(digest)
+        with self._lock:
+            if digest in self._cache:
+                self._cache.move_to_end(digest)
+                return self._cache[digest]
+
+        data = self.store.get(digest)
+        if f"sha256:{hashlib.sha256(data).hexdigest()}" != digest:
+            raise ValueError(f"Blob {digest} does not match its digest!")
+
+        with self._lock:
+            self._cache[digest] = data
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return data
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def check_in(self, payload: Any) -> Any:
+        """ Replaces all eligible sub-objects in a payload with claims
+
+        Args:
+            payload (Any): Job payload
+        Returns:
+            Payload with claims (Any)
+        """
+        if isinstance(payload, dict):
+            return {
+                key: (
+                    self.__check_in_value(value)
+                    if key in self.keys else
+                    self.check_in(value)
+                )
+                for key, value in payload.items()
+            }
+
+        elif isinstance(payload, (list, tuple)):
+            return [self.check_in(value) for value in payload]
+
+        return payload
+
+
+    def check_out(self, payload: Any) -> Any:
+        """ Resolves all claims in a payload back into their sub-objects
+
+        Args:
+            payload (Any): Job payload with claims
+        Returns:
+            Restored payload (Any)
+        """
+        if isinstance(payload, dict):
+            if len(payload) == 1 and CLAIM_MARKER in payload:
+                return self._codec.decode(self.__retrieve(payload[CLAIM_MARKER]))
+            return {key: self.check_out(value) for key, value in payload.items()}
+
+        elif isinstance(payload, list):
+            return [self.check_out(value) for value in payload]
+
+        return payload
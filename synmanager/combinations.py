@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import itertools
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+RUN_ID_TEMPLATE = "{expt_id}_run_{index}"
+
+#############
+# Functions #
+#############
+
+def _as_options(value: Any) -> list:
+    """ Casts a search space entry into its list of candidate values. Only
+        lists & tuples are expanded; all other values are held fixed.
+    """
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def count_grid(search_space: Dict[str, Any]) -> int:
+    """ Counts the no. of hyperparameter sets spanned by a search space,
+        without expanding it
+
+    Args:
+        search_space (dict): Hyperparameters mapped to their candidate values
+    Returns:
+        No. of hyperparameter sets (int)
+    """
+    count = 1
+    for value in search_space.values():
+        count *= len(_as_options(value))
+    return count
+
+
+def expand_grid(search_space: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """ Lazily expands a search space into individual hyperparameter sets.
+        Hyperparameters are ordered by name, & the last hyperparameter varies
+        fastest, so the order of expansion is stable across processes.
+
+    Args:
+        search_space (dict): Hyperparameters mapped to their candidate values.
+            Lists & tuples are expanded, while other values are held fixed.
+    Returns:
+        Hyperparameter sets (Iterator[dict])
+    """
+    names = sorted(search_space)
+    options = [_as_options(search_space[name]) for name in names]
+    for values in itertools.product(*options):
+        yield dict(zip(names, values))
+
+
+def generate_runs(
+    experiment: Dict[str, Any],
+    search_space: Dict[str, Any],
+    base_run: Optional[Dict[str, Any]] = None,
+    run_id_template: str = RUN_ID_TEMPLATE
+) -> Iterator[Dict[str, Any]]:
+    """ Lazily generates run records for an experiment, one for every
+        hyperparameter set in a search space. Run IDs are derived from the
+        position of each set in the grid, & are hence reproducible.
+
+    Args:
+        experiment (dict): Experiment record that runs belong to
+        search_space (dict): Hyperparameters mapped to their candidate values
+        base_run (dict): Default run configurations to be overridden by grid
+        run_id_template (str): Format string for run IDs, which can refer to
+            all fields of the experiment key & the grid `index`
+    Returns:
+        Run records (Iterator[dict])
+    """
+    base_run = base_run or {}
+    expt_key = experiment['key']
+    for index, hyperparameters in enumerate(expand_grid(search_space)):
+        run_id = run_id_template.format(index=index, **expt_key)
+        yield {
+            **base_run,
+            **hyperparameters,
+            'key': {**expt_key, 'run_id': run_id}
+        }
+
+
+def enumerate_federated_combinations(
+    action: str,
+    experiments: Iterable[Dict[str, Any]],
+    runs: Iterable[Dict[str, Any]] = (),
+    search_space: Optional[Dict[str, Any]] = None,
+    auto_align: bool = True,
+    dockerised: bool = True,
+    log_msgs: bool = True,
+    verbose: bool = True,
+    **kwargs
+) -> Iterator[Tuple[Tuple[str, str, str, str], Dict[str, Any]]]:
+    """ Lazily enumerates all registered combinations of experiment models and
+        run configurations for a SINGLE project in preparation for bulk
+        operations. Declared runs are matched to their experiments & yielded
+        in declaration order, followed by the runs generated from the search
+        space (if any) for each experiment in turn.
+
+    Args:
+        action (str): Type of machine learning operation to be executed
+        experiments (Iterable[dict]): All experimental models to be
+            reconstructed
+        runs (Iterable[dict]): All hyperparameter sets to be used during grid
+            FL inference. Runs are consumed in a single pass, & hence may be
+            streamed from a generator.
+        search_space (dict): Hyperparameters grid to generate additional runs
+            from, for every experiment
+        auto_align (bool): Toggles if multiple feature alignments will be used
+        dockerised (bool): Toggles if current FL grid is containerised or not
+        log_msgs (bool): Toggles if messages are to be logged
+        verbose (bool): Toggles verbosity of logs for WSCW objects
+        **kwargs: Miscellaneous keyword argmuments to be included in each job
+    Returns:
+        Combination keys & their parameters (Iterator[tuple(tuple, dict)])
+    """
+    ###########################
+    # Implementation Footnote #
+    ###########################
+
+    # [Cause]
+    # Grid searches submitted by the Director can span 100k+ combinations.
+
+    # [Problems]
+    # Materialising every combination into a dict before publishing holds
+    # the entire search (each carrying its experiment record) in memory.
+
+    # [Solution]
+    # Only index experiments (which are few), & stream runs through a single
+    # pass, so that each combination is built as it is being published.
+
+    experiments_by_id = {
+        expt_record['key']['expt_id']: expt_record
+        for expt_record in experiments
+    }
+
+    def build_combination(expt_record, run_record):
+        run_key = run_record['key']
+        combination_key = (
+            run_key['collab_id'],
+            run_key['project_id'],
+            run_key['expt_id'],
+            run_key['run_id']
+        )
+        combination_params = {
+            'keys': run_key,
+            'action': action,
+            'experiment': expt_record,
+            'run': run_record,
+            'auto_align': auto_align,
+            'dockerised': dockerised,
+            'log_msgs': log_msgs,
+            'verbose': verbose,
+            **kwargs
+        }
+        return combination_key, combination_params
+
+    for run_record in runs:
+        expt_record = experiments_by_id.get(run_record['key']['expt_id'])
+        if expt_record is not None:
+            yield build_combination(expt_record, run_record)
+
+    if search_space:
+        for expt_record in experiments_by_id.values():
+            for run_record in generate_runs(expt_record, search_space):
+                yield build_combination(expt_record, run_record)
+
+
+def generate_jobs(
+    process: str,
+    combinations: Iterable[Tuple[tuple, Dict[str, Any]]]
+) -> Iterator[Dict[str, Any]]:
+    """ Lazily wraps enumerated combinations into job payloads, ready to be
+        published via `ProducerOperator.process_many(...)`
+
+    Args:
+        process (str): Operations filter for MQ consumers (e.g. "train")
+        combinations (Iterable): Combination keys & their parameters
+    Returns:
+        Job payloads (Iterator[dict])
+    """
+    for combination_key, combination_params in combinations:
+        yield {
+            'process': process,
+            'combination_key': combination_key,
+            'combination_params': combination_params
+        }
@@ -13,7 +13,9 @@ import uuid
 
 # Custom
 from .base import ProducerOperator, ConsumerOperator
+from .async_base import AsyncProducerOperator, AsyncConsumerOperator
 from .config import (
+    MAX_PRIORITY,
     COMPLETED_ROUTING_KEY,  
     COMPLETED_EXCHANGE_NAME,
     COMPLETED_EXCHANGE_TYPE,
@@ -45,6 +47,8 @@ class CompletedProducerOperator(ProducerOperator):
         self.exchange_name = COMPLETED_EXCHANGE_NAME
         self.exchange_type = COMPLETED_EXCHANGE_TYPE
         self.routing_key = COMPLETED_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = COMPLETED_QUEUE
 
 
         # Data attributes
@@ -93,6 +97,7 @@ class CompletedConsumerOperator(ConsumerOperator):
 
         # Network attributes
         self.routing_key = COMPLETED_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
         self.exchange_name = COMPLETED_EXCHANGE_NAME
         self.exchange_type = COMPLETED_EXCHANGE_TYPE
         self.queue = COMPLETED_QUEUE
@@ -121,4 +126,47 @@ class CompletedConsumerOperator(ConsumerOperator):
 
     ##################
     # Core Functions #
-    ##################
\ No newline at end of file
+    ##################
+
+
+
+############################################################################
+# Async Completed producer operator Class - AsyncCompletedProducerOperator #
+############################################################################
+
+class AsyncCompletedProducerOperator(AsyncProducerOperator):
+    """ 
+    Contains management functionality for handling asynchronous completed job
+    submissions to the "Completed_*" queue(s)
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.exchange_name = COMPLETED_EXCHANGE_NAME
+        self.exchange_type = COMPLETED_EXCHANGE_TYPE
+        self.routing_key = COMPLETED_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+
+
+
+############################################################################
+# Async Completed consumer operator Class - AsyncCompletedConsumerOperator #
+############################################################################
+
+class AsyncCompletedConsumerOperator(AsyncConsumerOperator):
+    """ 
+    Contains management functionality for handling asynchronous completed job
+    consumptions from the "Completed" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = COMPLETED_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.exchange_name = COMPLETED_EXCHANGE_NAME
+        self.exchange_type = COMPLETED_EXCHANGE_TYPE
+        self.queue = COMPLETED_QUEUE
\ No newline at end of file
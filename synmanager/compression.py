@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import zlib
+from typing import Dict, Optional, Tuple, Union
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+DEFLATE_ENCODING = 'deflate'
+SYNERGOS_DEFLATE_ENCODING = 'x-synergos-deflate-v1'
+
+COMPRESSION_LEVEL = 6       # zlib tradeoff between speed & ratio
+COMPRESSION_THRESHOLD = 1024  # bytes below which payloads are left raw
+MAX_DECOMPRESSED_SIZE = 128 * 2**20    # bytes payloads may expand into
+
+###########################
+# Implementation Footnote #
+###########################
+
+# [Cause]
+# Synergos job payloads are canonical JSON (i.e. sorted keys), composed of
+# experiment records (i.e. layer definitions) & run records (i.e. the same
+# set of hyperparameter keys), which are repeated across every job.
+
+# [Problems]
+# Individual payloads are too small for deflate to learn these repetitions
+# before the stream ends.
+
+# [Solution]
+# Prime deflate with a preset dictionary of common payload fragments. zlib
+# favours matches at the end of the dictionary, hence the most frequent
+# fragments are placed last. The dictionary is versioned via its content
+# encoding, & MUST NOT be modified in place; declare a new encoding instead.
+
+SYNERGOS_DICTIONARY_V1 = b"".join([
+    b'"structure": {}}, {"activation": null, "is_input": false, ',
+    b'"l_type": "Flatten", "l_type": "Conv2d", "l_type": "Linear", ',
+    b'"in_channels": ', b'"kernel_size": ', b'"out_channels": ',
+    b'"padding": ', b'"stride": ', b'"bias": true, ', b'"in_features": ',
+    b'"out_features": ', b'"activation": "softmax", "activation": "relu", ',
+    b'"is_input": true, "l_type": ', b'"model": [{"activation": ',
+    b'"algorithm": "FedProx", "algorithm": "FedAvg", ',
+    b'"criterion": "NLLLoss", "criterion": "MSELoss", ',
+    b'"lr_scheduler": "CyclicLR", "optimizer": "SGD", "optimizer": "Adam", ',
+    b'"base_lr": 0.0005, "delta": 0.0, "epochs": ', b'"is_snn": false, ',
+    b'"l1_lambda": 0.0, "l2_lambda": 0.0, "lr": 0.001, "lr_decay": 0.1, ',
+    b'"max_lr": 0.005, "mu": 0.1, "patience": ',
+    b'"precision_fractional": 5, "rounds": ', b'"seed": 42, ',
+    b'"weight_decay": 0.0}',
+    b'"action": "classify", "action": "regress", "auto_align": true, ',
+    b'"auto_align": false, "auto_fix": true, "dockerised": true, ',
+    b'"log_msgs": false, "verbose": false, "experiments": [{',
+    b'"runs": [{', b'"combination_key": [', b'"combination_params": {',
+    b'"process": ', b'"keys": {', b'"experiment": {', b'"run": {',
+    b'"participant_id": "', b'"registration_id": "', b'"role": "host", ',
+    b'"role": "guest", ', b'"created_at": "{TinyDate}:20',
+    b'"key": {"collab_id": "', b'", "expt_id": "', b'", "project_id": "',
+    b'", "run_id": "', b'"}, '
+])
+
+########################################
+# Compressor Class - DeflateCompressor #
+########################################
+
+class DeflateCompressor:
+    """ Compresses & decompresses payloads with zlib, optionally primed with
+        a preset dictionary
+
+    Attributes:
+        encoding (str): Content encoding advertised for compressed payloads
+        dictionary (bytes): Preset dictionary to prime zlib with
+        level (int): Compression level (i.e. 1 - 9)
+    """
+    def __init__(
+        self,
+        encoding: str,
+        dictionary: Optional[bytes] = None,
+        level: int = COMPRESSION_LEVEL
+    ):
+        self.encoding = encoding
+        self.dictionary = dictionary
+        self.level = level
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def compress(self, payload: bytes) -> bytes:
+        """ Compresses a payload
+
+        Args:
+            payload (bytes): Raw payload
+        Returns:
+            Compressed payload (bytes)
+        """
+        if self.dictionary:
+            compressor = zlib.compressobj(level=self.level, zdict=self.dictionary)
+        else:
+            compressor = zlib.compressobj(level=self.level)
+        return compressor.compress(payload) + compressor.flush()
+
+
+    def decompress(
+        self, 
+        payload: bytes, 
+        max_size: int = MAX_DECOMPRESSED_SIZE
+    ) -> bytes:
+        """ Decompresses a payload, refusing to expand it beyond a max size
+            (e.g. a small, maliciously crafted body inflating into gigabytes)
+
+        Args:
+            payload (bytes): Compressed payload
+            max_size (int): Max size (in bytes) of raw payload
+        Returns:
+            Raw payload (bytes)
+        """
+        if self.dictionary:
+            decompressor = zlib.decompressobj(zdict=self.dictionary)
+        else:
+            decompressor = zlib.decompressobj()
+
+        raw_payload = decompressor.decompress(payload, max_size)
+        if not decompressor.unconsumed_tail:
+            raw_payload += decompressor.flush()
+
+        if decompressor.unconsumed_tail or len(raw_payload) > max_size:
+            raise ValueError(
+                f"Payload expands beyond the max size of {max_size} bytes!"
+            )
+        return raw_payload
+
+#############
+# Functions #
+#############
+
+COMPRESSORS: Dict[str, DeflateCompressor] = {
+    DEFLATE_ENCODING: DeflateCompressor(DEFLATE_ENCODING),
+    SYNERGOS_DEFLATE_ENCODING: DeflateCompressor(
+        SYNERGOS_DEFLATE_ENCODING,
+        dictionary=SYNERGOS_DICTIONARY_V1
+    )
+}
+
+
+def register_compressor(compressor: DeflateCompressor):
+    """ Registers a compressor under its content encoding, making its payloads
+        decodable by all consumers in this process
+
+    Args:
+        compressor (DeflateCompressor): Compressor to be registered
+    """
+    COMPRESSORS[compressor.encoding] = compressor
+
+
+def compress(
+    payload: Union[str, bytes],
+    encoding: Optional[str],
+    threshold: int = COMPRESSION_THRESHOLD
+) -> Tuple[Union[str, bytes], Optional[str]]:
+    """ Compresses a payload with the compressor registered under a specified
+        encoding. Payloads smaller than the threshold are left untouched, since
+        compressing them would not yield meaningful savings.
+
+    Args:
+        payload (str/bytes): Raw payload
+        encoding (str): Content encoding to compress with. If None, payload is
+            left untouched.
+        threshold (int): Min payload size (in bytes) to be compressed
+    Returns:
+        Payload (str/bytes)
+        Content encoding applied (str/None)
+    """
+    if encoding is None:
+        return payload, None
+
+    # Thresholds are in bytes, which multi-byte characters outnumber
+    data = payload.encode() if isinstance(payload, str) else payload
+    if len(data) < threshold:
+        return payload, None
+
+    if encoding not in COMPRESSORS:
+        raise ValueError(f"Unsupported content encoding '{encoding}'!")
+
+    return COMPRESSORS[encoding].compress(data), encoding
+
+
+def decompress(
+    payload: bytes, 
+    encoding: Optional[str],
+    max_size: int = MAX_DECOMPRESSED_SIZE
+) -> bytes:
+    """ Decompresses a payload according to its content encoding
+
+    Args:
+        payload (bytes): Received payload
+        encoding (str): Content encoding advertised on the message. If None,
+            payload is assumed to be uncompressed.
+        max_size (int): Max size (in bytes) of raw payload
+    Returns:
+        Raw payload (bytes)
+    """
+    if not encoding:
+        return payload
+
+    if encoding not in COMPRESSORS:
+        raise ValueError(f"Unsupported content encoding '{encoding}'!")
+
+    return COMPRESSORS[encoding].decompress(payload, max_size)
@@ -13,6 +13,16 @@ import logging
 # Configurations #
 ##################
 
+# General Queue Settings
+MAX_PRIORITY = 10   # declared as `x-max-priority` on all phase queues
+EXCHANGE_NAME = 'SynMQ_topic_logs'
+EXCHANGE_TYPE = 'topic'
+
+# Parked Queue Settings (i.e. delayed, retried & quarantined jobs)
+PARKING_QUEUE_PATTERN = r'\.(delayed|retry)\.\d+$'
+QUARANTINE_QUEUE_PATTERN = r'\.quarantine$'
+QUARANTINE_MAX_LENGTH = 10000   # oldest jobs are dropped beyond this
+
 # "Preprocess" Queue Settings
 PREPROCESS_ROUTING_KEY = 'SynMQ_topic_preprocess'
 PREPROCESS_QUEUE = 'preprocess'
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+IN_FLIGHT = 'in-flight'
+COMPLETED = 'completed'
+
+DEDUP_CACHE_SIZE = 10000    # max no. of message IDs remembered
+DEDUP_TTL = 24 * 60 * 60    # secs a message ID is remembered for
+
+####################################
+# Dedup Class - DeduplicationCache #
+####################################
+
+class DeduplicationCache:
+    """ Bounded index of jobs already seen by a consumer, keyed by message ID.
+        Jobs are marked in-flight when processing starts, & completed once
+        acknowledged. Entries are evicted in LRU order beyond the max size, or
+        once they are older than the TTL.
+
+        If a file is specified, completions are also appended to it, so that
+        the index survives consumer restarts. In-flight jobs are only tracked
+        in memory, since jobs interrupted by a crash are meant to be retried.
+
+    Attributes:
+        max_size (int): Max no. of message IDs remembered
+        ttl (float): Max time (in secs) a message ID is remembered for
+        path (str): File to persist completed message IDs to, if any
+        hits (int): No. of duplicate jobs detected
+        misses (int): No. of new jobs admitted
+    """
+    def __init__(
+        self,
+        max_size: int = DEDUP_CACHE_SIZE,
+        ttl: float = DEDUP_TTL,
+        path: Optional[str] = None
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()   # message ID -> (state, time)
+        self._lock = threading.Lock()
+        self._log = None
+        self._log_size = 0
+
+        if path:
+            self.__load()
+            self._log = open(path, 'a')
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __evict(self):
+        """ Evicts expired entries, & least recently used entries beyond the
+            max size
+        """
+        expiry = time.time() - self.ttl
+        while self._entries:
+            _, timestamp = next(iter(self._entries.values()))
+            if len(self._entries) <= self.max_size and timestamp >= expiry:
+                break
+            self._entries.popitem(last=False)
+
+
+    def __load(self):
+        """ Restores completed message IDs from file """
+        try:
+            with open(self.path) as log:
+                for line in log:
+                    timestamp, _, message_id = line.rstrip('\n').partition(' ')
+                    if message_id:
+                        self._entries[message_id] = (COMPLETED, float(timestamp))
+                        self._entries.move_to_end(message_id)
+                        self._log_size += 1
+        except FileNotFoundError:
+            pass
+
+        self.__evict()
+
+
+    def __compact(self):
+        """ Rewrites the file with only the completions still remembered, once
+            it has grown to twice the max size
+        """
+        if self._log_size < 2 * self.max_size:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                completions = [
+                    f"{timestamp} {message_id}\n"
+                    for message_id, (state, timestamp) in self._entries.items()
+                    if state == COMPLETED
+                ]
+                tmp_file.writelines(completions)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._log.close()
+        self._log = open(self.path, 'a')
+        self._log_size = len(completions)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def check_in(self, message_id: str) -> Optional[str]:
+        """ Checks if a job has been seen before, marking it in-flight if not
+
+        Args:
+            message_id (str): Message ID of job
+        Returns:
+            State of the previous sighting of job (i.e. "in-flight" or
+            "completed"), or None if job is new (str/None)
+        """
+        with self._lock:
+            self.__evict()
+            state, timestamp = self._entries.get(message_id, (None, 0))
+            if state and timestamp >= time.time() - self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(message_id)
+                return state
+
+            self.misses += 1
+            self._entries[message_id] = (IN_FLIGHT, time.time())
+            self.__evict()
+            return None
+
+
+    def complete(self, message_id: str):
+        """ Marks a job as completed
+
+        Args:
+            message_id (str): Message ID of job
+        """
+        timestamp = time.time()
+        with self._lock:
+            self._entries[message_id] = (COMPLETED, timestamp)
+            self._entries.move_to_end(message_id)
+            self.__evict()
+
+            if self._log:
+                self._log.write(f"{timestamp} {message_id}\n")
+                self._log.flush()
+                self._log_size += 1
+                self.__compact()
+
+
+    def release(self, message_id: str):
+        """ Forgets an in-flight job (e.g. after it failed), so that its
+            redelivery is processed
+
+        Args:
+            message_id (str): Message ID of job
+        """
+        with self._lock:
+            if self._entries.get(message_id, (None,))[0] == IN_FLIGHT:
+                self._entries.pop(message_id)
+
+
+    def get_stats(self) -> Dict[str, int]:
+        """ Retrieves hit/miss counters of this cache
+
+        Returns:
+            Cache statistics (dict)
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries)
+            }
+
+
+    def close(self):
+        """ Closes the backing file, if any """
+        with self._lock:
+            if self._log:
+                self._log.close()
+                self._log = None
@@ -12,7 +12,8 @@ import logging
 
 # Custom
 from .base import ProducerOperator, ConsumerOperator
-from .config import EVALUATE_ROUTING_KEY, EVALUATE_QUEUE
+from .async_base import AsyncProducerOperator, AsyncConsumerOperator
+from .config import MAX_PRIORITY, EVALUATE_ROUTING_KEY, EVALUATE_QUEUE
 
 ##################
 # Configurations #
@@ -38,6 +39,8 @@ class EvaluateProducerOperator(ProducerOperator):
 
         # Network attributes
         self.routing_key = EVALUATE_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = EVALUATE_QUEUE
 
         # Data attributes
     
@@ -85,6 +88,7 @@ class EvaluateConsumerOperator(ConsumerOperator):
 
         # Network attributes
         self.routing_key = EVALUATE_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
         self.queue = EVALUATE_QUEUE
 
         # Data attributes
@@ -111,4 +115,43 @@ class EvaluateConsumerOperator(ConsumerOperator):
 
     ##################
     # Core Functions #
-    ##################
\ No newline at end of file
+    ##################
+
+
+
+##########################################################################
+# Async Evaluate producer operator Class - AsyncEvaluateProducerOperator #
+##########################################################################
+
+class AsyncEvaluateProducerOperator(AsyncProducerOperator):
+    """ 
+    Contains management functionality for handling asynchronous evaluation 
+    job submissions to the "Evaluate" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = EVALUATE_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+
+
+
+##########################################################################
+# Async Evaluate consumer operator Class - AsyncEvaluateConsumerOperator #
+##########################################################################
+
+class AsyncEvaluateConsumerOperator(AsyncConsumerOperator):
+    """ 
+    Contains management functionality for handling asynchronous evaluation 
+    job consumptions from the "Evaluate" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = EVALUATE_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = EVALUATE_QUEUE
\ No newline at end of file
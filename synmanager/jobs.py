@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+KEY_FIELDS = ('collab_id', 'project_id', 'expt_id', 'run_id')
+KEY_SEARCH_DEPTH = 4    # max nesting level searched for job keys
+
+#############
+# Functions #
+#############
+
+def extract_job_key(payload: Any, max_depth: int = KEY_SEARCH_DEPTH) -> Dict[str, str]:
+    """ Searches a job payload breadth-first for the shallowest set of job key
+        fields (i.e. collab_id, project_id, expt_id & run_id), such as the
+        `key`/`keys` records embedded in Synergos job configurations.
+
+    Args:
+        payload (Any): Job payload
+        max_depth (int): Max nesting level to search
+    Returns:
+        Job key (dict)
+    """
+    queue = collections.deque([(payload, 0)])
+    while queue:
+        node, depth = queue.popleft()
+
+        if isinstance(node, dict):
+            job_key = {
+                field: str(node[field])
+                for field in KEY_FIELDS
+                if field in node
+            }
+            if job_key:
+                return job_key
+            children = node.values()
+
+        elif isinstance(node, (list, tuple)):
+            children = node
+
+        else:
+            continue
+
+        if depth < max_depth:
+            queue.extend((child, depth + 1) for child in children)
+
+    return {}
+
+
+def generate_message_id(run_kwarg: Dict[str, Any]) -> str:
+    """ Generates a deterministic message ID for a job, from its job key &
+        its payload. Resubmissions of an identical job (e.g. by a retrying
+        producer) hence share the same message ID, regardless of the codec
+        they are published with.
+
+    Args:
+        run_kwarg (dict): Job configurations
+    Returns:
+        Message ID (str)
+    """
+    canonical_job = json.dumps(
+        {'key': extract_job_key(run_kwarg), 'payload': run_kwarg},
+        default=str,
+        sort_keys=True
+    )
+    return f"sha256:{hashlib.sha256(canonical_job.encode()).hexdigest()}"
+
+#######################
+# Job Class - JobView #
+#######################
+
+class JobView:
+    """ Lazy view over a delivered job. Routing metadata is served from message
+        headers, while the payload is only decoded upon first access. This
+        allows filtering, deduplication & routing decisions to be made without
+        paying for a full parse of deliveries that end up being skipped.
+
+    Attributes:
+        method (pika.spec.Basic.Deliver): Meta information regarding delivery
+        properties (pika.spec.BasicProperties): Properties on the message
+        body (bytes): Raw message payload
+    """
+    def __init__(self, operator, method, properties, body: bytes):
+        self.method = method
+        self.properties = properties
+        self.body = body
+
+        self._operator = operator
+        self._payload = None
+        self._is_parsed = False
+
+    ############
+    # Checkers #
+    ############
+
+    def is_parsed(self) -> bool:
+        """ Checks if the payload of this job has been decoded
+
+        Returns:
+            True    if decoded
+            False   otherwise
+        """
+        return self._is_parsed
+
+
+    def has_key_headers(self) -> bool:
+        """ Checks if the job key of this job was published in its headers
+
+        Returns:
+            True    if job key is available without parsing
+            False   otherwise
+        """
+        return any(field in self.headers for field in KEY_FIELDS)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    @property
+    def routing_key(self) -> str:
+        return self.method.routing_key
+
+
+    @property
+    def delivery_tag(self) -> int:
+        return self.method.delivery_tag
+
+
+    @property
+    def redelivered(self) -> bool:
+        return self.method.redelivered
+
+
+    @property
+    def message_id(self) -> Optional[str]:
+        return self.properties.message_id
+
+
+    @property
+    def headers(self) -> Dict[str, Any]:
+        return self.properties.headers or {}
+
+
+    @property
+    def key(self) -> Dict[str, str]:
+        """ Job key of this job. Jobs published without key headers (i.e. by
+            older producers) have their key extracted from the payload instead.
+        """
+        job_key = {
+            field: self.headers[field]
+            for field in KEY_FIELDS
+            if field in self.headers
+        }
+        return job_key or extract_job_key(self.payload)
+
+
+    @property
+    def payload(self) -> Optional[dict]:
+        """ Decoded job configurations, parsed upon first access """
+        if not self._is_parsed:
+            body = self._operator.decompress_message(
+                self.body,
+                self.properties.content_encoding
+            )
+            self._payload = self._operator.parse_message(
+                body,
+                self.properties.content_type
+            )
+            self._is_parsed = True
+
+        return self._payload
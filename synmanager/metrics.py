@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Sequence, Tuple
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+# Upper bounds (in secs) of latency buckets, spanning sub-millisecond
+# publishes up to hour-long training jobs
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 3600
+)
+
+PUBLISHED_AT_HEADER = 'x-published-at'  # unix time at which job was published
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+#############
+# Functions #
+#############
+
+def format_labels(labels: Tuple[Tuple[str, str], ...], **extra) -> str:
+    """ Renders labels in the Prometheus text exposition format
+
+    Args:
+        labels (tuple): Sorted (name, value) pairs
+        **extra: Additional labels, rendered after all others (e.g. `le`)
+    Returns:
+        Rendered labels (str), or "" if there are none
+    """
+    pairs = [*labels, *extra.items()]
+    if not pairs:
+        return ""
+
+    rendered = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+        )
+        for name, value in pairs
+    )
+    return f"{{{rendered}}}"
+
+#############################
+# Metrics Class - Histogram #
+#############################
+
+class Histogram:
+    """ Distribution of observations over fixed buckets. Buckets are fixed so
+        that observing a value costs a single binary search, & histograms of
+        different processes can be aggregated by summing them.
+
+    Attributes:
+        buckets (tuple(float)): Upper bounds of buckets, in ascending order
+        counts (list(int)): No. of observations per bucket, with observations
+            beyond the last bound counted in a final overflow bucket
+        sum (float): Total of all observations
+        count (int): No. of observations
+    """
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def observe(self, value: float):
+        """ Records an observation. Callers must serialise access.
+
+        Args:
+            value (float): Observed value
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+    def get_cumulative_counts(self) -> Dict[str, int]:
+        """ Counts observations at or below each bound, as exposed to
+            Prometheus
+
+        Returns:
+            Bounds (incl. "+Inf") mapped to cumulative counts (dict)
+        """
+        cumulative_counts = {}
+        running_count = 0
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            running_count += count
+            cumulative_counts[str(bound)] = running_count
+        return cumulative_counts
+
+
+
+###################################
+# Metrics Class - MetricsRegistry #
+###################################
+
+class MetricsRegistry:
+    """ Thread-safe collection of counters & latency histograms, each of which
+        is split into series by its labels (e.g. the phase queue operated on).
+        Recording costs a dictionary lookup & an uncontended lock, so that
+        operators can be instrumented on every message.
+
+    Attributes:
+        buckets (tuple(float)): Upper bounds of histogram buckets (in secs)
+        counters (dict): Names mapped to labels mapped to counts
+        histograms (dict): Names mapped to labels mapped to `Histogram`s
+    """
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def increment(self, name: str, value: float = 1, **labels):
+        """ Increases a counter
+
+        Args:
+            name (str): Name of counter (e.g. "synmq_consumed_total")
+            value (float): Amount to increase counter by
+            **labels: Labels identifying the series (e.g. queue="train")
+        """
+        label_key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[label_key] = series.get(label_key, 0) + value
+
+
+    def observe(self, name: str, value: float, **labels):
+        """ Records an observation into a histogram
+
+        Args:
+            name (str): Name of histogram (e.g. "synmq_process_seconds")
+            value (float): Observed value (e.g. a latency in secs)
+            **labels: Labels identifying the series (e.g. queue="train")
+        """
+        label_key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(label_key)
+            if histogram is None:
+                histogram = series[label_key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ Copies the current values of all metrics
+
+        Returns:
+            Counters & histograms, keyed by name & then by labels, with
+            histograms given as their cumulative bucket counts, sum & count
+            (dict)
+        """
+        with self._lock:
+            return {
+                'counters': {
+                    name: dict(series)
+                    for name, series in self.counters.items()
+                },
+                'histograms': {
+                    name: {
+                        label_key: {
+                            'buckets': histogram.get_cumulative_counts(),
+                            'sum': histogram.sum,
+                            'count': histogram.count
+                        }
+                        for label_key, histogram in series.items()
+                    }
+                    for name, series in self.histograms.items()
+                }
+            }
+
+
+    def render_prometheus(self) -> str:
+        """ Renders all metrics in the Prometheus text exposition format
+
+        Returns:
+            Exposition (str)
+        """
+        snapshot = self.snapshot()
+
+        lines = []
+        for name, series in sorted(snapshot['counters'].items()):
+            lines.append(f"# TYPE {name} counter")
+            for label_key, value in series.items():
+                lines.append(f"{name}{format_labels(label_key)} {value}")
+
+        for name, series in sorted(snapshot['histograms'].items()):
+            lines.append(f"# TYPE {name} histogram")
+            for label_key, histogram in series.items():
+                for bound, count in histogram['buckets'].items():
+                    lines.append(
+                        f"{name}_bucket{format_labels(label_key, le=bound)} {count}"
+                    )
+                lines.append(f"{name}_sum{format_labels(label_key)} {histogram['sum']}")
+                lines.append(f"{name}_count{format_labels(label_key)} {histogram['count']}")
+
+        return "\n".join(lines) + "\n"
+
+
+    def write_prometheus(self, path: str):
+        """ Writes all metrics into a file (e.g. for node exporter's textfile
+            collector). The file is replaced atomically, so that scrapes never
+            read a partially written exposition.
+
+        Args:
+            path (str): Path of exposition file
+        """
+        staging_path = f"{path}.{os.getpid()}.tmp"
+        with open(staging_path, 'w') as exposition_file:
+            exposition_file.write(self.render_prometheus())
+        os.replace(staging_path, path)
+
+
+    def serve_prometheus(
+        self,
+        port: int,
+        host: str = '127.0.0.1'
+    ) -> ThreadingHTTPServer:
+        """ Serves all metrics over HTTP for Prometheus to scrape, on a
+            background thread
+
+        Args:
+            port (int): Port to listen on. If 0, a free port is picked.
+            host (str): Address to listen on. Default: "127.0.0.1"
+        Returns:
+            Running server (ThreadingHTTPServer), to be stopped with
+            `.shutdown()`
+        """
+        registry = self
+
+        class ExpositionHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                exposition = registry.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(exposition)))
+                self.end_headers()
+                self.wfile.write(exposition)
+
+            def log_message(self, format, *args):
+                pass    # scrapes are too frequent to log
+
+        server = ThreadingHTTPServer((host, port), ExpositionHandler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever,
+            name="MetricsExposition",
+            daemon=True
+        ).start()
+        return server
+
+
+    def clear(self):
+        """ Resets all metrics """
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+#############
+# Functions #
+#############
+
+_default_registry = None
+
+def get_registry() -> MetricsRegistry:
+    """ Retrieves the process-wide metrics registry, creating it if necessary
+
+    Returns:
+        Default metrics registry (MetricsRegistry)
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = MetricsRegistry()
+    return _default_registry
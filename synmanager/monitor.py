@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+# Libs
+import pika
+
+# Custom
+from .config import PREPROCESS_QUEUE, TRAIN_QUEUE, EVALUATE_QUEUE, COMPLETED_QUEUE
+
+##################
+# Configurations #
+##################
+
+MONITOR_INTERVAL = 5    # secs between samples of the monitored queues
+MONITOR_HISTORY = 120   # no. of samples kept per queue (i.e. 10 mins)
+
+PHASE_QUEUES = (PREPROCESS_QUEUE, TRAIN_QUEUE, EVALUATE_QUEUE, COMPLETED_QUEUE)
+
+################################
+# Monitor Sample - QueueSample #
+################################
+
+class QueueSample(NamedTuple):
+    """ Snapshot of a queue at a single point in time
+
+    Attributes:
+        queue (str): Name of queue sampled
+        message_count (int): No. of messages ready for delivery
+        consumer_count (int): No. of consumers subscribed to queue
+        sampled_at (float): Monotonic time at which queue was sampled
+    """
+    queue: str
+    message_count: int
+    consumer_count: int
+    sampled_at: float
+
+
+
+##############################
+# Monitor Rates - QueueRates #
+##############################
+
+class QueueRates(NamedTuple):
+    """ Rates of change of a queue's depth over a window of samples. Since
+        AMQP only exposes queue depths, enqueues & dequeues between 2 samples
+        offset each other, so both rates are lower bounds of the true rates.
+
+    Attributes:
+        enqueue_rate (float): Messages added per sec
+        dequeue_rate (float): Messages removed per sec
+        net_rate (float): Net growth of queue per sec
+    """
+    enqueue_rate: float
+    dequeue_rate: float
+    net_rate: float
+
+################################
+# Monitor Class - QueueMonitor #
+################################
+
+class QueueMonitor:
+    """ Samples the depth & consumer count of several queues over a single
+        dedicated channel, at most once per `interval`. Samples are kept in a
+        ring buffer per queue, & all reads are served from it, so any number
+        of readers (e.g. autoscalers, dashboards & throttled producers) cost
+        1 broker poll per queue per interval.
+
+        Sampling either runs on a background thread (see `start`), or lazily
+        whenever a read finds the latest samples stale.
+
+    Attributes:
+        host (str): Address of RabbitMQ server
+        port (int): Port of RabbitMQ server
+        virtual_host (str): Virtual host that queues are declared on
+        queues (tuple(str)): Names of queues monitored
+        interval (float): Secs between samples
+        history (int): No. of samples kept per queue
+    """
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        queues: Iterable[str] = PHASE_QUEUES,
+        interval: float = MONITOR_INTERVAL,
+        history: int = MONITOR_HISTORY,
+        virtual_host: str = '/'
+    ):
+        if interval <= 0:
+            raise ValueError(f"Sampling interval must be positive! Got {interval}")
+
+        self.host = host
+        self.port = port
+        self.virtual_host = virtual_host
+        self.queues = tuple(queues)
+        self.interval = interval
+        self.history = history
+
+        self._samples = {
+            queue: collections.deque(maxlen=history)
+            for queue in self.queues
+        }
+        self._sampled_at = None
+        self._connection = None
+        self._channel = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    ############
+    # Checkers #
+    ############
+
+    def is_stale(self) -> bool:
+        """ Checks if the latest samples are older than the sampling interval
+
+        Returns:
+            True    if queues are due to be sampled again
+            False   otherwise
+        """
+        return (
+            self._sampled_at is None or
+            time.monotonic() - self._sampled_at >= self.interval
+        )
+
+
+    def is_running(self) -> bool:
+        """ Checks if queues are being sampled on a background thread
+
+        Returns:
+            True    if background sampling is active
+            False   otherwise
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __open_channel(self) -> pika.adapters.blocking_connection.BlockingChannel:
+        """ Opens the channel queues are sampled over, reconnecting if the
+            previous connection was lost
+        """
+        if self._connection is None or not self._connection.is_open:
+            parameters = pika.ConnectionParameters(
+                host=self.host,
+                port=self.port,
+                virtual_host=self.virtual_host,
+                heartbeat=0     # connection idles between samples
+            )
+            self._connection = pika.BlockingConnection(parameters)
+            self._channel = None
+
+        if self._channel is None or not self._channel.is_open:
+            self._channel = self._connection.channel()
+
+        return self._channel
+
+
+    def __close(self):
+        """ Closes the sampling connection, if it is open """
+        if self._connection is not None and self._connection.is_open:
+            self._connection.close()
+        self._connection = None
+        self._channel = None
+
+
+    def __sample(self) -> Dict[str, QueueSample]:
+        """ Polls the broker for every queue monitored. Callers must hold the
+            sampling lock.
+        """
+        samples = {}
+        for queue in self.queues:
+            channel = self.__open_channel()
+            try:
+                declared_queue = channel.queue_declare(queue, passive=True)
+
+            # Passive declarations of missing queues close the channel
+            except pika.exceptions.ChannelClosedByBroker as e:
+                logging.debug(f"Skipped sampling {queue}. Error: {e!r}")
+                continue
+
+            except pika.exceptions.AMQPConnectionError:
+                self.__close()
+                raise
+
+            sample = QueueSample(
+                queue=queue,
+                message_count=declared_queue.method.message_count,
+                consumer_count=declared_queue.method.consumer_count,
+                sampled_at=time.monotonic()
+            )
+            self._samples[queue].append(sample)
+            samples[queue] = sample
+
+        self._sampled_at = time.monotonic()
+        return samples
+
+
+    def __run(self):
+        """ Samples all queues once per interval until stopped """
+        while not self._stopped.is_set():
+            try:
+                self.sample()
+            except (pika.exceptions.AMQPError, OSError) as e:
+                logging.warning(f"Failed to sample queues. Error: {e!r}")
+            self._stopped.wait(self.interval)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def sample(self) -> Dict[str, QueueSample]:
+        """ Polls the broker for the depth & consumer count of every queue
+            monitored. Queues that do not exist (yet) are skipped.
+
+        Returns:
+            Queues mapped to their new samples (dict)
+        """
+        with self._lock:
+            return self.__sample()
+
+
+    def refresh(self):
+        """ Samples all queues if the latest samples are stale. Concurrent
+            readers wait on the same poll instead of issuing their own.
+        """
+        if self.is_running() or not self.is_stale():
+            return
+
+        with self._lock:
+            if self.is_stale():     # unless sampled by another reader meanwhile
+                self.__sample()
+
+
+    def get_sample(self, queue: str) -> Optional[QueueSample]:
+        """ Retrieves the latest sample of a queue
+
+        Args:
+            queue (str): Name of queue monitored
+        Returns:
+            Latest sample (QueueSample), or None if queue was never sampled
+        """
+        self.refresh()
+        samples = self._samples[queue]
+        return samples[-1] if samples else None
+
+
+    def get_history(self, queue: str) -> List[QueueSample]:
+        """ Retrieves all samples of a queue kept, from oldest to latest
+
+        Args:
+            queue (str): Name of queue monitored
+        Returns:
+            Samples of queue (list(QueueSample))
+        """
+        self.refresh()
+        return list(self._samples[queue])
+
+
+    def get_message_count(self, queue: str) -> int:
+        """ Retrieves the latest depth of a queue, in place of polling the
+            broker with `check_message_count`
+
+        Args:
+            queue (str): Name of queue monitored
+        Returns:
+            Queue message count (int)
+        """
+        sample = self.get_sample(queue)
+        if sample is None:
+            raise RuntimeError(f"Queue '{queue}' has not been sampled!")
+        return sample.message_count
+
+
+    def get_consumer_count(self, queue: str) -> int:
+        """ Retrieves the latest no. of consumers of a queue
+
+        Args:
+            queue (str): Name of queue monitored
+        Returns:
+            Queue consumer count (int)
+        """
+        sample = self.get_sample(queue)
+        if sample is None:
+            raise RuntimeError(f"Queue '{queue}' has not been sampled!")
+        return sample.consumer_count
+
+
+    def get_rates(self, queue: str, window: Optional[int] = None) -> QueueRates:
+        """ Calculates the enqueue & dequeue rates of a queue from the
+            changes in its depth across recent samples. Increases are
+            attributed to enqueues & decreases to dequeues.
+
+        Args:
+            queue (str): Name of queue monitored
+            window (int): No. of latest samples to span. If None, all samples
+                kept are used.
+        Returns:
+            Rates of queue (QueueRates)
+        """
+        samples = self.get_history(queue)
+        if window is not None:
+            samples = samples[-window:]
+
+        if len(samples) < 2:
+            return QueueRates(0.0, 0.0, 0.0)
+
+        enqueued = dequeued = 0
+        for previous, current in zip(samples, samples[1:]):
+            change = current.message_count - previous.message_count
+            if change > 0:
+                enqueued += change
+            else:
+                dequeued -= change
+
+        duration = samples[-1].sampled_at - samples[0].sampled_at
+        if duration <= 0:
+            return QueueRates(0.0, 0.0, 0.0)
+
+        return QueueRates(
+            enqueue_rate=enqueued / duration,
+            dequeue_rate=dequeued / duration,
+            net_rate=(enqueued - dequeued) / duration
+        )
+
+
+    def start(self):
+        """ Starts sampling queues on a background thread """
+        if self.is_running():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self.__run,
+            name="QueueMonitor",
+            daemon=True
+        )
+        self._thread.start()
+
+
+    def stop(self):
+        """ Stops background sampling & closes the sampling connection """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        with self._lock:
+            self.__close()
@@ -0,0 +1,583 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Libs
+import pika
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+SEGMENT_SIZE = 64 * 2**20   # bytes written to a segment before rolling over
+SEGMENT_SUFFIX = '.wal'
+CURSOR_FILENAME = 'cursor'
+DEAD_LETTER_FILENAME = 'dead_letters'
+
+RECORD_HEADER = struct.Struct('<III')   # metadata length, body length, crc32
+
+FLUSH_BATCH_SIZE = 256      # max no. of entries drained per batch
+FLUSH_POLL_INTERVAL = 1     # secs to wait for new entries when idle
+FLUSH_MAX_BACKOFF = 30      # max secs to wait between reconnection attempts
+FLUSH_MAX_ATTEMPTS = 5      # failed flushes of an entry before it is set aside
+
+##############################
+# Outbox Entry - OutboxEntry #
+##############################
+
+class OutboxEntry(NamedTuple):
+    """ A single message read from an outbox
+
+    Attributes:
+        message (bytes): Message to be published
+        headers (dict): Headers to be attached to message
+        priority (int): Delivery priority of message
+        release_at (float): Unix timestamp to release message at, if delayed
+        position (tuple(int, int)): Segment & offset right after this entry
+        message_id (str): Message ID of message, if any
+        content_type (str): Content type of message, as encoded by the
+            producer that staged it. Entries staged without one are encoded
+            by the flusher's producer instead.
+        content_encoding (str): Content encoding of message, if compressed
+    """
+    message: bytes
+    headers: Optional[Dict[str, Any]]
+    priority: Optional[int]
+    release_at: Optional[float]
+    position: Tuple[int, int]
+    message_id: Optional[str] = None
+    content_type: Optional[str] = None
+    content_encoding: Optional[str] = None
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def create_delivery_kwargs(self) -> Dict[str, Any]:
+        """ Converts this entry's metadata into delivery arguments accepted
+            by `ProducerOperator.publish_batch(...)`
+
+        Returns:
+            Delivery arguments (dict)
+        """
+        delay = self.release_at - time.time() if self.release_at else None
+        delivery_kwargs = {
+            'headers': self.headers, 
+            'priority': self.priority, 
+            'delay': delay,
+            'message_id': self.message_id
+        }
+
+        # Messages are published as encoded by their staging producer, which
+        # may not share the flusher's codec & compression settings
+        if self.content_type is not None:
+            delivery_kwargs['content_type'] = self.content_type
+            delivery_kwargs['content_encoding'] = self.content_encoding
+        return delivery_kwargs
+
+#########################
+# Outbox Class - Outbox #
+#########################
+
+class Outbox:
+    """ Durable, append-only on-disk log of messages awaiting publication.
+        Messages are appended to segment files, & read back in order by a
+        flusher. A persisted cursor marks the first entry yet to be confirmed
+        by the broker; segments wholly before it are compacted away.
+
+        Delivery is at-least-once: entries published but not yet committed
+        when a process dies are republished upon restart.
+
+    Attributes:
+        directory (str): Directory holding segments & cursor
+        segment_size (int): Size (in bytes) beyond which segments roll over
+        sync (bool): Toggles if appends are fsync-ed to disk before returning.
+            If False, appends survive process crashes, but not power loss.
+    """
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = SEGMENT_SIZE,
+        sync: bool = False
+    ):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync = sync
+        os.makedirs(directory, exist_ok=True)
+
+        self._condition = threading.Condition()
+        self._cursor = self.__load_cursor()
+        self._read_position = self._cursor
+        self._pending = 0
+
+        segments = self.__list_segments()
+        self._active_segment = segments[-1] if segments else self._cursor[0]
+        self.__recover()
+        self._writer = open(self.__generate_path(self._active_segment), 'ab')
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __generate_path(self, segment: int) -> str:
+        """ Generates the path a segment is stored at """
+        return os.path.join(self.directory, f"{segment:020d}{SEGMENT_SUFFIX}")
+
+
+    def __list_segments(self) -> List[int]:
+        """ Lists the IDs of all segments in the outbox, in ascending order """
+        return sorted(
+            int(filename[:-len(SEGMENT_SUFFIX)])
+            for filename in os.listdir(self.directory)
+            if filename.endswith(SEGMENT_SUFFIX)
+        )
+
+
+    def __load_cursor(self) -> Tuple[int, int]:
+        """ Loads the position of the first uncommitted entry """
+        try:
+            with open(os.path.join(self.directory, CURSOR_FILENAME)) as cursor:
+                segment, offset = cursor.read().split()
+                return int(segment), int(offset)
+        except FileNotFoundError:
+            return 0, 0
+
+
+    def __save_cursor(self):
+        """ Atomically persists the position of the first uncommitted entry """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                tmp_file.write(f"{self._cursor[0]} {self._cursor[1]}")
+                if self.sync:
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, os.path.join(self.directory, CURSOR_FILENAME))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+    @staticmethod
+    def __pack_record(metadata: Dict[str, Any], message: bytes) -> bytes:
+        """ Packs a message & its metadata into a checksummed record """
+        metadata = json.dumps(metadata).encode()
+        data = metadata + message
+        return RECORD_HEADER.pack(len(metadata), len(message), zlib.crc32(data)) + data
+
+
+    @staticmethod
+    def __read_record(segment_file) -> Optional[Tuple[dict, bytes]]:
+        """ Reads the record at the current position of a segment file
+
+        Returns:
+            Metadata (dict) & message (bytes), or None if no complete & valid
+            record remains in the segment
+        """
+        header = segment_file.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return None
+
+        meta_length, body_length, checksum = RECORD_HEADER.unpack(header)
+        data = segment_file.read(meta_length + body_length)
+        if len(data) < meta_length + body_length or zlib.crc32(data) != checksum:
+            return None
+
+        return json.loads(data[:meta_length]), data[meta_length:]
+
+
+    def __recover(self):
+        """ Truncates records torn by a crash mid-append from the active
+            segment, & counts the entries that remain uncommitted
+        """
+        for segment in self.__list_segments():
+            if segment < self._cursor[0]:
+                continue
+
+            with open(self.__generate_path(segment), 'r+b') as segment_file:
+                valid_offset = self._cursor[1] if segment == self._cursor[0] else 0
+                segment_file.seek(valid_offset)
+
+                while self.__read_record(segment_file) is not None:
+                    self._pending += 1
+                    valid_offset = segment_file.tell()
+
+                if segment == self._active_segment:
+                    segment_file.truncate(valid_offset)
+
+
+    def __roll_over(self):
+        """ Closes the active segment & starts appending to a new one """
+        self._writer.close()
+        self._active_segment += 1
+        self._writer = open(self.__generate_path(self._active_segment), 'ab')
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def append(
+        self,
+        message: Union[str, bytes],
+        headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None,
+        release_at: Optional[float] = None,
+        message_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None
+    ):
+        """ Appends a message to the outbox. Returns once the message has
+            been handed over to the OS (or disk, if `sync` is enabled).
+
+        Args:
+            message (str/bytes): Message to be published
+            headers (dict): Headers to be attached to message, if any
+            priority (int): Delivery priority of message, if any
+            release_at (float): Unix timestamp to release message at, if any
+            message_id (str): Message ID of message, if any
+            content_type (str): Content type of message, if already encoded
+            content_encoding (str): Content encoding of message, if compressed
+        """
+        if isinstance(message, str):
+            message = message.encode()
+
+        record = self.__pack_record(
+            {
+                'headers': headers,
+                'priority': priority,
+                'release_at': release_at,
+                'message_id': message_id,
+                'content_type': content_type,
+                'content_encoding': content_encoding
+            },
+            message
+        )
+
+        with self._condition:
+            if self._writer.tell() >= self.segment_size:
+                self.__roll_over()
+
+            self._writer.write(record)
+            self._writer.flush()
+            if self.sync:
+                os.fsync(self._writer.fileno())
+
+            self._pending += 1
+            self._condition.notify_all()
+
+
+    def read(
+        self,
+        max_entries: int = FLUSH_BATCH_SIZE,
+        timeout: Optional[float] = None
+    ) -> List[OutboxEntry]:
+        """ Reads the next entries not yet handed out, waiting for new ones if
+            the outbox is drained
+
+        Args:
+            max_entries (int): Max no. of entries to read
+            timeout (float): Max time (in secs) to wait for new entries
+        Returns:
+            Entries, in order of appending (list(OutboxEntry))
+        """
+        entries = []
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._read_position < (self._active_segment, self._writer.tell()),
+                timeout=timeout
+            )
+
+            segment, offset = self._read_position
+            while len(entries) < max_entries and segment <= self._active_segment:
+                path = self.__generate_path(segment)
+                if os.path.exists(path):
+                    with open(path, 'rb') as segment_file:
+                        segment_file.seek(offset)
+                        while len(entries) < max_entries:
+                            record = self.__read_record(segment_file)
+                            if record is None:
+                                break
+                            metadata, message = record
+                            offset = segment_file.tell()
+                            entries.append(OutboxEntry(
+                                message=message,
+                                position=(segment, offset),
+                                **metadata
+                            ))
+
+                if len(entries) < max_entries and segment < self._active_segment:
+                    segment, offset = segment + 1, 0
+                else:
+                    break
+
+            self._read_position = (segment, offset)
+
+        return entries
+
+
+    def commit(self, position: Tuple[int, int], count: int):
+        """ Marks all entries up to a position as published, & compacts away
+            segments that no longer hold any uncommitted entries
+
+        Args:
+            position (tuple(int, int)): Position right after last entry
+                confirmed by the broker
+            count (int): No. of entries committed
+        """
+        with self._condition:
+            self._cursor = max(self._cursor, position)
+            self._pending = max(self._pending - count, 0)
+            self.__save_cursor()
+            self.compact()
+
+
+    def dead_letter(self, entry: OutboxEntry, error: str):
+        """ Sets aside an entry that cannot be published (e.g. one rejected
+            by the broker on every attempt) in the outbox's dead letter file,
+            & commits past it, so that it no longer holds up later entries
+
+        Args:
+            entry (OutboxEntry): First uncommitted entry
+            error (str): Reason for setting entry aside
+        """
+        metadata = entry._asdict()
+        metadata.pop('message')
+        metadata.pop('position')
+        record = self.__pack_record({**metadata, 'error': error}, entry.message)
+
+        with self._condition:
+            path = os.path.join(self.directory, DEAD_LETTER_FILENAME)
+            with open(path, 'ab') as dead_letters:
+                dead_letters.write(record)
+                dead_letters.flush()
+                if self.sync:
+                    os.fsync(dead_letters.fileno())
+
+            self.commit(entry.position, count=1)
+
+
+    def read_dead_letters(self) -> List[Tuple[OutboxEntry, str]]:
+        """ Reads back all entries set aside, for inspection or resubmission
+
+        Returns:
+            Entries, with their positions in the dead letter file, & the 
+            reasons they were set aside for (list(tuple(OutboxEntry, str)))
+        """
+        dead_letters = []
+        path = os.path.join(self.directory, DEAD_LETTER_FILENAME)
+        if not os.path.exists(path):
+            return dead_letters
+
+        with self._condition, open(path, 'rb') as dead_letter_file:
+            while True:
+                record = self.__read_record(dead_letter_file)
+                if record is None:
+                    break
+                metadata, message = record
+                error = metadata.pop('error')
+                dead_letters.append((
+                    OutboxEntry(
+                        message=message, 
+                        position=(0, dead_letter_file.tell()), 
+                        **metadata
+                    ),
+                    error
+                ))
+
+        return dead_letters
+
+
+    def rewind(self):
+        """ Hands out all uncommitted entries again on subsequent reads (e.g.
+            after a failed flush)
+        """
+        with self._condition:
+            self._read_position = self._cursor
+
+
+    def compact(self):
+        """ Deletes segments wholly before the cursor """
+        with self._condition:
+            for segment in self.__list_segments():
+                if segment < min(self._cursor[0], self._active_segment):
+                    os.remove(self.__generate_path(segment))
+
+
+    def count_pending(self) -> int:
+        """ Counts the entries yet to be confirmed by the broker
+
+        Returns:
+            No. of pending entries (int)
+        """
+        with self._condition:
+            return self._pending
+
+
+    def close(self):
+        """ Closes the active segment """
+        with self._condition:
+            self._writer.close()
+
+
+
+################################
+# Outbox Class - OutboxFlusher #
+################################
+
+class OutboxFlusher(threading.Thread):
+    """ Background thread draining an outbox to the broker via a dedicated
+        producer. Entries are published in windowed batches & only committed
+        once confirmed; failed flushes are retried with exponential backoff
+        until the broker becomes reachable again. Entries failing to publish
+        on every attempt (e.g. ones nacked by the broker, or exceeding its
+        max message size) are set aside in the outbox's dead letter file, 
+        rather than blocking all later entries.
+
+    Attributes:
+        outbox (Outbox): Outbox to be drained
+        operator (ProducerOperator): Producer to publish entries with. This
+            must not be used by any other thread.
+        batch_size (int): Max no. of entries published per batch
+        poll_interval (float): Max time (in secs) to wait for new entries
+        max_backoff (float): Max time (in secs) between reconnections
+        max_attempts (int): Max no. of failed flushes of an entry before it
+            is set aside. If None, entries are retried indefinitely.
+    """
+    def __init__(
+        self,
+        outbox: Outbox,
+        operator,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        poll_interval: float = FLUSH_POLL_INTERVAL,
+        max_backoff: float = FLUSH_MAX_BACKOFF,
+        max_attempts: Optional[int] = FLUSH_MAX_ATTEMPTS
+    ):
+        super().__init__(name=f"OutboxFlusher-{operator.routing_key}", daemon=True)
+        self.outbox = outbox
+        self.operator = operator
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+
+        self._stop_event = threading.Event()
+        self._failed_position = None    # position of entry failing to publish
+        self._failed_attempts = 0       # no. of failed flushes of that entry
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __record_failure(self, entry: OutboxEntry, error: str):
+        """ Counts a failed flush of the first uncommitted entry, setting it
+            aside once it has failed too often
+        """
+        if entry.position != self._failed_position:
+            self._failed_position = entry.position
+            self._failed_attempts = 0
+        self._failed_attempts += 1
+
+        if self.max_attempts is not None and self._failed_attempts >= self.max_attempts:
+            logging.error(
+                f"Outbox entry {entry.message_id} failed to publish "
+                f"{self._failed_attempts} times & was set aside. Error: {error}"
+            )
+            self.outbox.dead_letter(entry, error)
+            self._failed_position = None
+            self._failed_attempts = 0
+
+
+    def __flush(self) -> bool:
+        """ Publishes the next batch of entries, committing those confirmed
+
+        Returns:
+            True    if all entries read were confirmed
+            False   otherwise
+        """
+        entries = self.outbox.read(self.batch_size, timeout=self.poll_interval)
+        if not entries:
+            return True
+
+        if not self.operator.is_connected():
+            self.operator.connect()
+
+        # Only failures while connected count towards an entry's attempts, 
+        # so that entries are never set aside over a broker outage
+        try:
+            confirmations = self.operator.publish_batch(
+                (entry.message, entry.create_delivery_kwargs()) for entry in entries
+            )
+        except (pika.exceptions.AMQPError, OSError) as e:
+            self.__record_failure(entries[0], repr(e))
+            raise
+
+        confirmed_count = 0
+        for is_confirmed in confirmations:
+            if not is_confirmed:
+                break
+            confirmed_count += 1
+
+        if confirmed_count:
+            self.outbox.commit(entries[confirmed_count-1].position, confirmed_count)
+
+        if confirmed_count < len(entries):
+            self.__record_failure(entries[confirmed_count], "Publish was not confirmed")
+            return False
+
+        return True
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def run(self):
+        """ Drains the outbox until stopped """
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                is_flushed = self.__flush()
+
+            except (pika.exceptions.AMQPError, OSError) as e:
+                logging.warning(f"Outbox flush failed. Error: {e}")
+                try:
+                    self.operator.disconnect()
+                except (pika.exceptions.AMQPError, OSError):
+                    self.operator.channel = None
+                    self.operator.connection = None
+                is_flushed = False
+
+            if is_flushed:
+                backoff = 1
+            else:
+                self.outbox.rewind()
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+        if self.operator.is_connected():
+            self.operator.disconnect()
+
+
+    def stop(self, timeout: Optional[float] = None):
+        """ Stops draining the outbox after the current batch
+
+        Args:
+            timeout (float): Max time (in secs) to wait for flusher to stop
+        """
+        self._stop_event.set()
+        self.join(timeout)
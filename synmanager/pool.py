@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+# Libs
+import pika
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+logging.getLogger("pika").setLevel(logging.WARNING) # reduce log level
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.DEBUG)
+
+IDLE_TIMEOUT = 300          # secs an unleased connection is kept alive for
+HEALTH_CHECK_INTERVAL = 30  # secs between liveness checks on a connection
+
+#######################################
+# Pool Entry Class - PooledConnection #
+#######################################
+
+class PooledConnection:
+    """ Book-keeping record of a single connection managed by a pool
+
+    Attributes:
+        connection (pika.BlockingConnection): Shared connection
+        leases (int): No. of operators currently using the connection
+        last_released (float): Time at which the connection was last idle
+        last_checked (float): Time at which the connection was last verified
+    """
+    def __init__(self, connection: pika.BlockingConnection):
+        self.connection = connection
+        self.leases = 0
+        self.last_released = time.monotonic()
+        self.last_checked = time.monotonic()
+
+    ############
+    # Checkers #
+    ############
+
+    def is_healthy(self) -> bool:
+        """ Checks if connection is still alive, servicing any pending frames
+            (e.g. heartbeats) in the process
+
+        Returns:
+            True    if connection is usable
+            False   otherwise
+        """
+        if not self.connection.is_open:
+            return False
+
+        try:
+            self.connection.process_data_events(time_limit=0)
+        except pika.exceptions.AMQPError:
+            return False
+
+        self.last_checked = time.monotonic()
+        return True
+
+###############################
+# Pool Class - ConnectionPool #
+###############################
+
+class ConnectionPool:
+    """ Pool of broker connections keyed by (host, port, vhost) & connection
+        parameters. Operators lease a shared connection & multiplex their own
+        channels over it, such that connecting an operator only costs a 
+        channel open instead of a full AMQP handshake.
+
+        Since `pika.BlockingConnection` is not thread-safe, connections are
+        never shared across threads; while a pool may be used process-wide,
+        each thread is given its own connection per (host, port, vhost), & 
+        only operators connecting from the same thread share one. Operators
+        asking for different connection parameters (e.g. consumers requiring
+        heartbeats, & producers disabling them) are never given the same
+        connection. Connections are also never shared across forked 
+        processes.
+
+    Attributes:
+        idle_timeout (float): Max time (in secs) an unleased connection is
+            kept before it is closed
+        health_check_interval (float): Min time (in secs) between liveness
+            checks on a leased connection
+    """
+    def __init__(
+        self,
+        idle_timeout: float = IDLE_TIMEOUT,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL
+    ):
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        self._entries: Dict[Tuple, PooledConnection] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    ###########
+    # Helpers #
+    ###########
+
+    @staticmethod
+    def __generate_key(
+        host: str, 
+        port: int, 
+        virtual_host: str, 
+        parameters: Dict[str, Any]
+    ) -> Tuple:
+        """ Generates the key under which a connection is pooled for the
+            current thread
+        """
+        return (
+            host, 
+            int(port), 
+            virtual_host, 
+            tuple(sorted(parameters.items())), 
+            threading.get_ident()
+        )
+
+
+    def __reset_after_fork(self):
+        """ Drops all connections inherited from a parent process, since
+            sockets cannot be shared across forks
+        """
+        if self._pid != os.getpid():
+            self._entries = {}
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+
+    def __find(self, connection: pika.BlockingConnection) -> Tuple:
+        """ Retrieves the key of a pooled connection """
+        for key, entry in self._entries.items():
+            if entry.connection is connection:
+                return key
+        raise KeyError(f"Connection {connection} is not managed by this pool!")
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def acquire(
+        self,
+        host: str,
+        port: int,
+        virtual_host: str = '/',
+        **parameters
+    ) -> pika.BlockingConnection:
+        """ Leases a healthy connection to the specified broker, opening a new
+            one only if none exists in the pool
+
+        Args:
+            host (str): Address where queue is hosted on
+            port (int): Port where queue is hosted on
+            virtual_host (str): Virtual host to connect to
+            **parameters: Other connection parameters (e.g. heartbeat). These
+                must be hashable, as connections are only shared between 
+                operators asking for the same parameters.
+        Returns:
+            Shared connection (pika.BlockingConnection)
+        """
+        self.__reset_after_fork()
+        self.evict_idle()
+
+        key = self.__generate_key(host, port, virtual_host, parameters)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        # Closed connections are detected on every lease, while open ones are
+        # only probed for silent failures once per interval
+        is_stale = (
+            entry is not None and
+            time.monotonic() - entry.last_checked > self.health_check_interval
+        )
+        is_dead = entry is not None and (
+            not entry.connection.is_open or 
+            (is_stale and not entry.is_healthy())
+        )
+        if is_dead:
+            logging.info(f"Pooled connection to {key[:3]} is dead. Reconnecting...")
+            with self._lock:
+                self._entries.pop(key, None)
+            entry = None
+
+        if entry is None:
+            connection = pika.BlockingConnection(
+                pika.ConnectionParameters(
+                    host=host,
+                    port=port,
+                    virtual_host=virtual_host,
+                    **parameters
+                )
+            )
+            entry = PooledConnection(connection)
+            with self._lock:
+                self._entries[key] = entry
+
+        entry.leases += 1
+        return entry.connection
+
+
+    def release(self, connection: pika.BlockingConnection):
+        """ Returns a leased connection to the pool. The connection is kept
+            open for reuse until it has been idle for longer than the pool's
+            idle timeout.
+
+        Args:
+            connection (pika.BlockingConnection): Connection to be released
+        """
+        self.__reset_after_fork()
+
+        with self._lock:
+            try:
+                key = self.__find(connection)
+            except KeyError:
+                return
+
+            entry = self._entries[key]
+            entry.leases = max(entry.leases - 1, 0)
+            if entry.leases == 0:
+                entry.last_released = time.monotonic()
+
+            if not connection.is_open:
+                self._entries.pop(key)
+
+        self.evict_idle()
+
+
+    def evict_idle(self):
+        """ Closes connections owned by the current thread that have not been
+            leased for longer than the idle timeout
+        """
+        now = time.monotonic()
+        thread_id = threading.get_ident()
+        with self._lock:
+            evicted = {
+                key: entry
+                for key, entry in self._entries.items()
+                if key[-1] == thread_id and entry.leases == 0 and
+                now - entry.last_released > self.idle_timeout
+            }
+            for key in evicted:
+                self._entries.pop(key)
+
+        for key, entry in evicted.items():
+            logging.info(f"Evicting idle pooled connection to {key[:3]}")
+            if entry.connection.is_open:
+                entry.connection.close()
+
+
+    def close(self):
+        """ Closes all unleased connections owned by the current thread """
+        thread_id = threading.get_ident()
+        with self._lock:
+            closed = {
+                key: entry
+                for key, entry in self._entries.items()
+                if key[-1] == thread_id and entry.leases == 0
+            }
+            for key in closed:
+                self._entries.pop(key)
+
+        for entry in closed.values():
+            if entry.connection.is_open:
+                entry.connection.close()
+
+#############
+# Functions #
+#############
+
+_default_pool = None
+
+def get_pool() -> ConnectionPool:
+    """ Retrieves the process-wide connection pool, creating it if necessary
+
+    Returns:
+        Default connection pool (ConnectionPool)
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = ConnectionPool()
+    return _default_pool
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import math
+import statistics
+import threading
+import time
+from typing import Optional
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+PREFETCH_WINDOW = 50            # no. of recent deliveries observed
+MAX_BUFFERED_TIME = 30.0        # max secs of work held per consumer slot
+ADJUST_INTERVAL = 5.0           # min secs between prefetch adjustments
+ADJUST_TOLERANCE = 0.25         # min relative change warranting adjustment
+STARVATION_THRESHOLD = 0.001    # min secs idle before a consumer is starved
+
+#####################################
+# Prefetch Class - AdaptivePrefetch #
+#####################################
+
+class AdaptivePrefetch:
+    """ Derives the QoS prefetch count of a consumer from its observed
+        processing times & delivery round trips. Prefetching hides the round
+        trip between acknowledging a job & receiving the next one, so the
+        prefetch count is sized to keep every consumer slot busy across it:
+
+            prefetch = concurrency x (1 + round trip / processing time)
+
+        while capping the work held by a single consumer at
+        `max_buffered_time` secs per slot, so that slow jobs (e.g. training)
+        remain evenly spread across consumers.
+
+        Round trips are observed as the time a consumer sits idle between
+        completing all its jobs & receiving the next delivery.
+
+    Attributes:
+        min_prefetch (int): Lower bound of prefetch count
+        max_prefetch (int): Upper bound of prefetch count
+        window (int): No. of recent deliveries to base estimates on
+        max_buffered_time (float): Max secs of work prefetched per slot
+        adjust_interval (float): Min secs between adjustments
+        tolerance (float): Min relative change in prefetch count to apply
+        prefetch_count (int): Prefetch count currently applied
+    """
+    def __init__(
+        self,
+        min_prefetch: int = 1,
+        max_prefetch: int = 100,
+        window: int = PREFETCH_WINDOW,
+        max_buffered_time: float = MAX_BUFFERED_TIME,
+        adjust_interval: float = ADJUST_INTERVAL,
+        tolerance: float = ADJUST_TOLERANCE
+    ):
+        if not 1 <= min_prefetch <= max_prefetch:
+            raise ValueError(
+                f"Invalid prefetch bounds! Got [{min_prefetch}, {max_prefetch}]"
+            )
+
+        self.min_prefetch = min_prefetch
+        self.max_prefetch = max_prefetch
+        self.window = window
+        self.max_buffered_time = max_buffered_time
+        self.adjust_interval = adjust_interval
+        self.tolerance = tolerance
+        self.prefetch_count = min_prefetch
+
+        self._processing_times = collections.deque(maxlen=window)
+        self._round_trips = collections.deque(maxlen=window)
+        self._in_flight = 0
+        self._idle_since = None
+        self._adjusted_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __clamp(self, prefetch_count: int) -> int:
+        """ Restricts a prefetch count to the configured bounds """
+        return max(self.min_prefetch, min(prefetch_count, self.max_prefetch))
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def reset(self, concurrency: int = 1) -> int:
+        """ Restarts observation for a new consumer, e.g. on `listen_message`
+
+        Args:
+            concurrency (int): No. of jobs processed at once by consumer
+        Returns:
+            Initial prefetch count (int)
+        """
+        with self._lock:
+            self._in_flight = 0
+            self._idle_since = None
+            self._adjusted_at = time.monotonic()
+            self.prefetch_count = self.__clamp(concurrency)
+            return self.prefetch_count
+
+
+    def record_arrival(self):
+        """ Records the receipt of a delivery """
+        now = time.monotonic()
+        with self._lock:
+            if self._in_flight == 0 and self._idle_since is not None:
+                idle_time = now - self._idle_since
+                if idle_time > STARVATION_THRESHOLD:
+                    self._round_trips.append(idle_time)
+            self._in_flight += 1
+            self._idle_since = None
+
+
+    def record_completion(self, processing_time: float):
+        """ Records the completion of a delivery
+
+        Args:
+            processing_time (float): Secs taken to process & settle delivery
+        """
+        with self._lock:
+            self._processing_times.append(processing_time)
+            self._in_flight = max(0, self._in_flight - 1)
+            if self._in_flight == 0:
+                self._idle_since = time.monotonic()
+
+
+    def get_target(self, concurrency: int = 1) -> int:
+        """ Estimates the ideal prefetch count from recent deliveries
+
+        Args:
+            concurrency (int): No. of jobs processed at once by consumer
+        Returns:
+            Prefetch count (int)
+        """
+        with self._lock:
+            if not self._processing_times:
+                return self.__clamp(concurrency)
+
+            processing_time = max(statistics.median(self._processing_times), 1e-6)
+            round_trip = (
+                statistics.median(self._round_trips)
+                if self._round_trips else 0.0
+            )
+
+        target = math.ceil(concurrency * (1 + round_trip / processing_time))
+        buffer_limit = concurrency * max(
+            1, math.floor(self.max_buffered_time / processing_time)
+        )
+        return self.__clamp(min(target, buffer_limit))
+
+
+    def update(self, concurrency: int = 1) -> Optional[int]:
+        """ Decides if the prefetch count should be adjusted. Adjustments are
+            rate limited & only made on significant changes, since each one
+            costs a round trip to the broker.
+
+        Args:
+            concurrency (int): No. of jobs processed at once by consumer
+        Returns:
+            New prefetch count (int), or None if it is to be left unchanged
+        """
+        now = time.monotonic()
+        if now - self._adjusted_at < self.adjust_interval:
+            return None
+
+        target = self.get_target(concurrency)
+        with self._lock:
+            self._adjusted_at = now
+            change = abs(target - self.prefetch_count) / self.prefetch_count
+            if target == self.prefetch_count or change < self.tolerance:
+                return None
+
+            self.prefetch_count = target
+            return target
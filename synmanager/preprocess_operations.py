@@ -13,7 +13,8 @@ from typing import Dict
 
 # Custom
 from .base import ProducerOperator, ConsumerOperator
-from .config import PREPROCESS_ROUTING_KEY, PREPROCESS_QUEUE
+from .async_base import AsyncProducerOperator, AsyncConsumerOperator
+from .config import MAX_PRIORITY, PREPROCESS_ROUTING_KEY, PREPROCESS_QUEUE
 
 ##################
 # Configurations #
@@ -39,6 +40,8 @@ class PreprocessProducerOperator(ProducerOperator):
 
         # Network attributes
         self.routing_key = PREPROCESS_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = PREPROCESS_QUEUE
 
         # Data attributes
     
@@ -86,6 +89,7 @@ class PreprocessConsumerOperator(ConsumerOperator):
 
         # Network attributes
         self.routing_key = PREPROCESS_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
         self.queue = PREPROCESS_QUEUE
 
         # Data attributes
@@ -112,4 +116,43 @@ class PreprocessConsumerOperator(ConsumerOperator):
 
     ##################
     # Core Functions #
-    ##################
\ No newline at end of file
+    ##################
+
+
+
+##############################################################################
+# Async Preprocess producer operator Class - AsyncPreprocessProducerOperator #
+##############################################################################
+
+class AsyncPreprocessProducerOperator(AsyncProducerOperator):
+    """ 
+    Contains management functionality for handling asynchronous preprocessing 
+    job submissions to the "Preprocess" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = PREPROCESS_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+
+
+
+##############################################################################
+# Async Preprocess consumer operator Class - AsyncPreprocessConsumerOperator #
+##############################################################################
+
+class AsyncPreprocessConsumerOperator(AsyncConsumerOperator):
+    """ 
+    Contains management functionality for handling asynchronous preprocessing 
+    job consumptions from the "Preprocess" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = PREPROCESS_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = PREPROCESS_QUEUE
\ No newline at end of file
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import bisect
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Libs
+
+
+# Custom
+from .config import MAX_PRIORITY
+
+##################
+# Configurations #
+##################
+
+# Cheaper jobs (in rounds x epochs) are prioritised over expensive ones
+COST_THRESHOLDS = (10, 100, 1000)
+COST_PRIORITIES = (8, 6, 4, 2)
+
+#############
+# Functions #
+#############
+
+def clamp_priority(
+    priority: Optional[int],
+    max_priority: Optional[int] = MAX_PRIORITY
+) -> Optional[int]:
+    """ Restricts a priority to the range supported by a queue. Brokers treat
+        priorities above `x-max-priority` as the max priority anyway, but
+        negative priorities are rejected by the AMQP codec.
+
+    Args:
+        priority (int): Priority to be restricted
+        max_priority (int): Max priority of queue. If None, priorities are
+            unsupported & dropped.
+    Returns:
+        Priority (int/None)
+    """
+    if priority is None or max_priority is None:
+        return None
+    return max(0, min(int(priority), max_priority))
+
+
+def estimate_job_cost(run_kwarg: Dict[str, Any]) -> float:
+    """ Estimates the cost of a job from the run record it carries, as the
+        total no. of local epochs trained across all federated rounds
+
+    Args:
+        run_kwarg (dict): Job configurations
+    Returns:
+        Estimated cost (float)
+    """
+    params = run_kwarg.get('combination_params', run_kwarg)
+    run_record = params.get('run') or {}
+    return run_record.get('rounds', 1) * run_record.get('epochs', 1)
+
+#######################################
+# Priority Class - BasePriorityPolicy #
+#######################################
+
+class BasePriorityPolicy:
+    """ Contains baseline functionality for mapping jobs to their delivery
+        priorities. Policies are callables, & can be assigned directly to a
+        producer's `priority_policy`.
+
+        Priorities only order jobs within a single queue. Since every phase
+        has a queue of its own, jobs are prioritised against other jobs of
+        the same phase (e.g. by user tier or cost), & never across phases.
+    """
+    def __call__(self, run_kwarg: Dict[str, Any]) -> Optional[int]:
+        return self.get_priority(run_kwarg)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def get_priority(self, run_kwarg: Dict[str, Any]) -> Optional[int]:
+        """ Maps a job to its delivery priority
+
+        Args:
+            run_kwarg (dict): Job configurations
+        Returns:
+            Priority (int) or None, if job is to be sent without priority
+        """
+        raise NotImplementedError
+
+
+
+#######################################
+# Priority Class - TierPriorityPolicy #
+#######################################
+
+class TierPriorityPolicy(BasePriorityPolicy):
+    """ Prioritises jobs by the tier of the user submitting them
+
+    Attributes:
+        tiers (dict): User tiers mapped to their priorities
+        field (str): Name of job field declaring the user tier
+        default (int): Priority of jobs without a recognised tier
+    """
+    def __init__(
+        self,
+        tiers: Dict[str, int],
+        field: str = 'tier',
+        default: Optional[int] = None
+    ):
+        self.tiers = dict(tiers)
+        self.field = field
+        self.default = default
+
+    def get_priority(self, run_kwarg: Dict[str, Any]) -> Optional[int]:
+        return self.tiers.get(run_kwarg.get(self.field), self.default)
+
+
+
+#######################################
+# Priority Class - CostPriorityPolicy #
+#######################################
+
+class CostPriorityPolicy(BasePriorityPolicy):
+    """ Prioritises jobs by their estimated cost, so that short jobs are not
+        starved by expensive ones queued before them
+
+    Attributes:
+        estimator (Callable): Function estimating the cost of a job
+        thresholds (tuple(float)): Ascending cost boundaries between bands
+        priorities (tuple(int)): Priority of each band; must have one more
+            entry than `thresholds`
+    """
+    def __init__(
+        self,
+        estimator: Callable[[Dict[str, Any]], float] = estimate_job_cost,
+        thresholds: Iterable[float] = COST_THRESHOLDS,
+        priorities: Iterable[int] = COST_PRIORITIES
+    ):
+        self.estimator = estimator
+        self.thresholds = tuple(thresholds)
+        self.priorities = tuple(priorities)
+
+        if len(self.priorities) != len(self.thresholds) + 1:
+            raise ValueError(
+                f"Expected {len(self.thresholds) + 1} priorities for "
+                f"{len(self.thresholds)} thresholds! Got {len(self.priorities)}"
+            )
+
+    def get_priority(self, run_kwarg: Dict[str, Any]) -> Optional[int]:
+        cost = self.estimator(run_kwarg)
+        return self.priorities[bisect.bisect_left(self.thresholds, cost)]
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import random
+from typing import Any, Dict, Optional
+
+# Libs
+import pika
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+RECONNECT_ATTEMPTS = 10
+RECONNECT_BASE_DELAY = 0.5  # secs; backoff before the 1st reconnection
+RECONNECT_MAX_DELAY = 30    # secs; upper bound of backoff
+
+# Errors signalling that a connection or channel has to be reopened
+RECOVERABLE_ERRORS = (
+    pika.exceptions.AMQPConnectionError,
+    pika.exceptions.ChannelClosedByBroker,
+    pika.exceptions.ChannelWrongStateError,
+    pika.exceptions.ConnectionWrongStateError
+)
+
+#############
+# Functions #
+#############
+
+def calculate_backoff(
+    attempt: int,
+    base_delay: float = RECONNECT_BASE_DELAY,
+    max_delay: float = RECONNECT_MAX_DELAY
+) -> float:
+    """ Calculates the delay before a reconnection attempt, as exponential
+        backoff with full jitter. Jitter spreads out the reconnections of
+        operators that lost their connections at the same time (e.g. on a
+        broker restart), so that they do not stampede the broker together.
+
+    Args:
+        attempt (int): No. of reconnection attempt, starting from 1
+        base_delay (float): Backoff (in secs) before the 1st attempt
+        max_delay (float): Upper bound of backoff (in secs)
+    Returns:
+        Delay (in secs) (float)
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+###################################
+# Recovery Class - TopologyRecord #
+###################################
+
+class TopologyRecord:
+    """ In-memory record of the topology declared by an operator (i.e. its
+        exchanges, queues, bindings, QoS & consumers), which is replayed onto
+        a fresh channel after reconnecting. Since declarations are idempotent,
+        only the latest declaration of each entity is kept.
+
+    Attributes:
+        exchanges (OrderedDict): Exchange names mapped to their declarations
+        queues (OrderedDict): Queue names mapped to their declarations
+        bindings (OrderedDict): (queue, exchange, routing key) mapped to their
+            bindings
+        qos (dict): Latest QoS settings, if any
+        consumers (OrderedDict): Consumer tags mapped to their subscriptions
+    """
+    def __init__(self):
+        self.exchanges = collections.OrderedDict()
+        self.queues = collections.OrderedDict()
+        self.bindings = collections.OrderedDict()
+        self.qos = None
+        self.consumers = collections.OrderedDict()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def forget_queue(self, queue: str):
+        """ Removes a deleted queue, together with its bindings & consumers """
+        self.queues.pop(queue, None)
+        for binding in [binding for binding in self.bindings if binding[0] == queue]:
+            self.bindings.pop(binding)
+        for consumer_tag, subscription in list(self.consumers.items()):
+            if subscription['queue'] == queue:
+                self.consumers.pop(consumer_tag)
+
+
+    def replay(self, channel: pika.adapters.blocking_connection.BlockingChannel):
+        """ Redeclares all recorded entities in dependency order, & resumes
+            all recorded consumers
+
+        Args:
+            channel (BlockingChannel): Freshly opened channel
+        """
+        for declaration in self.exchanges.values():
+            channel.exchange_declare(**declaration)
+
+        for declaration in self.queues.values():
+            channel.queue_declare(**declaration)
+
+        for binding in self.bindings.values():
+            channel.queue_bind(**binding)
+
+        if self.qos:
+            channel.basic_qos(**self.qos)
+
+        # Consumers are issued new tags, unless they specified their own
+        consumers = collections.OrderedDict()
+        for subscription in self.consumers.values():
+            consumer_tag = channel.basic_consume(**subscription)
+            consumers[consumer_tag] = subscription
+        self.consumers = consumers
+
+
+    def clear(self):
+        """ Forgets all recorded entities """
+        self.__init__()
+
+
+
+#####################################
+# Recovery Class - RecordingChannel #
+#####################################
+
+class RecordingChannel:
+    """ Proxy of a blocking channel that records every topology declaration
+        made over it into a `TopologyRecord`. All other operations are passed
+        straight through to the channel.
+
+    Attributes:
+        channel (BlockingChannel): Channel being proxied
+        topology (TopologyRecord): Record to be updated
+    """
+    def __init__(
+        self,
+        channel: pika.adapters.blocking_connection.BlockingChannel,
+        topology: TopologyRecord
+    ):
+        self.channel = channel
+        self.topology = topology
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.channel, name)
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def exchange_declare(self, exchange: str, **kwargs):
+        """ Declares & records an exchange """
+        result = self.channel.exchange_declare(exchange, **kwargs)
+        if not kwargs.get('passive'):
+            self.topology.exchanges[exchange] = {'exchange': exchange, **kwargs}
+        return result
+
+
+    def queue_declare(self, queue: str, **kwargs):
+        """ Declares & records a queue """
+        result = self.channel.queue_declare(queue, **kwargs)
+        if not kwargs.get('passive'):
+            self.topology.queues[queue] = {'queue': queue, **kwargs}
+        return result
+
+
+    def queue_delete(self, queue: str, **kwargs):
+        """ Deletes & forgets a queue """
+        result = self.channel.queue_delete(queue, **kwargs)
+        self.topology.forget_queue(queue)
+        return result
+
+
+    def queue_bind(
+        self,
+        queue: str,
+        exchange: str,
+        routing_key: Optional[str] = None,
+        arguments: Optional[Dict[str, Any]] = None
+    ):
+        """ Binds & records a queue binding """
+        result = self.channel.queue_bind(
+            queue=queue,
+            exchange=exchange,
+            routing_key=routing_key,
+            arguments=arguments
+        )
+        self.topology.bindings[(queue, exchange, routing_key)] = {
+            'queue': queue,
+            'exchange': exchange,
+            'routing_key': routing_key,
+            'arguments': arguments
+        }
+        return result
+
+
+    def basic_qos(self, **kwargs):
+        """ Applies & records QoS settings """
+        result = self.channel.basic_qos(**kwargs)
+        self.topology.qos = kwargs
+        return result
+
+
+    def basic_consume(self, queue: str, on_message_callback, **kwargs) -> str:
+        """ Subscribes & records a consumer """
+        consumer_tag = self.channel.basic_consume(queue, on_message_callback, **kwargs)
+        self.topology.consumers[consumer_tag] = {
+            'queue': queue,
+            'on_message_callback': on_message_callback,
+            **kwargs
+        }
+        return consumer_tag
+
+
+    def basic_cancel(self, consumer_tag: str):
+        """ Cancels & forgets a consumer """
+        self.topology.consumers.pop(consumer_tag, None)
+        return self.channel.basic_cancel(consumer_tag)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import math
+from typing import Any, Dict
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+ATTEMPT_HEADER = 'x-attempt'    # no. of failed attempts at processing a job
+ERROR_HEADER = 'x-last-error'   # error raised by the last failed attempt
+ERROR_PREVIEW_SIZE = 256        # max no. of characters of errors kept
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 5            # secs before the 1st retry
+RETRY_MULTIPLIER = 2
+RETRY_MAX_DELAY = 15 * 60       # secs; upper bound of backoff
+
+#############
+# Functions #
+#############
+
+def clear_retry_headers(headers: Dict[str, Any]) -> Dict[str, Any]:
+    """ Resets the attempts recorded in the headers of a job, e.g. when it is
+        replayed from quarantine
+
+    Args:
+        headers (dict): Headers of job
+    Returns:
+        Headers without retry records (dict)
+    """
+    return {
+        name: value
+        for name, value in headers.items()
+        if name not in (ATTEMPT_HEADER, ERROR_HEADER)
+    }
+
+#############################
+# Retry Class - RetryPolicy #
+#############################
+
+class RetryPolicy:
+    """ Schedules the retries of failed jobs with exponential backoff. Rather
+        than being requeued at the head of their queue, failed jobs are parked
+        in a retry queue for their backoff level, whose TTL dead-letters them
+        back into the original queue. Jobs failing all their attempts are
+        quarantined in a separate queue for inspection.
+
+    Attributes:
+        max_attempts (int): Max no. of attempts at processing a job before it
+            is quarantined
+        base_delay (float): Delay (in secs) before the 1st retry
+        multiplier (float): Growth factor of delays between retries
+        max_delay (float): Upper bound of delays (in secs)
+    """
+    def __init__(
+        self,
+        max_attempts: int = MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        multiplier: float = RETRY_MULTIPLIER,
+        max_delay: float = RETRY_MAX_DELAY
+    ):
+        if max_attempts < 1:
+            raise ValueError(f"Max attempts must be at least 1! Got {max_attempts}")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+
+    ############
+    # Checkers #
+    ############
+
+    def is_exhausted(self, attempt: int) -> bool:
+        """ Checks if a job has used up all of its attempts
+
+        Args:
+            attempt (int): No. of failed attempts so far
+        Returns:
+            True    if job is to be quarantined
+            False   otherwise
+        """
+        return attempt >= self.max_attempts
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def get_delay(self, attempt: int) -> float:
+        """ Calculates the delay before retrying a job
+
+        Args:
+            attempt (int): No. of failed attempts so far
+        Returns:
+            Delay (in secs) (float)
+        """
+        delay = self.base_delay * self.multiplier ** max(0, attempt - 1)
+        return min(delay, self.max_delay)
+
+
+    def get_retry_queue(self, queue: str, attempt: int) -> str:
+        """ Names the retry queue holding jobs of a queue after a failed attempt
+
+        Args:
+            queue (str): Name of queue that job was consumed from
+            attempt (int): No. of failed attempts so far
+        Returns:
+            Name of retry queue (str)
+        """
+        ttl = int(math.ceil(self.get_delay(attempt) * 1000))  # in ms
+        return f"{queue}.retry.{ttl}"
+
+
+    def get_quarantine_queue(self, queue: str) -> str:
+        """ Names the queue holding jobs of a queue that exhausted their attempts
+
+        Args:
+            queue (str): Name of queue that job was consumed from
+        Returns:
+            Name of quarantine queue (str)
+        """
+        return f"{queue}.quarantine"
+
+
+    def get_retry_queues(self, queue: str) -> Dict[str, Dict[str, Any]]:
+        """ Lists all retry queues of a queue, together with their arguments
+
+        Args:
+            queue (str): Name of queue that jobs are consumed from
+        Returns:
+            Retry queues mapped to their arguments (dict)
+        """
+        retry_queues = {}
+        for attempt in range(1, self.max_attempts):
+            retry_queue = self.get_retry_queue(queue, attempt)
+            retry_queues[retry_queue] = {
+                'x-message-ttl': int(math.ceil(self.get_delay(attempt) * 1000)),
+                'x-dead-letter-exchange': '',       # default exchange
+                'x-dead-letter-routing-key': queue
+            }
+        return retry_queues
+
+
+    def create_headers(
+        self,
+        headers: Dict[str, Any],
+        error: Exception
+    ) -> Dict[str, Any]:
+        """ Records a failed attempt in the headers of a job
+
+        Args:
+            headers (dict): Current headers of job
+            error (Exception): Error raised by failed attempt
+        Returns:
+            Updated headers (dict)
+        """
+        attempt = int(headers.get(ATTEMPT_HEADER, 0)) + 1
+        return {
+            **headers,
+            ATTEMPT_HEADER: attempt,
+            ERROR_HEADER: f"{type(error).__name__}: {error}"[:ERROR_PREVIEW_SIZE]
+        }
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+from typing import Any, Dict, Optional, Union
+
+# Libs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+JSON_CONTENT_TYPE = 'application/json'
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+DEFAULT_CODEC = 'json'
+
+###########################
+# Codec Class - BaseCodec #
+###########################
+
+class BaseCodec:
+    """ Contains baseline functionality for converting job payloads to & from
+        their wire representations
+
+    Attributes:
+        name (str): Name under which codec is registered
+        content_type (str): MIME type advertised via AMQP `content_type`
+        is_binary (bool): Toggles if encoded payloads are not valid text
+    """
+    name = None
+    content_type = None
+    is_binary = False
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def encode(self, payload: Any) -> Union[str, bytes]:
+        """ Serialises a payload
+
+        Args:
+            payload (Any): Job payload
+        Returns:
+            Encoded payload (str/bytes)
+        """
+        raise NotImplementedError
+
+
+    def decode(self, payload: Union[str, bytes, memoryview]) -> Any:
+        """ Deserialises a payload
+
+        Args:
+            payload (str/bytes/memoryview): Encoded payload
+        Returns:
+            Job payload (Any)
+        """
+        raise NotImplementedError
+
+
+
+###########################
+# Codec Class - JsonCodec #
+###########################
+
+class JsonCodec(BaseCodec):
+    """ Canonical JSON (i.e. sorted keys) via the standard library. Values
+        that are not JSON serialisable are stringified.
+    """
+    name = 'json'
+    content_type = JSON_CONTENT_TYPE
+
+    def encode(self, payload: Any) -> str:
+        return json.dumps(payload, default=str, sort_keys=True)
+
+
+    def decode(self, payload: Union[str, bytes, memoryview]) -> Any:
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        return json.loads(payload)
+
+
+
+#############################
+# Codec Class - OrjsonCodec #
+#############################
+
+class OrjsonCodec(BaseCodec):
+    """ Canonical JSON (i.e. sorted keys) via `orjson`, if installed. Output is
+        compact (i.e. no whitespace), but remains decodable as plain JSON.
+        Payloads rejected by `orjson` but accepted by the standard library 
+        (e.g. NaN, or integers wider than 64 bits) are decoded by the latter.
+    """
+    name = 'orjson'
+    content_type = JSON_CONTENT_TYPE
+
+    def encode(self, payload: Any) -> bytes:
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+
+
+    def decode(self, payload: Union[str, bytes, memoryview]) -> Any:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            if isinstance(payload, memoryview):
+                payload = payload.tobytes()
+            return json.loads(payload)
+
+
+
+##############################
+# Codec Class - MsgpackCodec #
+##############################
+
+class MsgpackCodec(BaseCodec):
+    """ Compact binary encoding via `msgpack`, if installed. Tuples are
+        decoded as lists, mirroring the JSON codecs.
+    """
+    name = 'msgpack'
+    content_type = MSGPACK_CONTENT_TYPE
+    is_binary = True
+
+    def encode(self, payload: Any) -> bytes:
+        return msgpack.packb(payload, default=str, use_bin_type=True)
+
+
+    def decode(self, payload: Union[str, bytes, memoryview]) -> Any:
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+#############
+# Functions #
+#############
+
+CODECS: Dict[str, BaseCodec] = {}
+DECODERS: Dict[str, BaseCodec] = {}
+
+
+def register_codec(codec: BaseCodec, is_preferred_decoder: bool = False):
+    """ Registers a codec, making it selectable by operators & its content type
+        decodable by all consumers in this process
+
+    Args:
+        codec (BaseCodec): Codec to be registered
+        is_preferred_decoder (bool): Toggles if codec should take over decoding
+            of its content type from previously registered codecs
+    """
+    CODECS[codec.name] = codec
+    if is_preferred_decoder or codec.content_type not in DECODERS:
+        DECODERS[codec.content_type] = codec
+
+
+def get_codec(name: str) -> BaseCodec:
+    """ Retrieves a registered codec by name
+
+    Args:
+        name (str): Name of codec
+    Returns:
+        Codec (BaseCodec)
+    """
+    if name not in CODECS:
+        raise ValueError(
+            f"Codec '{name}' is not available! Available codecs: {list(CODECS)}"
+        )
+    return CODECS[name]
+
+
+def get_decoder(content_type: Optional[str]) -> BaseCodec:
+    """ Retrieves the preferred codec for decoding a content type. Messages
+        without a content type are assumed to be JSON.
+
+    Args:
+        content_type (str): Content type advertised on message
+    Returns:
+        Codec (BaseCodec)
+    """
+    content_type = content_type or JSON_CONTENT_TYPE
+    if content_type not in DECODERS:
+        raise ValueError(f"Unsupported content type '{content_type}'!")
+    return DECODERS[content_type]
+
+
+register_codec(JsonCodec())
+
+if orjson is not None:
+    register_codec(OrjsonCodec(), is_preferred_decoder=True)
+
+if msgpack is not None:
+    register_codec(MsgpackCodec())
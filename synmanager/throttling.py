@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import logging
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+# Libs
+import pika
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+BACKLOG_SOFT_LIMIT = 0.5    # fraction of max queue depth where slowdown starts
+
+##############################
+# Throttle Class - FlowState #
+##############################
+
+class FlowState:
+    """ Tracks broker flow control (i.e. Connection.Blocked/Unblocked) on a
+        single connection. RabbitMQ blocks publishing connections whenever a
+        resource alarm (e.g. memory or disk) is raised.
+
+    Attributes:
+        is_blocked (bool): Toggles if broker is currently blocking publishes
+        blocked_since (float): Time at which connection was blocked, if any
+        reason (str): Reason given by broker for blocking connection
+    """
+    def __init__(self):
+        self.is_blocked = False
+        self.blocked_since = None
+        self.reason = None
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def on_blocked(self, connection, frame: pika.frame.Method):
+        """ Callback executed when broker blocks the connection """
+        self.is_blocked = True
+        self.blocked_since = time.monotonic()
+        self.reason = getattr(frame.method, 'reason', None)
+        logging.warning(f"Connection blocked by broker. Reason: {self.reason}")
+
+
+    def on_unblocked(self, connection, frame: pika.frame.Method):
+        """ Callback executed when broker unblocks the connection """
+        if self.blocked_since is not None:
+            blocked_duration = time.monotonic() - self.blocked_since
+            logging.info(f"Connection unblocked after {blocked_duration:.1f}s")
+        self.is_blocked = False
+        self.blocked_since = None
+        self.reason = None
+
+
+
+################################
+# Throttle Class - TokenBucket #
+################################
+
+class TokenBucket:
+    """ Thread-safe token bucket. Tokens are replenished continuously at a
+        fixed rate, up to a max capacity that bounds the size of bursts.
+
+    Attributes:
+        rate (float): No. of tokens replenished per sec
+        capacity (float): Max no. of tokens held
+    """
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive! Got {rate}")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def reserve(self, tokens: float = 1, rate_factor: float = 1.0) -> float:
+        """ Reserves tokens, returning the time to wait before they may be
+            spent. Reservations are granted in order, so concurrent callers
+            are spaced out instead of competing for the same tokens.
+
+        Args:
+            tokens (float): No. of tokens to reserve
+            rate_factor (float): Fraction of the nominal rate to apply, for
+                slowing consumption down further (e.g. on deep queues)
+        Returns:
+            Wait time (in secs) before tokens are available (float)
+        """
+        rate = self.rate * max(rate_factor, 1e-3)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / rate)
+
+
+
+################################
+# Throttle Class - RateLimiter #
+################################
+
+class RateLimiter:
+    """ Applies token bucket rate limits per routing key. A single limiter can
+        be shared by multiple producers, so that their combined submissions
+        to a routing key are bounded.
+
+    Attributes:
+        rates (dict): Routing keys mapped to their max rates (in msgs/sec)
+        default_rate (float): Max rate of routing keys not in `rates`. If
+            None, such routing keys are not rate limited.
+        burst (float): Max no. of messages allowed in a burst. If None, this
+            defaults to 1 sec worth of messages.
+    """
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        default_rate: Optional[float] = None,
+        burst: Optional[float] = None
+    ):
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.burst = burst
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __get_bucket(self, routing_key: str) -> Optional[TokenBucket]:
+        """ Retrieves the token bucket of a routing key, creating it if
+            necessary
+        """
+        with self._lock:
+            if routing_key not in self._buckets:
+                rate = self.rates.get(routing_key, self.default_rate)
+                self._buckets[routing_key] = (
+                    TokenBucket(rate, self.burst) if rate else None
+                )
+            return self._buckets[routing_key]
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def reserve(
+        self,
+        routing_key: str,
+        tokens: float = 1,
+        rate_factor: float = 1.0
+    ) -> float:
+        """ Reserves capacity to publish to a routing key
+
+        Args:
+            routing_key (str): Routing key to be published to
+            tokens (float): No. of messages to be published
+            rate_factor (float): Fraction of the nominal rate to apply
+        Returns:
+            Wait time (in secs) before publishing (float)
+        """
+        bucket = self.__get_bucket(routing_key)
+        return bucket.reserve(tokens, rate_factor) if bucket else 0.0
+
+#############
+# Functions #
+#############
+
+_flow_states = weakref.WeakKeyDictionary()
+
+def watch_connection(connection: pika.BlockingConnection) -> FlowState:
+    """ Retrieves the flow control state of a connection, subscribing to its
+        blocked/unblocked notifications on first use. Since pooled connections
+        are shared, subscriptions are made once per connection rather than
+        once per operator.
+
+    Args:
+        connection (pika.BlockingConnection): Connection to be watched
+    Returns:
+        Flow control state (FlowState)
+    """
+    if connection not in _flow_states:
+        flow_state = FlowState()
+        connection.add_on_connection_blocked_callback(flow_state.on_blocked)
+        connection.add_on_connection_unblocked_callback(flow_state.on_unblocked)
+        _flow_states[connection] = flow_state
+    return _flow_states[connection]
+
+
+def calculate_backlog_factor(
+    depth: int,
+    max_depth: int,
+    soft_limit: float = BACKLOG_SOFT_LIMIT
+) -> float:
+    """ Calculates the fraction of the nominal publish rate to apply for a
+        queue's backlog. Publishing proceeds at full rate up to the soft limit,
+        slows down linearly beyond it, & halts at the max depth.
+
+    Args:
+        depth (int): Current no. of messages in queue
+        max_depth (int): Max no. of messages allowed in queue
+        soft_limit (float): Fraction of max depth where slowdown starts
+    Returns:
+        Backlog factor between 0 & 1 (float)
+    """
+    soft_depth = max_depth * soft_limit
+    if depth <= soft_depth:
+        return 1.0
+    if depth >= max_depth:
+        return 0.0
+    return (max_depth - depth) / (max_depth - soft_depth)
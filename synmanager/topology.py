@@ -0,0 +1,538 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# Libs
+import pika
+
+# Custom
+from .config import (
+    EXCHANGE_NAME,
+    EXCHANGE_TYPE,
+    MAX_PRIORITY,
+    PREPROCESS_ROUTING_KEY,
+    PREPROCESS_QUEUE,
+    TRAIN_ROUTING_KEY,
+    TRAIN_QUEUE,
+    EVALUATE_ROUTING_KEY,
+    EVALUATE_QUEUE,
+    COMPLETED_ROUTING_KEY,
+    COMPLETED_EXCHANGE_NAME,
+    COMPLETED_EXCHANGE_TYPE,
+    COMPLETED_QUEUE,
+    PARKING_QUEUE_PATTERN,
+    QUARANTINE_QUEUE_PATTERN,
+    QUARANTINE_MAX_LENGTH
+)
+
+##################
+# Configurations #
+##################
+
+DEFAULT_VHOST = '/'
+
+# Entities already declared by this process, keyed by broker & definition
+_verified = set()
+_verified_lock = threading.Lock()
+
+#############
+# Functions #
+#############
+
+def as_arguments(arguments: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+    """ Freezes a dictionary of arguments, so that definitions stay hashable
+
+    Args:
+        arguments (dict): Arguments to be frozen
+    Returns:
+        Sorted (name, value) pairs (tuple)
+    """
+    return tuple(sorted((arguments or {}).items()))
+
+
+def clear_verified(broker: Optional[Tuple[str, int]] = None):
+    """ Forgets the entities verified by this process, so that they are
+        declared again (e.g. after reconnecting to a restarted broker)
+
+    Args:
+        broker (tuple(str, int)): Host & port of broker to forget. If None,
+            all brokers are forgotten.
+    """
+    with _verified_lock:
+        for cache_key in list(_verified):
+            if broker is None or cache_key[:2] == tuple(broker):
+                _verified.discard(cache_key)
+
+############################################
+# Topology Definition - ExchangeDefinition #
+############################################
+
+class ExchangeDefinition(NamedTuple):
+    """ Declaration of an exchange
+
+    Attributes:
+        name (str): Name of exchange
+        type (str): Type of exchange (i.e. "direct", "fanout", "topic",
+            "headers")
+        durable (bool): Toggles if exchange survives broker restarts
+        auto_delete (bool): Toggles if exchange is deleted once unused
+        arguments (tuple): Optional arguments, as sorted (name, value) pairs
+    """
+    name: str
+    type: str = 'topic'
+    durable: bool = True
+    auto_delete: bool = False
+    arguments: Tuple[Tuple[str, Any], ...] = ()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def declare(self, channel: pika.adapters.blocking_connection.BlockingChannel):
+        """ Declares this exchange over a channel """
+        channel.exchange_declare(
+            exchange=self.name,
+            exchange_type=self.type,
+            durable=self.durable,
+            auto_delete=self.auto_delete,
+            arguments=dict(self.arguments) or None
+        )
+
+
+    def create_definition(self, vhost: str) -> Dict[str, Any]:
+        """ Exports this exchange in the format of broker definitions """
+        return {
+            'name': self.name,
+            'vhost': vhost,
+            'type': self.type,
+            'durable': self.durable,
+            'auto_delete': self.auto_delete,
+            'internal': False,
+            'arguments': dict(self.arguments)
+        }
+
+
+
+#########################################
+# Topology Definition - QueueDefinition #
+#########################################
+
+class QueueDefinition(NamedTuple):
+    """ Declaration of a queue
+
+    Attributes:
+        name (str): Name of queue
+        durable (bool): Toggles if queue survives broker restarts
+        auto_delete (bool): Toggles if queue is deleted once unused
+        arguments (tuple): Optional arguments (e.g. `x-max-priority`), as
+            sorted (name, value) pairs
+    """
+    name: str
+    durable: bool = True
+    auto_delete: bool = False
+    arguments: Tuple[Tuple[str, Any], ...] = ()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def declare(self, channel: pika.adapters.blocking_connection.BlockingChannel):
+        """ Declares this queue over a channel """
+        channel.queue_declare(
+            self.name,
+            durable=self.durable,
+            auto_delete=self.auto_delete,
+            arguments=dict(self.arguments) or None
+        )
+
+
+    def create_definition(self, vhost: str) -> Dict[str, Any]:
+        """ Exports this queue in the format of broker definitions """
+        return {
+            'name': self.name,
+            'vhost': vhost,
+            'durable': self.durable,
+            'auto_delete': self.auto_delete,
+            'arguments': dict(self.arguments)
+        }
+
+
+
+###########################################
+# Topology Definition - BindingDefinition #
+###########################################
+
+class BindingDefinition(NamedTuple):
+    """ Binding of a queue to an exchange
+
+    Attributes:
+        source (str): Name of exchange
+        destination (str): Name of queue
+        routing_key (str): Routing key (or pattern) bound
+    """
+    source: str
+    destination: str
+    routing_key: str
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def declare(self, channel: pika.adapters.blocking_connection.BlockingChannel):
+        """ Binds this binding's queue over a channel """
+        channel.queue_bind(
+            queue=self.destination,
+            exchange=self.source,
+            routing_key=self.routing_key
+        )
+
+
+    def create_definition(self, vhost: str) -> Dict[str, Any]:
+        """ Exports this binding in the format of broker definitions """
+        return {
+            'source': self.source,
+            'vhost': vhost,
+            'destination': self.destination,
+            'destination_type': 'queue',
+            'routing_key': self.routing_key,
+            'arguments': {}
+        }
+
+
+
+##########################################
+# Topology Definition - PolicyDefinition #
+##########################################
+
+class PolicyDefinition(NamedTuple):
+    """ Broker policy applied to all queues (or exchanges) matching a pattern.
+        Only 1 policy applies to each queue, i.e. the matching policy of the
+        highest priority.
+
+    Attributes:
+        name (str): Name of policy
+        pattern (str): Regular expression matching the names of entities
+        definition (tuple): Policy keys (e.g. "queue-mode", "max-length"), as
+            sorted (name, value) pairs
+        priority (int): Precedence of policy over other matching policies
+        apply_to (str): Type of entities governed (i.e. "queues",
+            "exchanges", "all")
+    """
+    name: str
+    pattern: str
+    definition: Tuple[Tuple[str, Any], ...]
+    priority: int = 0
+    apply_to: str = 'queues'
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def create_definition(self, vhost: str) -> Dict[str, Any]:
+        """ Exports this policy in the format of broker definitions """
+        return {
+            'vhost': vhost,
+            'name': self.name,
+            'pattern': self.pattern,
+            'apply-to': self.apply_to,
+            'definition': dict(self.definition),
+            'priority': self.priority
+        }
+
+#############################
+# Topology Class - Topology #
+#############################
+
+class Topology:
+    """ Declarative model of the exchanges, queues, bindings & policies used by
+        Synergos, from which broker definitions (i.e. `definitions.json`) are
+        generated & live brokers are verified.
+
+        Verification is cached across all operators in a process. Since
+        declarations are idempotent, each entity only has to be declared once
+        per process & broker, after which operators skip the round trips.
+
+    Attributes:
+        vhost (str): Virtual host that entities are declared on
+        exchanges (OrderedDict): Exchange names mapped to their definitions
+        queues (OrderedDict): Queue names mapped to their definitions
+        bindings (OrderedDict): Bindings mapped to their definitions
+        policies (OrderedDict): Policy names mapped to their definitions
+    """
+    def __init__(self, vhost: str = DEFAULT_VHOST):
+        self.vhost = vhost
+        self.exchanges = collections.OrderedDict()
+        self.queues = collections.OrderedDict()
+        self.bindings = collections.OrderedDict()
+        self.policies = collections.OrderedDict()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def add_exchange(
+        self,
+        name: str,
+        type: str = 'topic',
+        durable: bool = True,
+        auto_delete: bool = False,
+        arguments: Optional[Dict[str, Any]] = None
+    ) -> ExchangeDefinition:
+        """ Adds an exchange to this topology
+
+        Args:
+            name (str): Name of exchange
+            type (str): Type of exchange. Default: "topic"
+            durable (bool): Toggles if exchange survives broker restarts
+            auto_delete (bool): Toggles if exchange is deleted once unused
+            arguments (dict): Optional arguments of exchange
+        Returns:
+            Exchange definition (ExchangeDefinition)
+        """
+        exchange = ExchangeDefinition(
+            name, type, durable, auto_delete, as_arguments(arguments)
+        )
+        self.exchanges[name] = exchange
+        return exchange
+
+
+    def add_queue(
+        self,
+        name: str,
+        durable: bool = True,
+        auto_delete: bool = False,
+        arguments: Optional[Dict[str, Any]] = None
+    ) -> QueueDefinition:
+        """ Adds a queue to this topology
+
+        Args:
+            name (str): Name of queue
+            durable (bool): Toggles if queue survives broker restarts
+            auto_delete (bool): Toggles if queue is deleted once unused
+            arguments (dict): Optional arguments of queue (e.g.
+                `x-max-priority`), which cannot be changed once declared
+        Returns:
+            Queue definition (QueueDefinition)
+        """
+        queue = QueueDefinition(name, durable, auto_delete, as_arguments(arguments))
+        self.queues[name] = queue
+        return queue
+
+
+    def add_binding(
+        self,
+        exchange: str,
+        queue: str,
+        routing_key: str
+    ) -> BindingDefinition:
+        """ Binds a queue to an exchange in this topology
+
+        Args:
+            exchange (str): Name of exchange
+            queue (str): Name of queue
+            routing_key (str): Routing key (or pattern) to bind
+        Returns:
+            Binding definition (BindingDefinition)
+        """
+        binding = BindingDefinition(exchange, queue, routing_key)
+        self.bindings[binding] = binding
+        return binding
+
+
+    def add_policy(
+        self,
+        name: str,
+        pattern: str,
+        definition: Dict[str, Any],
+        priority: int = 0,
+        apply_to: str = 'queues'
+    ) -> PolicyDefinition:
+        """ Adds a policy to this topology. Policies cannot be applied over
+            AMQP, & are only exported into broker definitions.
+
+        Args:
+            name (str): Name of policy
+            pattern (str): Regular expression matching the names of entities
+            definition (dict): Policy keys, e.g. {"queue-mode": "lazy"} or
+                {"max-length": 1000, "overflow": "reject-publish"}
+            priority (int): Precedence of policy over other matching policies
+            apply_to (str): Type of entities governed. Default: "queues"
+        Returns:
+            Policy definition (PolicyDefinition)
+        """
+        policy = PolicyDefinition(
+            name, pattern, as_arguments(definition), priority, apply_to
+        )
+        self.policies[name] = policy
+        return policy
+
+
+    def merge(self, other: 'Topology') -> 'Topology':
+        """ Adds all entities of another topology to this topology
+
+        Args:
+            other (Topology): Topology to be merged in
+        Returns:
+            This topology (Topology)
+        """
+        self.exchanges.update(other.exchanges)
+        self.queues.update(other.queues)
+        self.bindings.update(other.bindings)
+        self.policies.update(other.policies)
+        return self
+
+
+    def declare(
+        self,
+        channel: pika.adapters.blocking_connection.BlockingChannel,
+        broker: Tuple[str, int] = ('localhost', 5672)
+    ) -> int:
+        """ Verifies the live topology of a broker, by declaring all entities
+            not already declared by this process. Declarations fail (& close
+            the channel) if an entity exists with a conflicting definition.
+
+        Args:
+            channel (BlockingChannel): Channel to declare entities over
+            broker (tuple(str, int)): Host & port of broker
+        Returns:
+            No. of entities declared (int)
+        """
+        entities = [
+            *self.exchanges.values(),
+            *self.queues.values(),
+            *self.bindings.values()
+        ]
+
+        declared = 0
+        for entity in entities:
+            cache_key = (*broker, self.vhost, type(entity).__name__, entity)
+            with _verified_lock:
+                if cache_key in _verified:
+                    continue
+
+            entity.declare(channel)
+            declared += 1
+
+            with _verified_lock:
+                _verified.add(cache_key)
+
+        if declared:
+            logging.debug(f"Declared {declared} topology entities on {broker}")
+        return declared
+
+
+    def create_definitions(
+        self,
+        template: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """ Exports this topology as broker definitions, which the management
+            plugin loads on startup (i.e. `load_definitions`)
+
+        Args:
+            template (dict): Existing definitions, whose other sections (e.g.
+                users, vhosts & permissions) are kept
+        Returns:
+            Broker definitions (dict)
+        """
+        definitions = dict(template or {})
+        definitions.update({
+            'policies': [
+                policy.create_definition(self.vhost)
+                for policy in self.policies.values()
+            ],
+            'queues': [
+                queue.create_definition(self.vhost)
+                for queue in self.queues.values()
+            ],
+            'exchanges': [
+                exchange.create_definition(self.vhost)
+                for exchange in self.exchanges.values()
+            ],
+            'bindings': [
+                binding.create_definition(self.vhost)
+                for binding in self.bindings.values()
+            ]
+        })
+        return definitions
+
+
+    def export_definitions(self, path: str) -> Dict[str, Any]:
+        """ Writes this topology into a definitions file. If the file already
+            exists, only its topology sections are replaced.
+
+        Args:
+            path (str): Path of definitions file
+        Returns:
+            Broker definitions (dict)
+        """
+        template = None
+        if os.path.exists(path):
+            with open(path) as definitions_file:
+                template = json.load(definitions_file)
+
+        definitions = self.create_definitions(template)
+        with open(path, 'w') as definitions_file:
+            json.dump(definitions, definitions_file, indent=4)
+            definitions_file.write('\n')
+
+        return definitions
+
+#############
+# Functions #
+#############
+
+def create_default_topology(vhost: str = DEFAULT_VHOST) -> Topology:
+    """ Builds the topology of a Synergos cluster from its queue settings, i.e.
+        a priority queue per phase of the federated cycle, together with the
+        policies governing parked (i.e. delayed, retried & quarantined) jobs
+
+    Args:
+        vhost (str): Virtual host that entities are declared on
+    Returns:
+        Default topology (Topology)
+    """
+    topology = Topology(vhost=vhost)
+    topology.add_exchange(EXCHANGE_NAME, type=EXCHANGE_TYPE)
+    topology.add_exchange(COMPLETED_EXCHANGE_NAME, type=COMPLETED_EXCHANGE_TYPE)
+
+    phase_queues = [
+        (EXCHANGE_NAME, PREPROCESS_QUEUE, PREPROCESS_ROUTING_KEY),
+        (EXCHANGE_NAME, TRAIN_QUEUE, TRAIN_ROUTING_KEY),
+        (EXCHANGE_NAME, EVALUATE_QUEUE, EVALUATE_ROUTING_KEY),
+        (COMPLETED_EXCHANGE_NAME, COMPLETED_QUEUE, COMPLETED_ROUTING_KEY)
+    ]
+    for exchange, queue, routing_key in phase_queues:
+        topology.add_queue(
+            queue,
+            arguments={'x-queue-type': 'classic', 'x-max-priority': MAX_PRIORITY}
+        )
+        topology.add_binding(exchange, queue, routing_key)
+
+    # Parked jobs may sit for long, & are paged out to disk straight away
+    topology.add_policy(
+        'SynMQ_lazy_parking',
+        pattern=PARKING_QUEUE_PATTERN,
+        definition={'queue-mode': 'lazy'}
+    )
+    # Only 1 policy applies per queue, so quarantine restates lazy mode
+    topology.add_policy(
+        'SynMQ_quarantine_limit',
+        pattern=QUARANTINE_QUEUE_PATTERN,
+        definition={
+            'queue-mode': 'lazy',
+            'max-length': QUARANTINE_MAX_LENGTH,
+            'overflow': 'drop-head'
+        },
+        priority=1
+    )
+    return topology
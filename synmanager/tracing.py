@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import collections
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
+
+# Libs
+
+
+# Custom
+from .metrics import PUBLISHED_AT_HEADER
+
+##################
+# Configurations #
+##################
+
+TRACE_ID_HEADER = 'x-trace-id'  # ID shared by all spans of a job's path
+SPAN_ID_HEADER = 'x-span-id'    # ID of span that published a job
+
+TRACE_PATH = "synmq_traces.jsonl"
+
+# Span being executed by the current thread (e.g. a job being processed)
+_current_span = contextvars.ContextVar('synmq_current_span', default=None)
+
+########################
+# Tracing Class - Span #
+########################
+
+class Span:
+    """ Timed operation along the path of a job, e.g. its publication into a
+        phase queue, or its processing by a consumer. Spans of the same job
+        share a trace ID, & refer to the span that caused them as parent.
+
+    Attributes:
+        name (str): Name of operation (e.g. "publish train")
+        kind (str): Role of operation (i.e. "producer", "consumer")
+        trace_id (str): ID of trace that span belongs to
+        span_id (str): ID of span
+        parent_id (str): ID of parent span, if any
+        start_time (float): Unix time at which operation started
+        end_time (float): Unix time at which operation ended, if it has
+        attributes (dict): Details of operation (e.g. queue, outcome)
+    """
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        trace_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        **attributes
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_time = time.time()
+        self.end_time = None
+        self.attributes = attributes
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def inject(self, headers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """ Adds the context of this span to the headers of a message, so that
+            its consumers continue the trace
+
+        Args:
+            headers (dict): Headers of message, if any
+        Returns:
+            Headers with trace context (dict)
+        """
+        return {
+            **(headers or {}),
+            TRACE_ID_HEADER: self.trace_id,
+            SPAN_ID_HEADER: self.span_id,
+            PUBLISHED_AT_HEADER: time.time()
+        }
+
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Converts this span into a serialisable record
+
+        Returns:
+            Span record (dict)
+        """
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'duration': (
+                self.end_time - self.start_time
+                if self.end_time is not None else None
+            ),
+            'attributes': self.attributes
+        }
+
+
+
+################################
+# Tracing Class - SpanExporter #
+################################
+
+class SpanExporter:
+    """ Destination of finished spans. Exporters are called from every thread
+        that finishes spans, & must be thread-safe.
+    """
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def export(self, span: Span):
+        """ Ships a finished span
+
+        Args:
+            span (Span): Finished span
+        """
+        raise NotImplementedError
+
+
+    def shutdown(self):
+        """ Releases any resources held by the exporter """
+        pass
+
+
+
+#####################################
+# Tracing Class - JsonLinesExporter #
+#####################################
+
+class JsonLinesExporter(SpanExporter):
+    """ Appends finished spans as JSON lines to a file, which may be shared by
+        several processes (lines are written in single appends)
+
+    Attributes:
+        path (str): Path of trace file
+    """
+    def __init__(self, path: str = TRACE_PATH):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def export(self, span: Span):
+        """ Appends a finished span to the trace file """
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', buffering=1)
+            self._file.write(line)
+
+
+    def shutdown(self):
+        """ Closes the trace file """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+
+##########################
+# Tracing Class - Tracer #
+##########################
+
+class Tracer:
+    """ Creates spans for the jobs handled by operators, & hands finished
+        spans to an exporter. Trace context travels with each job in its
+        message headers, & within a process with the thread processing it, so
+        that jobs published while processing another job (e.g. completed jobs)
+        join its trace.
+
+    Attributes:
+        exporter (SpanExporter): Destination of finished spans. Default:
+            `JsonLinesExporter`
+    """
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter or JsonLinesExporter()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def start_span(self, name: str, kind: str = 'producer', **attributes) -> Span:
+        """ Starts a span within the trace of the span being executed, if
+            any, or otherwise a new trace
+
+        Args:
+            name (str): Name of operation
+            kind (str): Role of operation. Default: "producer"
+            **attributes: Details of operation
+        Returns:
+            Started span (Span)
+        """
+        parent = _current_span.get()
+        return Span(
+            name,
+            kind,
+            trace_id=parent.trace_id if parent else None,
+            parent_id=parent.span_id if parent else None,
+            **attributes
+        )
+
+
+    def continue_trace(
+        self,
+        headers: Optional[Dict[str, Any]],
+        name: str,
+        kind: str = 'consumer',
+        **attributes
+    ) -> Span:
+        """ Starts a span continuing the trace carried by a message's headers.
+            Messages without trace context start a new trace.
+
+        Args:
+            headers (dict): Headers of received message
+            name (str): Name of operation
+            kind (str): Role of operation. Default: "consumer"
+            **attributes: Details of operation
+        Returns:
+            Started span (Span)
+        """
+        headers = headers or {}
+        span = Span(
+            name,
+            kind,
+            trace_id=headers.get(TRACE_ID_HEADER),
+            parent_id=headers.get(SPAN_ID_HEADER),
+            **attributes
+        )
+
+        enqueued_at = headers.get(PUBLISHED_AT_HEADER)
+        if enqueued_at is not None:
+            span.attributes['queue_wait'] = max(0.0, span.start_time - enqueued_at)
+        return span
+
+
+    @contextlib.contextmanager
+    def activate(self, span: Span) -> Iterator[Span]:
+        """ Makes a span the current span of this thread, for the duration of
+            a block
+
+        Args:
+            span (Span): Span to be activated
+        """
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+
+    def finish(self, span: Span, **attributes):
+        """ Ends a span & exports it. Failures to export are logged, rather
+            than raised into the job being traced.
+
+        Args:
+            span (Span): Span to be finished
+            **attributes: Final details of operation (e.g. outcome)
+        """
+        span.end_time = time.time()
+        span.attributes.update(attributes)
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logging.warning(f"Failed to export span {span.span_id}. Error: {e!r}")
+
+#############
+# Functions #
+#############
+
+_default_tracer = None
+
+def get_tracer() -> Tracer:
+    """ Retrieves the process-wide tracer, creating it if necessary
+
+    Returns:
+        Default tracer (Tracer)
+    """
+    global _default_tracer
+    if _default_tracer is None:
+        _default_tracer = Tracer()
+    return _default_tracer
+
+
+def get_current_span() -> Optional[Span]:
+    """ Retrieves the span being executed by the current thread
+
+    Returns:
+        Current span (Span), or None if no span is active
+    """
+    return _current_span.get()
+
+
+def annotate_span(**attributes):
+    """ Adds details to the span being executed by the current thread, if any
+
+    Args:
+        **attributes: Details of operation (e.g. outcome="failed")
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def load_traces(path: str = TRACE_PATH) -> Dict[str, List[Dict[str, Any]]]:
+    """ Reads exported spans back from a trace file, grouped by trace
+
+    Args:
+        path (str): Path of trace file
+    Returns:
+        Trace IDs mapped to their spans, in order of start (dict)
+    """
+    traces = collections.defaultdict(list)
+    with open(path) as trace_file:
+        for line in trace_file:
+            if line.strip():
+                span = json.loads(line)
+                traces[span['trace_id']].append(span)
+
+    for spans in traces.values():
+        spans.sort(key=lambda span: span['start_time'])
+    return dict(traces)
+
+
+def get_critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """ Reconstructs the chain of spans leading to the last span of a trace
+        to finish, i.e. the path bounding the trace's end-to-end duration.
+        Time spent waiting in each queue is carried by consumer spans as
+        their `queue_wait` attribute.
+
+    Args:
+        spans (list(dict)): Exported spans of a single trace
+    Returns:
+        Spans along critical path, from root to end (list(dict))
+    """
+    finished_spans = [span for span in spans if span['end_time'] is not None]
+    if not finished_spans:
+        return []
+
+    spans_by_id = {span['span_id']: span for span in spans}
+    span = max(finished_spans, key=lambda span: span['end_time'])
+
+    critical_path = []
+    while span is not None:
+        critical_path.append(span)
+        span = spans_by_id.get(span['parent_id'])
+    return critical_path[::-1]
@@ -13,7 +13,8 @@ from typing import Dict, Any
 
 # Custom
 from .base import ProducerOperator, ConsumerOperator
-from .config import TRAIN_ROUTING_KEY, TRAIN_QUEUE
+from .async_base import AsyncProducerOperator, AsyncConsumerOperator
+from .config import MAX_PRIORITY, TRAIN_ROUTING_KEY, TRAIN_QUEUE
 
 ##################
 # Configurations #
@@ -39,6 +40,8 @@ class TrainProducerOperator(ProducerOperator):
 
         # Network attributes
         self.routing_key = TRAIN_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = TRAIN_QUEUE
 
         # Data attributes
     
@@ -86,6 +89,7 @@ class TrainConsumerOperator(ConsumerOperator):
 
         # Network attributes
         self.routing_key = TRAIN_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
         self.queue = TRAIN_QUEUE
 
         # Data attributes
@@ -112,4 +116,43 @@ class TrainConsumerOperator(ConsumerOperator):
 
     ##################
     # Core Functions #
-    ##################
\ No newline at end of file
+    ##################
+
+
+
+####################################################################
+# Async Train producer operator Class - AsyncTrainProducerOperator #
+####################################################################
+
+class AsyncTrainProducerOperator(AsyncProducerOperator):
+    """ 
+    Contains management functionality for handling asynchronous training 
+    job submissions to the "Train" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = TRAIN_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+
+
+
+####################################################################
+# Async Train consumer operator Class - AsyncTrainConsumerOperator #
+####################################################################
+
+class AsyncTrainConsumerOperator(AsyncConsumerOperator):
+    """ 
+    Contains management functionality for handling asynchronous training 
+    job consumptions from the "Train" queue.
+    """
+
+    def __init__(self, host: str, port: int, concurrency: int = 100):
+        super().__init__(host=host, port=port, concurrency=concurrency)
+
+        # Network attributes
+        self.routing_key = TRAIN_ROUTING_KEY
+        self.max_priority = MAX_PRIORITY
+        self.queue = TRAIN_QUEUE
\ No newline at end of file
@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+# Libs
+import pika
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+
+####################################
+# Worker Class - ThreadsafeChannel #
+####################################
+
+class ThreadsafeChannel:
+    """ Proxy of a blocking channel for use by worker threads. Pika connections
+        are not thread-safe, so acknowledgements issued from a worker are not
+        sent directly, but scheduled onto the thread servicing the connection
+        via `add_callback_threadsafe(...)`, & sent the next time it processes
+        data events.
+
+    Attributes:
+        connection (pika.BlockingConnection): Connection owning the channel
+        channel (pika.adapters.blocking_connection.BlockingChannel): Channel
+            that deliveries were received on
+    """
+    def __init__(
+        self,
+        connection: pika.BlockingConnection,
+        channel: pika.adapters.blocking_connection.BlockingChannel
+    ):
+        self.connection = connection
+        self.channel = channel
+
+        # Proxies are created on the thread that services the connection
+        self._connection_thread = threading.get_ident()
+
+    ############
+    # Checkers #
+    ############
+
+    def is_connection_thread(self) -> bool:
+        """ Checks if the caller is the thread servicing the connection, in
+            which case channel operations can be performed directly
+
+        Returns:
+            Connection thread state (bool)
+        """
+        return threading.get_ident() == self._connection_thread
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __schedule(self, operation: Callable, **kwargs):
+        """ Schedules a channel operation onto the connection thread. Since
+            deliveries are bound to the channel they were received on, the
+            operation is dropped if that channel has since been closed (the
+            broker will redeliver the message instead).
+        """
+        def run_operation():
+            if self.channel.is_open:
+                operation(**kwargs)
+            else:
+                logging.warning(
+                    f"Channel closed before {operation.__name__} of "
+                    f"delivery {kwargs.get('delivery_tag')}! Message will be "
+                    f"redelivered."
+                )
+
+        if self.is_connection_thread():
+            run_operation()
+            return
+
+        try:
+            self.connection.add_callback_threadsafe(run_operation)
+        except pika.exceptions.ConnectionWrongStateError:
+            logging.warning(
+                f"Connection closed before {operation.__name__} of delivery "
+                f"{kwargs.get('delivery_tag')}! Message will be redelivered."
+            )
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False):
+        """ Acknowledges a delivery from any thread """
+        self.__schedule(
+            self.channel.basic_ack,
+            delivery_tag=delivery_tag,
+            multiple=multiple
+        )
+
+
+    def basic_nack(
+        self,
+        delivery_tag: int = 0,
+        multiple: bool = False,
+        requeue: bool = True
+    ):
+        """ Negatively acknowledges a delivery from any thread """
+        self.__schedule(
+            self.channel.basic_nack,
+            delivery_tag=delivery_tag,
+            multiple=multiple,
+            requeue=requeue
+        )
+
+
+    def basic_reject(self, delivery_tag: int = 0, requeue: bool = True):
+        """ Rejects a delivery from any thread """
+        self.__schedule(
+            self.channel.basic_reject,
+            delivery_tag=delivery_tag,
+            requeue=requeue
+        )
+
+
+    def basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: Optional[pika.BasicProperties] = None,
+        mandatory: bool = False
+    ):
+        """ Publishes a message from any thread. Operations are sent in the
+            order they were scheduled, so a job republished before its
+            delivery is acknowledged is never lost in between.
+        """
+        self.__schedule(
+            self.channel.basic_publish,
+            exchange=exchange,
+            routing_key=routing_key,
+            body=body,
+            properties=properties,
+            mandatory=mandatory
+        )
+
+
+    def basic_qos(
+        self,
+        prefetch_size: int = 0,
+        prefetch_count: int = 0,
+        global_qos: bool = False
+    ):
+        """ Adjusts the prefetch window of the channel from any thread """
+        self.__schedule(
+            self.channel.basic_qos,
+            prefetch_size=prefetch_size,
+            prefetch_count=prefetch_count,
+            global_qos=global_qos
+        )
+
+
+
+##################################
+# Worker Class - BatchAckChannel #
+##################################
+
+class BatchAckChannel:
+    """ Proxy of a channel that coalesces the acknowledgements of a batch of
+        deliveries into a single `multiple=True` acknowledgement, sent when
+        the batch is flushed. Rejections are passed straight through, so that
+        they settle their deliveries before the batch is acknowledged.
+
+    Attributes:
+        channel: Channel (or channel proxy) that deliveries were received on
+        delivery_tag (int): Highest delivery tag acknowledged in batch
+        count (int): No. of acknowledgements pending in batch
+    """
+    def __init__(self, channel):
+        self.channel = channel
+        self.delivery_tag = None
+        self.count = 0
+
+        self._lock = threading.Lock()
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False):
+        """ Defers the acknowledgement of a delivery until the batch is
+            flushed
+        """
+        with self._lock:
+            self.delivery_tag = max(self.delivery_tag or 0, delivery_tag)
+            self.count += 1
+
+
+    def basic_nack(
+        self,
+        delivery_tag: int = 0,
+        multiple: bool = False,
+        requeue: bool = True
+    ):
+        """ Negatively acknowledges a delivery immediately """
+        self.channel.basic_nack(
+            delivery_tag=delivery_tag,
+            multiple=multiple,
+            requeue=requeue
+        )
+
+
+    def basic_reject(self, delivery_tag: int = 0, requeue: bool = True):
+        """ Rejects a delivery immediately """
+        self.channel.basic_reject(delivery_tag=delivery_tag, requeue=requeue)
+
+
+    def basic_publish(self, *args, **kwargs):
+        """ Publishes a message immediately """
+        self.channel.basic_publish(*args, **kwargs)
+
+
+    def flush(self) -> int:
+        """ Acknowledges all deliveries acknowledged in batch with a single
+            frame. Since this also covers every earlier delivery that is still
+            unsettled, all rejections must have been sent beforehand.
+
+        Returns:
+            No. of acknowledgements flushed (int)
+        """
+        with self._lock:
+            delivery_tag, count = self.delivery_tag, self.count
+            self.delivery_tag = None
+            self.count = 0
+
+        if delivery_tag is not None:
+            self.channel.basic_ack(delivery_tag=delivery_tag, multiple=True)
+        return count
+
+
+
+########################################
+# Worker Class - ProcessPoolSupervisor #
+########################################
+
+class ProcessPoolSupervisor:
+    """ Consumes a queue on behalf of a pool of worker processes. The consumer
+        (& hence its connection) stays in the supervising process, which
+        fans deliveries out to workers & relays their results back, settling
+        each delivery once its job is done. CPU-bound jobs (e.g. preprocessing
+        & alignment) can hence use every core from a single queue.
+
+        Workers are started with the "spawn" method by default, so that they
+        never inherit the connection's socket or I/O state. Process functions
+        (& their arguments) must therefore be picklable, i.e. defined at the
+        top level of a module.
+
+        Each thread submitting jobs (i.e. each of the consumer's `processes`
+        worker threads) is given a worker process of its own, such that a
+        crashing worker only fails the job it was running.
+
+    Attributes:
+        consumer (ConsumerOperator): Connected consumer to receive jobs with
+        processes (int): No. of worker processes
+        max_tasks_per_child (int): Max no. of jobs processed by each worker
+            before being replaced. If None, workers are never replaced unless
+            they crash.
+        start_method (str): Method used to start workers (i.e. "spawn",
+            "forkserver" or "fork")
+        initializer (Callable): Function executed in each worker on startup
+        initargs (tuple): Arguments of initializer
+    """
+    def __init__(
+        self,
+        consumer,
+        processes: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        start_method: str = 'spawn',
+        initializer: Optional[Callable] = None,
+        initargs: tuple = ()
+    ):
+        self.consumer = consumer
+        self.processes = processes or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self.start_method = start_method
+        self.initializer = initializer
+        self.initargs = initargs
+
+        self._pools = {}        # thread ID -> executor of 1 worker
+        self._task_counts = {}  # thread ID -> no. of jobs run by its worker
+        self._lock = threading.Lock()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def __create_pool(self) -> ProcessPoolExecutor:
+        """ Starts a fresh executor of a single worker """
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=self.initializer,
+            initargs=self.initargs
+        )
+
+
+    def __retire_pool(self, thread_id: int, pool: ProcessPoolExecutor):
+        """ Replaces the worker of a thread, unless it has already been
+            replaced. Since each worker only runs jobs submitted by its own
+            thread, it is idle (or broken) by the time it is retired.
+        """
+        with self._lock:
+            if self._pools.get(thread_id) is pool:
+                self._pools.pop(thread_id)
+                self._task_counts.pop(thread_id)
+        pool.shutdown(wait=True)
+
+
+    def __acquire_pool(self) -> ProcessPoolExecutor:
+        """ Retrieves the worker to submit the current thread's next job to """
+        ###########################
+        # Implementation Footnote #
+        ###########################
+
+        # [Cause]
+        # Long-lived workers accumulate memory from native libraries (e.g.
+        # pandas & torch) across jobs, & a crashing worker breaks every 
+        # `ProcessPoolExecutor` it belongs to.
+
+        # [Problems]
+        # Per-worker job limits are only supported by `ProcessPoolExecutor`
+        # from Python 3.11 onwards, & recycling a shared pool either runs the
+        # old & new pools side by side (oversubscribing cores) or stalls all
+        # consumers. Crashes also failed every job running on a shared pool,
+        # using up retry attempts of jobs that did not cause them.
+
+        # [Solution]
+        # Give each consuming thread (i.e. 1 per process) its own executor of
+        # a single worker. Workers are recycled after `max_tasks_per_child`
+        # jobs between jobs of their thread, so no more than `processes`
+        # workers ever run at once, & crashes only fail the job that caused
+        # them.
+
+        thread_id = threading.get_ident()
+        with self._lock:
+            pool = self._pools.get(thread_id)
+            task_count = self._task_counts.get(thread_id, 0)
+
+        is_exhausted = (
+            self.max_tasks_per_child is not None and
+            task_count >= self.max_tasks_per_child
+        )
+        if pool and is_exhausted:
+            logging.info(f"Recycling worker process after {task_count} jobs")
+            self.__retire_pool(thread_id, pool)
+            pool = None
+
+        with self._lock:
+            if pool is None:
+                pool = self._pools[thread_id] = self.__create_pool()
+                self._task_counts[thread_id] = 0
+            self._task_counts[thread_id] += 1
+            return pool
+
+    ##################
+    # Core Functions #
+    ##################
+
+    def submit(self, process_function: Callable, **kwargs) -> Any:
+        """ Executes a job on the current thread's worker process, blocking 
+            until it completes. If the worker crashes, it is replaced & the 
+            job fails, so that its delivery is rejected & redelivered. Jobs
+            running on other workers are unaffected.
+
+        Args:
+            process_function (Callable): Picklable function to be executed
+            **kwargs: Arguments retrieved from queue
+        Returns:
+            Result of process function
+        """
+        pool = self.__acquire_pool()
+        try:
+            return pool.submit(process_function, **kwargs).result()
+
+        except BrokenProcessPool:
+            logging.error("Worker process crashed! Restarting worker...")
+            self.__retire_pool(threading.get_ident(), pool)
+            raise
+
+
+    def listen_message(
+        self,
+        process_function: Callable,
+        job_filter: Optional[Callable] = None
+    ):
+        """ Commence message consumption from the consumer's queue, processing
+            up to 1 job per worker at a time
+
+        Args:
+            process_function (Callable): Picklable function to be executed
+                with arguments retrieved from queue
+            job_filter (Callable): Predicate on a lazy `JobView` of each
+                delivery. Jobs failing the filter are acknowledged & skipped.
+        """
+        try:
+            self.consumer.listen_message(
+                process_function=functools.partial(self.submit, process_function),
+                job_filter=job_filter,
+                workers=self.processes
+            )
+
+        finally:
+            self.shutdown()
+
+
+    def shutdown(self, wait: bool = True):
+        """ Stops all worker processes
+
+        Args:
+            wait (bool): Toggles if running jobs are awaited
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._task_counts.clear()
+
+        for pool in pools:
+            pool.shutdown(wait=wait)
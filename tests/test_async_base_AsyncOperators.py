@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import asyncio
+import json
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+import synmanager
+from conftest import HOST, PORT, TEST_MESSAGE_COUNT, TEST_ROUTING_KEY, TEST_QUEUE
+
+##################
+# Configurations #
+##################
+
+
+#################################################################
+# Tests - AsyncProducerOperator & AsyncConsumerOperator (async) #
+#################################################################
+
+def test_AsyncOperators_process_and_listen_message(test_kwargs):
+    """ Tests if concurrent message publishing & consumption over a single 
+        event loop is valid.
+
+    # C1: Check that all concurrent publications were confirmed
+    # C2: Check that all published messages were consumed
+    # C3: Check that all consumed messages are identical to their originals
+    """
+    async def run():
+        producer = synmanager.async_base.AsyncProducerOperator(
+            host=HOST, 
+            port=PORT,
+            concurrency=10
+        )
+        producer.routing_key = TEST_ROUTING_KEY
+
+        consumer = synmanager.async_base.AsyncConsumerOperator(
+            host=HOST, 
+            port=PORT,
+            concurrency=10
+        )
+        consumer.routing_key = TEST_ROUTING_KEY
+        consumer.queue = TEST_QUEUE
+
+        await producer.connect()
+        await consumer.connect()
+
+        messages = await asyncio.gather(*[
+            producer.process(**test_kwargs) 
+            for _ in range(TEST_MESSAGE_COUNT)
+        ])
+
+        store = []
+        async for delivery in consumer.listen_message():
+            store.append(delivery.kwargs)
+            delivery.ack()
+            if len(store) == TEST_MESSAGE_COUNT:
+                break
+
+        await producer.disconnect()
+        await consumer.disconnect()
+        return messages, store
+
+    messages, store = asyncio.run(run())
+
+    # C1
+    assert len(messages) == TEST_MESSAGE_COUNT
+    # C2
+    assert len(store) == TEST_MESSAGE_COUNT
+    # C3
+    assert all(kwargs == test_kwargs for kwargs in store)
+
+
+def test_AsyncOperators_malformed_delivery(test_message, test_kwargs):
+    """ Tests if malformed payloads only fail the delivery carrying them, &
+        can be rejected to free up their concurrency slot.
+
+    # C1: Check that deliveries are created without parsing their payloads
+    # C2: Check that parsing errors are raised upon access to kwargs
+    # C3: Check that rejecting the delivery releases its concurrency slot
+    # C4: Check that well-formed payloads are parsed once upon access
+    """
+    async def run():
+        rejected_tags = []
+        consumer = synmanager.async_base.AsyncConsumerOperator(host=HOST, port=PORT)
+        consumer.semaphore = asyncio.Semaphore(consumer.concurrency)
+        consumer.channel = SimpleNamespace(
+            basic_reject=lambda delivery_tag, requeue: rejected_tags.append(delivery_tag)
+        )
+        properties = SimpleNamespace(content_type=None, content_encoding=None)
+
+        await consumer.semaphore.acquire()
+        held_slots = consumer.semaphore._value
+
+        # C1
+        delivery = synmanager.async_base.AsyncDelivery(
+            consumer,
+            SimpleNamespace(delivery_tag=1),
+            properties,
+            b"{not valid json"
+        )
+        # C2
+        try:
+            delivery.kwargs
+            assert False, "Malformed payload was parsed"
+        except json.JSONDecodeError:
+            delivery.reject(requeue=False)
+        # C3
+        assert rejected_tags == [1]
+        assert consumer.semaphore._value == held_slots + 1
+
+        # C4
+        delivery = synmanager.async_base.AsyncDelivery(
+            consumer,
+            SimpleNamespace(delivery_tag=2),
+            properties,
+            test_message.encode()
+        )
+        assert delivery.kwargs == test_kwargs
+        assert delivery.kwargs is delivery.kwargs
+
+    asyncio.run(run())
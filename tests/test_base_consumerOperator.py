@@ -6,11 +6,14 @@
 
 # Generic/Built-in
 import logging
+import threading
 import time
 from multiprocessing import Process, Manager
+from types import SimpleNamespace
 
 # Libs
 import pika
+import pytest
 
 # Custom
 from conftest import (TEST_MESSAGE_COUNT, TEST_EXCHANGE, TEST_ROUTING_KEY)
@@ -105,6 +108,137 @@ def test_ConsumerOperator_poll_message(
     
     consumer_operator.disconnect()
 
+
+def test_ConsumerOperator_poll_message_off_thread(
+    test_message,
+    test_kwargs,
+    consumer_operator
+):
+    """ Tests if jobs run off the thread servicing the connection, which
+        keeps servicing I/O (e.g. heartbeats) until they complete. The broker
+        is stubbed, so that the thread performing each operation is observed.
+
+    # C1: Check that the job runs on a worker thread
+    # C2: Check that I/O is serviced while the job is running
+    # C3: Check that the acknowledgement is sent from the connection thread
+    # C4: Check that the job's result is returned
+    """
+    scheduled = []
+    events = []
+    def process_data_events(time_limit=None):
+        events.append(threading.get_ident())
+        while scheduled:
+            scheduled.pop(0)()
+        time.sleep(min(time_limit, 0.01))
+
+    acks = []
+    consumer_operator.connection = SimpleNamespace(
+        is_open=True,
+        add_callback_threadsafe=scheduled.append,
+        process_data_events=process_data_events
+    )
+    consumer_operator.channel = SimpleNamespace(
+        is_open=True,
+        basic_get=lambda queue, auto_ack: (
+            SimpleNamespace(routing_key=TEST_ROUTING_KEY, delivery_tag=1),
+            pika.BasicProperties(delivery_mode=2),
+            test_message.encode()
+        ),
+        basic_ack=lambda delivery_tag, multiple: acks.append(threading.get_ident())
+    )
+
+    job_threads = []
+    def test_slow_process(**kwargs):
+        job_threads.append(threading.get_ident())
+        time.sleep(0.1)
+        return kwargs
+
+    result = consumer_operator.poll_message(process_function=test_slow_process)
+    # C1
+    assert job_threads[0] != threading.get_ident()
+    # C2
+    assert len(events) > 1 and set(events) == {threading.get_ident()}
+    # C3
+    assert acks == [threading.get_ident()]
+    # C4
+    assert result == test_kwargs
+
+
+def test_ConsumerOperator_poll_messages(
+    test_message,
+    test_kwargs,
+    consumer_operator
+):
+    """ Tests if messages retrieved in batches are acknowledged together.
+        The broker is stubbed, so that the frames sent are observed.
+
+    # C1: Check that up to N messages are retrieved & processed in order
+    # C2: Check that failed messages are rejected individually
+    # C3: Check that successful messages are acknowledged in 1 frame
+    # C4: Check that the consumer is cancelled & prefetch is restored
+    # C5: Check that the QoS in force before polling is restored
+    # C6: Check that empty batches are refused
+    """
+    frames = []
+    def consume(queue, auto_ack, inactivity_timeout):
+        for delivery_tag in range(1, 10):
+            yield (
+                SimpleNamespace(routing_key=TEST_ROUTING_KEY, delivery_tag=delivery_tag),
+                pika.BasicProperties(delivery_mode=2),
+                test_message.encode()
+            )
+
+    consumer_operator.connection = SimpleNamespace(
+        is_open=True,
+        add_callback_threadsafe=lambda callback: callback(),
+        process_data_events=lambda time_limit=None: None
+    )
+    consumer_operator.channel = SimpleNamespace(
+        is_open=True,
+        consume=consume,
+        cancel=lambda: frames.append(('cancel',)),
+        basic_qos=lambda prefetch_size, prefetch_count: frames.append(
+            ('qos', prefetch_count)
+        ),
+        basic_ack=lambda delivery_tag, multiple: frames.append(
+            ('ack', delivery_tag, multiple)
+        ),
+        basic_reject=lambda delivery_tag, requeue: frames.append(
+            ('reject', delivery_tag)
+        )
+    )
+
+    calls = []
+    def test_flaky_process(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            raise ValueError("Flaky job")
+        return len(calls)
+
+    results = consumer_operator.poll_messages(
+        process_function=test_flaky_process, 
+        n=4
+    )
+    # C1
+    assert calls == [test_kwargs] * 4
+    assert results == [1, None, 3, 4]
+    # C2
+    assert ('reject', 2) in frames
+    # C3
+    assert [frame for frame in frames if frame[0] == 'ack'] == [('ack', 4, True)]
+    # C4
+    assert frames[:3] == [('qos', 4), ('cancel',), ('qos', 1)]
+
+    # C5
+    frames.clear()
+    consumer_operator.topology.qos = {'prefetch_size': 0, 'prefetch_count': 8}
+    consumer_operator.poll_messages(process_function=lambda **kwargs: None, n=2)
+    assert frames[:3] == [('qos', 2), ('cancel',), ('qos', 8)]
+
+    # C6
+    with pytest.raises(ValueError):
+        consumer_operator.poll_messages(process_function=test_flaky_process, n=0)
+
     
 # def test_ConsumerOperator_check_message_count(test_message, consumer_operator):
 #     """ Tests if state checking of queue is valid. This queries for the number
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import os
+
+# Libs
+import pytest
+
+# Custom
+from synmanager.blobs import CLAIM_MARKER, ClaimCheck, LocalBlobStore
+from conftest import enumerate_federated_conbinations
+
+##################
+# Configurations #
+##################
+
+
+######################
+# Tests - ClaimCheck #
+######################
+
+def test_ClaimCheck_roundtrip(tmp_path, test_kwargs, base_operator):
+    """ Tests if experiment records are checked out of job messages once, &
+        restored transparently when messages are parsed.
+
+    # C1: Check that experiment records are replaced by claims in messages
+    # C2: Check that each distinct experiment record is stored only once
+    # C3: Check that parsed kwargs are identical to the unclaimed originals
+    """
+    base_operator.claim_check = ClaimCheck(LocalBlobStore(str(tmp_path)))
+
+    job_combinations = enumerate_federated_conbinations(**test_kwargs)
+    for job_key, job_kwargs in job_combinations.items():
+        job = {
+            'process': 'train',
+            'combination_key': list(job_key),
+            'combination_params': job_kwargs
+        }
+        message = base_operator.create_message(job)
+        
+        # C1
+        assert CLAIM_MARKER in message
+        assert '"model"' not in message
+        # C3
+        assert base_operator.parse_message(message) == job
+
+    # C2
+    stored_blobs = [files for _, _, files in os.walk(tmp_path) if files]
+    assert sum(len(files) for files in stored_blobs) == 1
+
+
+def test_ClaimCheck_threshold(tmp_path, test_kwargs):
+    """ Tests if sub-objects smaller than the threshold are sent inline.
+
+    # C1: Check that small sub-objects are not checked out
+    """
+    claim_check = ClaimCheck(LocalBlobStore(str(tmp_path)), threshold=10**6)
+
+    # C1
+    assert claim_check.check_in(test_kwargs) == test_kwargs
+
+
+def test_ClaimCheck_untrusted_digest(tmp_path, test_kwargs):
+    """ Tests if claims in received messages are verified before resolution.
+
+    # C1: Check that malformed digests (e.g. paths) are rejected
+    # C2: Check that blobs not matching their digests are rejected
+    """
+    store = LocalBlobStore(str(tmp_path / "blobs"))
+    claim_check = ClaimCheck(store, threshold=0)
+    (tmp_path / "secret").write_text('"secret"')
+
+    # C1
+    for digest in ("sha256:../../secret", "sha256:" + "0" * 64 + "\n", 42):
+        with pytest.raises(ValueError):
+            claim_check.check_out({CLAIM_MARKER: digest})
+
+    # C2
+    claim = claim_check.check_in({'experiment': test_kwargs})['experiment']
+    store.put(claim[CLAIM_MARKER], b'"tampered"')
+    with pytest.raises(ValueError):
+        claim_check.check_out(claim)
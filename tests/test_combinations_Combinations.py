@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import types
+
+# Libs
+
+
+# Custom
+from synmanager.combinations import (
+    count_grid,
+    expand_grid,
+    generate_runs,
+    enumerate_federated_combinations,
+    generate_jobs
+)
+from conftest import EXPT_RECORD, RUN_RECORD_1, enumerate_federated_conbinations
+
+##################
+# Configurations #
+##################
+
+SEARCH_SPACE = {
+    'lr': [0.1, 0.01, 0.001],
+    'rounds': (5, 10),
+    'algorithm': "FedProx"
+}
+
+########################
+# Tests - Combinations #
+########################
+
+def test_Combinations_expand_grid():
+    """ Tests if search spaces are expanded lazily & in a stable order.
+
+    # C1: Check that expansion is lazy
+    # C2: Check that all hyperparameter sets are expanded, & counted upfront
+    # C3: Check that the last hyperparameter (by name) varies fastest
+    """
+    grid = expand_grid(SEARCH_SPACE)
+
+    # C1
+    assert isinstance(grid, types.GeneratorType)
+    # C2
+    hyperparameter_sets = list(grid)
+    assert len(hyperparameter_sets) == count_grid(SEARCH_SPACE) == 6
+    # C3
+    assert hyperparameter_sets[:2] == [
+        {'algorithm': "FedProx", 'lr': 0.1, 'rounds': 5},
+        {'algorithm': "FedProx", 'lr': 0.1, 'rounds': 10}
+    ]
+    assert hyperparameter_sets == list(expand_grid(SEARCH_SPACE))
+
+
+def test_Combinations_enumerate_federated_combinations(test_kwargs):
+    """ Tests if lazily enumerated combinations match the materialised ones.
+
+    # C1: Check that declared runs produce identical combinations
+    # C2: Check that runs generated from a search space are keyed uniquely
+    # C3: Check that job payloads are wrapped around combinations
+    """
+    # C1
+    combinations = enumerate_federated_combinations(**test_kwargs)
+    assert dict(combinations) == enumerate_federated_conbinations(**test_kwargs)
+
+    # C2
+    grid_combinations = list(enumerate_federated_combinations(
+        **{**test_kwargs, 'runs': []},
+        search_space=SEARCH_SPACE
+    ))
+    assert len(grid_combinations) == count_grid(SEARCH_SPACE)
+    assert len({key for key, _ in grid_combinations}) == len(grid_combinations)
+    for (_, _, expt_id, _), params in grid_combinations:
+        assert expt_id == EXPT_RECORD['key']['expt_id']
+        assert params['run']['algorithm'] == "FedProx"
+
+    # C3
+    runs = generate_runs(EXPT_RECORD, SEARCH_SPACE, base_run=RUN_RECORD_1)
+    jobs = generate_jobs('train', enumerate_federated_combinations(
+        **{**test_kwargs, 'runs': runs}
+    ))
+    for job in jobs:
+        assert job['process'] == 'train'
+        assert job['combination_params']['run']['seed'] == RUN_RECORD_1['seed']
@@ -43,7 +43,8 @@ def test_CompletedProducerOperator_publish_message(
     declared_queue = completed_producer_operator.channel.queue_declare(
         COMPLETED_QUEUE, 
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=completed_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 1
@@ -81,7 +82,8 @@ def test_CompletedProducerOperator_process(
     declared_queue = completed_producer_operator.channel.queue_declare(
         COMPLETED_QUEUE,
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=completed_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 2
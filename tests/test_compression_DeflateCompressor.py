@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+
+
+# Libs
+import pytest
+
+# Custom
+from synmanager.compression import (
+    DEFLATE_ENCODING, 
+    SYNERGOS_DEFLATE_ENCODING, 
+    compress, 
+    decompress
+)
+
+##################
+# Configurations #
+##################
+
+
+#############################
+# Tests - DeflateCompressor #
+#############################
+
+def test_DeflateCompressor_roundtrip(test_message):
+    """ Tests if compressed payloads are restored exactly, & if the preset
+        dictionary improves on plain deflate for Synergos job payloads.
+
+    # C1: Check that payloads are restored to their originals
+    # C2: Check that the advertised content encoding is the one applied
+    # C3: Check that dictionary-primed payloads are smaller than plain ones
+    """
+    plain_payload, plain_encoding = compress(
+        test_message, 
+        encoding=DEFLATE_ENCODING, 
+        threshold=0
+    )
+    primed_payload, primed_encoding = compress(
+        test_message, 
+        encoding=SYNERGOS_DEFLATE_ENCODING, 
+        threshold=0
+    )
+
+    # C1
+    assert decompress(plain_payload, plain_encoding).decode() == test_message
+    assert decompress(primed_payload, primed_encoding).decode() == test_message
+    # C2
+    assert plain_encoding == DEFLATE_ENCODING
+    assert primed_encoding == SYNERGOS_DEFLATE_ENCODING
+    # C3
+    assert len(primed_payload) < len(plain_payload) < len(test_message)
+
+
+def test_DeflateCompressor_threshold(test_message):
+    """ Tests if payloads below the compression threshold are left raw.
+
+    # C1: Check that small payloads are not compressed
+    # C2: Check that raw payloads pass through decompression untouched
+    # C3: Check that payloads are measured in bytes, rather than characters
+    """
+    payload, encoding = compress(
+        test_message, 
+        encoding=SYNERGOS_DEFLATE_ENCODING, 
+        threshold=len(test_message) + 1
+    )
+
+    # C1
+    assert payload == test_message
+    assert encoding is None
+    # C2
+    assert decompress(test_message.encode(), encoding) == test_message.encode()
+    # C3
+    multibyte_message = "模型" * 300     # 600 characters, 1800 bytes
+    payload, encoding = compress(
+        multibyte_message, 
+        encoding=DEFLATE_ENCODING, 
+        threshold=1024
+    )
+    assert encoding == DEFLATE_ENCODING
+    assert decompress(payload, encoding).decode() == multibyte_message
+
+
+def test_DeflateCompressor_max_size():
+    """ Tests if payloads are refused once they expand beyond a max size.
+
+    # C1: Check that payloads within the max size are restored
+    # C2: Check that small payloads expanding beyond the max size are refused
+    """
+    payload, encoding = compress(b"0" * 10**6, encoding=DEFLATE_ENCODING)
+
+    # C1
+    assert decompress(payload, encoding, max_size=10**6) == b"0" * 10**6
+    # C2
+    assert len(payload) < 10**4
+    with pytest.raises(ValueError):
+        decompress(payload, encoding, max_size=10**6 - 1)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager.dedup import COMPLETED, IN_FLIGHT, DeduplicationCache
+from conftest import RUN_RECORD_1, RUN_RECORD_2
+
+##################
+# Configurations #
+##################
+
+
+##############################
+# Tests - DeduplicationCache #
+##############################
+
+def test_DeduplicationCache_message_id(base_operator):
+    """ Tests if message IDs are deterministic for identical jobs.
+
+    # C1: Check that identical jobs share the same message ID
+    # C2: Check that different jobs have different message IDs
+    """
+    # C1
+    assert (
+        base_operator.create_message_id({'run': RUN_RECORD_1}) ==
+        base_operator.create_message_id({'run': dict(RUN_RECORD_1)})
+    )
+    # C2
+    assert (
+        base_operator.create_message_id({'run': RUN_RECORD_1}) !=
+        base_operator.create_message_id({'run': RUN_RECORD_2})
+    )
+
+
+def test_DeduplicationCache_check_in(tmp_path):
+    """ Tests if jobs in flight or completed are detected as duplicates.
+
+    # C1: Check that new jobs are admitted & marked in-flight
+    # C2: Check that failed jobs are forgotten, so that retries are admitted
+    # C3: Check that completed jobs are remembered across restarts
+    # C4: Check that hits & misses are counted
+    """
+    path = str(tmp_path / "dedup.log")
+    dedup_cache = DeduplicationCache(path=path)
+
+    # C1
+    assert dedup_cache.check_in("job_1") is None
+    assert dedup_cache.check_in("job_1") == IN_FLIGHT
+    # C2
+    dedup_cache.release("job_1")
+    assert dedup_cache.check_in("job_1") is None
+    # C3
+    dedup_cache.complete("job_1")
+    dedup_cache.close()
+    restored_cache = DeduplicationCache(path=path)
+    assert restored_cache.check_in("job_1") == COMPLETED
+    # C4
+    assert dedup_cache.get_stats()['hits'] == 1
+    assert dedup_cache.get_stats()['misses'] == 2
+    assert restored_cache.get_stats()['hits'] == 1
+
+
+def test_DeduplicationCache_consumer(consumer_operator, producer_operator):
+    """ Tests if consumers drop redeliveries of completed jobs.
+
+    # C1: Check that a job is only processed once
+    # C2: Check that duplicates are still acknowledged
+    """
+    consumer_operator.dedup_cache = DeduplicationCache(max_size=10)
+
+    job = {'run': RUN_RECORD_1}
+    processed_jobs = []
+    acknowledged_tags = []
+    channel = SimpleNamespace(
+        basic_ack=lambda delivery_tag: acknowledged_tags.append(delivery_tag),
+        basic_reject=lambda delivery_tag: None
+    )
+    properties = SimpleNamespace(
+        content_type=None,
+        content_encoding=None,
+        headers=producer_operator.create_headers(job),
+        message_id=producer_operator.create_message_id(job)
+    )
+    callback = consumer_operator.generate_callback(
+        process_function=lambda **kwargs: processed_jobs.append(kwargs)
+    )
+    for delivery_tag in [1, 2]:
+        method = SimpleNamespace(
+            routing_key="key", 
+            delivery_tag=delivery_tag, 
+            redelivered=delivery_tag > 1
+        )
+        callback(channel, method, properties, producer_operator.create_message(job).encode())
+
+    # C1
+    assert processed_jobs == [job]
+    # C2
+    assert acknowledged_tags == [1, 2]
+
+
+def test_DeduplicationCache_unparsable(consumer_operator, producer_operator):
+    """ Tests if jobs failing to parse are released, so that their
+        redeliveries are processed instead of being dropped as duplicates.
+
+    # C1: Check that an unparsable delivery is rejected, not acknowledged
+    # C2: Check that its redelivery is still processed
+    """
+    consumer_operator.dedup_cache = DeduplicationCache(max_size=10)
+
+    job = {'run': RUN_RECORD_1}
+    processed_jobs = []
+    acknowledged_tags = []
+    rejected_tags = []
+    channel = SimpleNamespace(
+        basic_ack=lambda delivery_tag: acknowledged_tags.append(delivery_tag),
+        basic_reject=lambda delivery_tag, requeue=True: rejected_tags.append(delivery_tag)
+    )
+    properties = SimpleNamespace(
+        content_type=None,
+        content_encoding=None,
+        headers=producer_operator.create_headers(job),
+        message_id=producer_operator.create_message_id(job)
+    )
+    callback = consumer_operator.generate_callback(
+        process_function=lambda **kwargs: processed_jobs.append(kwargs)
+    )
+    bodies = [b"{not valid json", producer_operator.create_message(job).encode()]
+    for delivery_tag, body in enumerate(bodies, start=1):
+        method = SimpleNamespace(
+            routing_key="key", 
+            delivery_tag=delivery_tag, 
+            redelivered=delivery_tag > 1
+        )
+        callback(channel, method, properties, body)
+
+    # C1
+    assert rejected_tags == [1]
+    # C2
+    assert processed_jobs == [job]
+    assert acknowledged_tags == [2]
@@ -44,7 +44,8 @@ def test_EvaluateProducerOperator_publish_message(
     declared_queue = evaluate_producer_operator.channel.queue_declare(
         EVALUATE_QUEUE, 
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=evaluate_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 1
@@ -83,7 +84,8 @@ def test_EvaluateProducerOperator_process(
     declared_queue = evaluate_producer_operator.channel.queue_declare(
         EVALUATE_QUEUE,
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=evaluate_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 2
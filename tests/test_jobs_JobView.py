@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager.jobs import JobView, extract_job_key
+from conftest import RUN_KEY_1, enumerate_federated_conbinations
+
+##################
+# Configurations #
+##################
+
+
+###################
+# Tests - JobView #
+###################
+
+def test_JobView_extract_job_key(test_kwargs, base_operator):
+    """ Tests if job keys are extracted from Synergos job configurations.
+
+    # C1: Check that the shallowest key found is used
+    # C2: Check that headers created carry the run key of each job
+    """
+    # C1
+    assert extract_job_key({'key': RUN_KEY_1, 'runs': [{'key': {}}]}) == RUN_KEY_1
+    assert extract_job_key({'process': 'train'}) == {}
+
+    job_combinations = enumerate_federated_conbinations(**test_kwargs)
+    for job_key, job_kwargs in job_combinations.items():
+        headers = base_operator.create_headers(job_kwargs)
+        
+        # C2
+        assert headers['run_id'] == job_key[3]
+        assert headers['expt_id'] == job_key[2]
+
+
+def test_JobView_lazy_payload(base_operator):
+    """ Tests if routing metadata is served from headers without parsing.
+
+    # C1: Check that job keys are read off headers without parsing payload
+    # C2: Check that payload is parsed upon first access
+    # C3: Check that job keys fall back to payload for header-less messages
+    """
+    job = {'key': RUN_KEY_1, 'process': 'train'}
+    method = SimpleNamespace(routing_key="key", delivery_tag=1, redelivered=False)
+    body = base_operator.create_message(job).encode()
+
+    properties = SimpleNamespace(
+        content_type=None,
+        content_encoding=None,
+        headers=base_operator.create_headers(job)
+    )
+    view = JobView(base_operator, method, properties, body)
+
+    # C1
+    assert view.has_key_headers()
+    assert view.key == RUN_KEY_1
+    assert not view.is_parsed()
+    # C2
+    assert view.payload == job
+    assert view.is_parsed()
+
+    legacy_properties = SimpleNamespace(
+        content_type=None,
+        content_encoding=None,
+        headers=None
+    )
+    legacy_view = JobView(base_operator, method, legacy_properties, body)
+
+    # C3
+    assert not legacy_view.has_key_headers()
+    assert legacy_view.key == RUN_KEY_1
+    assert legacy_view.is_parsed()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import time
+import urllib.request
+from types import SimpleNamespace
+
+# Libs
+import pika
+import pytest
+
+# Custom
+from conftest import TEST_ROUTING_KEY
+from synmanager.metrics import MetricsRegistry, PUBLISHED_AT_HEADER
+
+##################
+# Configurations #
+##################
+
+
+###########################
+# Tests - MetricsRegistry #
+###########################
+
+def test_MetricsRegistry_render_prometheus(tmp_path):
+    """ Tests if counters & histograms are exposed in the Prometheus text
+        format, both as a file & over HTTP.
+
+    # C1: Check that observations fall into fixed buckets
+    # C2: Check that series are split by their labels
+    # C3: Check that the exposition file is written in full
+    # C4: Check that the exposition is served over HTTP
+    """
+    registry = MetricsRegistry(buckets=(0.1, 1))
+    for latency in (0.05, 0.5, 5):
+        registry.observe('synmq_process_seconds', latency, queue='train')
+    registry.increment('synmq_consumed_total', queue='train')
+    registry.increment('synmq_consumed_total', 2, queue='evaluate')
+
+    # C1
+    histogram = registry.snapshot()['histograms']['synmq_process_seconds']
+    assert histogram[(('queue', 'train'),)] == {
+        'buckets': {'0.1': 1, '1': 2, '+Inf': 3},
+        'sum': 5.55,
+        'count': 3
+    }
+
+    # C2
+    exposition = registry.render_prometheus()
+    assert 'synmq_consumed_total{queue="train"} 1' in exposition
+    assert 'synmq_consumed_total{queue="evaluate"} 2' in exposition
+    assert 'synmq_process_seconds_bucket{queue="train",le="+Inf"} 3' in exposition
+
+    # C3
+    path = tmp_path / "synmq.prom"
+    registry.write_prometheus(str(path))
+    assert path.read_text() == exposition
+    assert list(tmp_path.iterdir()) == [path]
+
+    # C4
+    server = registry.serve_prometheus(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.read().decode() == exposition
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_MetricsRegistry_consumer_instrumentation(
+    test_message,
+    test_kwargs,
+    consumer_operator
+):
+    """ Tests if consumers record the latency of every stage of handling a
+        delivery, labelled by the queue consumed from.
+
+    # C1: Check that queue wait is measured from the publish timestamp
+    # C2: Check that parse, process & ack latencies are recorded
+    # C3: Check that completed & failed jobs are counted separately
+    """
+    registry = MetricsRegistry()
+    consumer_operator.metrics = registry
+    queue = consumer_operator.queue or consumer_operator.routing_key
+
+    ch = SimpleNamespace(
+        basic_ack=lambda delivery_tag: None,
+        basic_reject=lambda delivery_tag, requeue=True: None
+    )
+    method = SimpleNamespace(routing_key=TEST_ROUTING_KEY, delivery_tag=1)
+    properties = pika.BasicProperties(
+        headers={PUBLISHED_AT_HEADER: time.time() - 2}
+    )
+
+    def test_failing_process(**kwargs):
+        raise ValueError("Failed job")
+
+    callback = consumer_operator.generate_callback(lambda **kwargs: kwargs)
+    assert callback(ch, method, properties, test_message.encode()) == test_kwargs
+    consumer_operator.generate_callback(test_failing_process)(
+        ch, method, properties, test_message.encode()
+    )
+
+    snapshot = registry.snapshot()
+    labels = (('queue', queue),)
+
+    # C1
+    queue_wait = snapshot['histograms']['synmq_queue_wait_seconds'][labels]
+    assert queue_wait['count'] == 2 and queue_wait['sum'] >= 4
+
+    # C2
+    for stage in ('parse', 'process', 'ack'):
+        assert snapshot['histograms'][f"synmq_{stage}_seconds"][labels]['count'] >= 1
+
+    # C3
+    processed = snapshot['counters']['synmq_processed_total']
+    assert processed[(('outcome', 'completed'), ('queue', queue))] == 1
+    assert processed[(('outcome', 'failed'), ('queue', queue))] == 1
+    assert snapshot['counters']['synmq_consumed_total'][labels] == 2
+
+
+def test_MetricsRegistry_producer_nacked(test_message, producer_operator):
+    """ Tests if publishes rejected by the broker are counted, before the
+        rejection is raised to the caller.
+
+    # C1: Check that the rejection is raised to the caller
+    # C2: Check that the publish is counted as nacked, & not as confirmed
+    """
+    registry = MetricsRegistry()
+    producer_operator.metrics = registry
+    producer_operator.connection = SimpleNamespace(is_open=True)
+
+    def nacked_publish(**kwargs):
+        raise pika.exceptions.NackError([])
+
+    producer_operator.channel = SimpleNamespace(
+        is_open=True,
+        basic_publish=nacked_publish
+    )
+
+    # C1
+    with pytest.raises(pika.exceptions.NackError):
+        producer_operator.publish_message(test_message)
+
+    # C2
+    published = registry.snapshot()['counters']['synmq_published_total']
+    assert [dict(labels)['outcome'] for labels in published] == ['nacked']
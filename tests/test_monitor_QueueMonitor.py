@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+import pika
+import pytest
+
+# Custom
+from synmanager import monitor
+from synmanager.monitor import QueueMonitor
+
+##################
+# Configurations #
+##################
+
+TEST_QUEUES = ('train', 'evaluate')
+
+###########
+# Helpers #
+###########
+
+class Clock:
+    """ Manually advanced replacement of `time.monotonic` """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_broker(depths: dict, polls: list):
+    """ Creates a stub connection whose channel reports the given depths """
+    def queue_declare(queue, passive=False):
+        polls.append(queue)
+        if queue not in depths:
+            raise pika.exceptions.ChannelClosedByBroker(404, "NOT_FOUND")
+        return SimpleNamespace(
+            method=SimpleNamespace(message_count=depths[queue], consumer_count=2)
+        )
+
+    channel = SimpleNamespace(is_open=True, queue_declare=queue_declare)
+    return SimpleNamespace(
+        is_open=True,
+        channel=lambda: channel,
+        close=lambda: None
+    )
+
+########################
+# Tests - QueueMonitor #
+########################
+
+def test_QueueMonitor_get_message_count(monkeypatch):
+    """ Tests if reads are served from cached samples, polling the broker at
+        most once per interval regardless of the no. of readers.
+
+    # C1: Check that the 1st read samples all queues
+    # C2: Check that reads within the interval do not poll the broker
+    # C3: Check that stale samples are refreshed on the next read
+    # C4: Check that missing queues are skipped
+    """
+    clock = Clock()
+    depths = {'train': 10, 'evaluate': 3}
+    polls = []
+    monkeypatch.setattr(monitor.time, 'monotonic', clock)
+    monkeypatch.setattr(
+        monitor.pika,
+        'BlockingConnection',
+        lambda parameters: create_broker(depths, polls)
+    )
+    queue_monitor = QueueMonitor('localhost', 5672, queues=TEST_QUEUES, interval=5)
+
+    # C1
+    assert queue_monitor.get_message_count('train') == 10
+    assert queue_monitor.get_consumer_count('evaluate') == 2
+    assert polls == list(TEST_QUEUES)
+
+    # C2
+    depths['train'] = 20
+    clock.now += 4
+    for _ in range(100):
+        assert queue_monitor.get_message_count('train') == 10
+    assert len(polls) == 2
+
+    # C3
+    clock.now += 1
+    assert queue_monitor.get_message_count('train') == 20
+    assert len(polls) == 4
+
+    # C4
+    del depths['evaluate']
+    clock.now += 5
+    assert queue_monitor.get_message_count('evaluate') == 3
+    assert len(queue_monitor.get_history('evaluate')) == 2
+    with pytest.raises(RuntimeError):
+        QueueMonitor('localhost', 5672, queues=['missing']).get_message_count('missing')
+
+
+def test_QueueMonitor_get_rates(monkeypatch):
+    """ Tests if enqueue & dequeue rates are derived from sampled depths.
+
+    # C1: Check that rates are 0 with fewer than 2 samples
+    # C2: Check that increases & decreases are attributed separately
+    # C3: Check that only the latest samples are used within a window
+    # C4: Check that samples beyond the history are discarded
+    """
+    clock = Clock()
+    depths = {'train': 0}
+    polls = []
+    monkeypatch.setattr(monitor.time, 'monotonic', clock)
+    monkeypatch.setattr(
+        monitor.pika,
+        'BlockingConnection',
+        lambda parameters: create_broker(depths, polls)
+    )
+    queue_monitor = QueueMonitor(
+        'localhost', 5672, queues=['train'], interval=5, history=4
+    )
+
+    # C1
+    assert queue_monitor.get_rates('train') == (0.0, 0.0, 0.0)
+
+    # C2
+    for depth in (30, 10):
+        clock.now += 5
+        depths['train'] = depth
+        queue_monitor.sample()
+    rates = queue_monitor.get_rates('train')    # +30 then -20 over 10s
+    assert rates.enqueue_rate == 3.0
+    assert rates.dequeue_rate == 2.0
+    assert rates.net_rate == 1.0
+
+    # C3
+    assert queue_monitor.get_rates('train', window=2) == (0.0, 4.0, -4.0)
+
+    # C4
+    for depth in (10, 10):
+        clock.now += 5
+        depths['train'] = depth
+        queue_monitor.sample()
+    history = queue_monitor.get_history('train')
+    assert [sample.message_count for sample in history] == [30, 10, 10, 10]
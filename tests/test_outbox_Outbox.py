@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import os
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager.outbox import Outbox, OutboxFlusher, SEGMENT_SUFFIX
+
+##################
+# Configurations #
+##################
+
+
+##################
+# Tests - Outbox #
+##################
+
+def test_Outbox_stage(tmp_path, test_kwargs, train_producer_operator):
+    """ Tests if producers with an outbox stage jobs on disk without a broker.
+
+    # C1: Check that jobs are staged without connecting to the broker
+    # C2: Check that staged jobs are read back in order, with their metadata
+    # C3: Check that job fields named like delivery options stay in the job
+    """
+    train_producer_operator.outbox = Outbox(str(tmp_path))
+
+    # C1
+    for run in test_kwargs['runs']:
+        train_producer_operator.process_with({'run': run}, priority=5)
+    assert train_producer_operator.outbox.count_pending() == len(test_kwargs['runs'])
+
+    # C2
+    entries = train_producer_operator.outbox.read(timeout=0)
+    for entry, run in zip(entries, test_kwargs['runs']):
+        assert train_producer_operator.parse_message(entry.message) == {'run': run}
+        assert entry.priority == 5
+        assert entry.headers['run_id'] == run['key']['run_id']
+
+    # C3
+    job = {'run': test_kwargs['runs'][0], 'priority': 'high', 'delay': 3}
+    train_producer_operator.process(**job)
+    entry, = train_producer_operator.outbox.read(timeout=0)
+    assert train_producer_operator.parse_message(entry.message) == job
+    assert entry.priority is None and entry.release_at is None
+
+
+def test_Outbox_commit(tmp_path):
+    """ Tests if committed entries are compacted away & uncommitted entries
+        survive restarts, even after a torn append.
+
+    # C1: Check that committed segments are deleted
+    # C2: Check that only uncommitted entries are replayed after a restart
+    # C3: Check that a torn record at the end of the log is discarded
+    """
+    outbox = Outbox(str(tmp_path), segment_size=64)
+    for idx in range(10):
+        outbox.append(f"message_{idx}")
+
+    entries = outbox.read(max_entries=6, timeout=0)
+    outbox.commit(entries[-1].position, count=len(entries))
+
+    # C1
+    segments = [name for name in os.listdir(tmp_path) if name.endswith(SEGMENT_SUFFIX)]
+    assert len(segments) < 10
+    assert outbox.count_pending() == 4
+
+    outbox.close()
+    with open(os.path.join(tmp_path, max(segments)), 'ab') as segment:
+        segment.write(b"\x10\x00")
+
+    # C2
+    restored_outbox = Outbox(str(tmp_path), segment_size=64)
+    assert restored_outbox.count_pending() == 4
+    # C3
+    restored_outbox.append("message_10")
+    assert [entry.message for entry in restored_outbox.read(timeout=0)] == [
+        f"message_{idx}".encode() for idx in range(6, 11)
+    ]
+
+
+def test_Outbox_flush_encoding(
+    tmp_path, 
+    test_kwargs, 
+    train_producer_operator, 
+    producer_operator
+):
+    """ Tests if staged jobs are flushed as encoded by the producer that
+        staged them, rather than by the flusher's producer.
+
+    # C1: Check that jobs are staged compressed, with their content settings
+    # C2: Check that flushed jobs keep the staging producer's content settings
+    # C3: Check that flushed jobs are parsed back by their consumers
+    """
+    outbox = Outbox(str(tmp_path))
+    train_producer_operator.outbox = outbox
+    train_producer_operator.codec = 'msgpack'
+    train_producer_operator.compression = 'deflate'
+    train_producer_operator.compression_threshold = 0
+    run = test_kwargs['runs'][0]
+    train_producer_operator.process(**{'run': run})
+
+    # C1
+    entry, = outbox.read(timeout=0)
+    assert entry.content_type == "application/msgpack"
+    assert entry.content_encoding == 'deflate'
+    outbox.rewind()
+
+    published = []
+    producer_operator.connection = SimpleNamespace(
+        is_open=True,
+        # Deliveries are left unconfirmed, without waiting out the timeout
+        process_data_events=lambda time_limit=None: (
+            producer_operator._batch_pending.clear()
+        )
+    )
+    producer_operator.channel = SimpleNamespace(is_open=True)
+    producer_operator.batch_channel = SimpleNamespace(
+        is_open=True,
+        _impl=SimpleNamespace(
+            basic_publish=lambda **kwargs: published.append(kwargs)
+        )
+    )
+    flusher = OutboxFlusher(outbox, producer_operator, poll_interval=0)
+    flusher._OutboxFlusher__flush()
+
+    # C2
+    delivery, = published
+    assert delivery['body'] == entry.message
+    assert delivery['properties'].content_type == entry.content_type
+    assert delivery['properties'].content_encoding == entry.content_encoding
+
+    # C3
+    body = train_producer_operator.decompress_message(
+        delivery['body'], 
+        delivery['properties'].content_encoding
+    )
+    assert train_producer_operator.parse_message(
+        body, 
+        content_type=delivery['properties'].content_type
+    ) == {'run': run}
+
+
+def test_Outbox_dead_letter(tmp_path):
+    """ Tests if entries failing to publish on every attempt are set aside,
+        rather than blocking all later entries. The producer is stubbed to 
+        nack the 1st entry.
+
+    # C1: Check that failing entries are retried up to the max attempts
+    # C2: Check that failing entries are set aside with their errors
+    # C3: Check that later entries are published once the head is set aside
+    """
+    outbox = Outbox(str(tmp_path))
+    for idx in range(3):
+        outbox.append(f"message_{idx}", message_id=f"job-{idx}")
+
+    published = []
+    def publish_batch(messages):
+        messages = [message for message, _ in messages]
+        published.append(messages)
+        return [message != b"message_0" for message in messages]
+
+    producer = SimpleNamespace(
+        routing_key="test",
+        is_connected=lambda: True,
+        publish_batch=publish_batch
+    )
+    flusher = OutboxFlusher(outbox, producer, poll_interval=0, max_attempts=3)
+
+    # C1
+    for _ in range(3):
+        assert not flusher._OutboxFlusher__flush()
+        outbox.rewind()
+    assert len(published) == 3
+    assert outbox.count_pending() == 2
+
+    # C2
+    (entry, error), = outbox.read_dead_letters()
+    assert entry.message == b"message_0"
+    assert entry.message_id == "job-0"
+    assert error == "Publish was not confirmed"
+
+    # C3
+    assert flusher._OutboxFlusher__flush()
+    assert published[-1] == [b"message_1", b"message_2"]
+    assert outbox.count_pending() == 0
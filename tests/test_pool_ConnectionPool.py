@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager import pool as pool_module
+from synmanager.pool import ConnectionPool
+
+##################
+# Configurations #
+##################
+
+
+##########################
+# Tests - ConnectionPool #
+##########################
+
+def test_ConnectionPool_shared_connection(
+    preprocess_producer_operator,
+    train_producer_operator
+):
+    """ Tests if phase operators connected via a common pool multiplex their
+        channels over a single connection.
+
+    # C1: Check that both operators were given the same connection
+    # C2: Check that both operators were given their own channels
+    """
+    pool = ConnectionPool()
+    preprocess_producer_operator.pool = pool
+    train_producer_operator.pool = pool
+
+    preprocess_producer_operator.connect()
+    train_producer_operator.connect()
+
+    # C1
+    assert preprocess_producer_operator.connection is train_producer_operator.connection
+    # C2
+    assert (
+        preprocess_producer_operator.channel.channel_number != 
+        train_producer_operator.channel.channel_number
+    )
+    preprocess_producer_operator.disconnect()
+    train_producer_operator.disconnect()
+    pool.close()
+
+
+def test_ConnectionPool_evict_idle(train_producer_operator):
+    """ Tests if released connections are kept for reuse, and only closed
+        after they have been idle for too long.
+
+    # C1: Check that a released connection is reused by a reconnecting operator
+    # C2: Check that idle connections are closed upon eviction
+    """
+    pool = ConnectionPool(idle_timeout=0)
+    train_producer_operator.pool = pool
+
+    train_producer_operator.connect()
+    connection = train_producer_operator.connection
+    train_producer_operator.disconnect()
+
+    # C2
+    assert not connection.is_open
+    
+    pool.idle_timeout = 300
+    train_producer_operator.connect()
+    connection = train_producer_operator.connection
+    train_producer_operator.disconnect()
+    train_producer_operator.connect()
+
+    # C1
+    assert train_producer_operator.connection is connection
+
+    train_producer_operator.disconnect()
+    pool.close()
+
+
+def test_ConnectionPool_parameters(monkeypatch):
+    """ Tests if connections are only shared between operators asking for the
+        same connection parameters, & if closed connections are never leased.
+        The broker is stubbed.
+
+    # C1: Check that leases with identical parameters share a connection
+    # C2: Check that leases with different parameters get their own connection
+    # C3: Check that closed connections are replaced before health checks are due
+    """
+    monkeypatch.setattr(
+        pool_module.pika,
+        'BlockingConnection',
+        lambda parameters: SimpleNamespace(is_open=True, parameters=parameters)
+    )
+    pool = ConnectionPool(health_check_interval=300)
+
+    # C1
+    producer_connection = pool.acquire("localhost", 5672, heartbeat=0)
+    assert pool.acquire("localhost", 5672, heartbeat=0) is producer_connection
+
+    # C2
+    consumer_connection = pool.acquire("localhost", 5672, heartbeat=30)
+    assert consumer_connection is not producer_connection
+    assert consumer_connection.parameters.heartbeat == 30
+
+    # C3
+    producer_connection.is_open = False
+    reopened_connection = pool.acquire("localhost", 5672, heartbeat=0)
+    assert reopened_connection is not producer_connection
+    assert reopened_connection.is_open
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import time
+
+# Libs
+
+
+# Custom
+from synmanager.prefetch import AdaptivePrefetch
+
+##################
+# Configurations #
+##################
+
+
+class Clock:
+    """ Manually advanced replacement of `time.monotonic` """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def deliver(self, controller, processing_time, idle_time):
+        self.now += idle_time
+        controller.record_arrival()
+        self.now += processing_time
+        controller.record_completion(processing_time)
+
+############################
+# Tests - AdaptivePrefetch #
+############################
+
+def test_AdaptivePrefetch_update(monkeypatch):
+    """ Tests if prefetch counts follow processing times & round trips.
+
+    # C1: Check that fast jobs dominated by round trips raise prefetch
+    # C2: Check that adjustments are rate limited
+    # C3: Check that slow jobs lower prefetch back down to concurrency
+    # C4: Check that prefetch counts stay within bounds
+    """
+    clock = Clock()
+    monkeypatch.setattr(time, 'monotonic', clock)
+    controller = AdaptivePrefetch(max_prefetch=50, adjust_interval=5)
+    assert controller.reset(concurrency=2) == 2
+
+    # C1
+    for _ in range(50):
+        clock.deliver(controller, processing_time=0.015625, idle_time=0.125)
+    assert controller.update(concurrency=2) == 18
+    # C2
+    assert controller.update(concurrency=2) is None
+    # C3
+    for _ in range(50):
+        clock.deliver(controller, processing_time=60, idle_time=0.05)
+    assert controller.update(concurrency=2) == 2
+    # C4
+    for _ in range(50):
+        clock.deliver(controller, processing_time=0.001, idle_time=0.05)
+    clock.now += 5
+    assert controller.update(concurrency=2) == 50
@@ -40,7 +40,8 @@ def test_PreprocessProducerOperator_publish_message(
     declared_queue = preprocess_producer_operator.channel.queue_declare(
         PREPROCESS_QUEUE, 
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=preprocess_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 1
@@ -74,7 +75,8 @@ def test_PreprocessProducerOperator_process(
     declared_queue = preprocess_producer_operator.channel.queue_declare(
         PREPROCESS_QUEUE,
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=preprocess_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == TEST_MESSAGE_COUNT
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+
+
+# Libs
+
+
+# Custom
+from synmanager.config import MAX_PRIORITY
+from synmanager.priority import (
+    CostPriorityPolicy,
+    TierPriorityPolicy,
+    clamp_priority
+)
+from conftest import RUN_RECORD_1, RUN_RECORD_2, enumerate_federated_conbinations
+
+##################
+# Configurations #
+##################
+
+
+##########################
+# Tests - PriorityPolicy #
+##########################
+
+def test_PriorityPolicy_policies():
+    """ Tests if jobs are mapped to priorities by tier & cost.
+
+    # C1: Check that recognised tiers are mapped to their priorities
+    # C2: Check that unrecognised tiers fall back to the default priority
+    # C3: Check that cheaper runs are prioritised over expensive ones
+    """
+    tier_policy = TierPriorityPolicy({'premium': 9, 'free': 1}, default=3)
+    # C1
+    assert tier_policy({'tier': 'premium'}) == 9
+    # C2
+    assert tier_policy({}) == 3
+
+    # C3
+    cost_policy = CostPriorityPolicy()
+    cheap_run = {'combination_params': {'run': RUN_RECORD_1}}   # 5 x 2
+    costly_run = {'combination_params': {'run': RUN_RECORD_2}}  # 7 x 30
+    assert cost_policy(cheap_run) > cost_policy(costly_run)
+
+
+def test_PriorityPolicy_create_priority(
+    test_kwargs, 
+    train_producer_operator, 
+    base_operator
+):
+    """ Tests if producers resolve priorities within the range of their queues.
+
+    # C1: Check that jobs bound for the same queue are given distinct priorities
+    # C2: Check that explicit priorities take precedence over policies
+    # C3: Check that priorities are clamped to the queue's max priority
+    # C4: Check that priorities are dropped for plain FIFO queues
+    """
+    train_producer_operator.priority_policy = CostPriorityPolicy()
+    train_jobs = [
+        {
+            'process': 'train',
+            'combination_key': job_key,
+            'combination_params': job_kwargs
+        }
+        for job_key, job_kwargs in enumerate_federated_conbinations(
+            **test_kwargs
+        ).items()
+    ]
+    priorities = {
+        train_producer_operator.create_priority(job) for job in train_jobs
+    }
+
+    # C1
+    assert len(priorities) > 1
+    # C2
+    assert train_producer_operator.create_priority(train_jobs[0], 1) == 1
+    # C3
+    assert train_producer_operator.create_priority({}, 99) == MAX_PRIORITY
+    assert clamp_priority(-1) == 0
+    # C4
+    assert base_operator.create_priority({}, 5) is None
+    assert 'x-max-priority' not in base_operator.create_queue_arguments()
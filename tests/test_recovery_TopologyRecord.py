@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+import pika
+
+# Custom
+from synmanager.prefetch import AdaptivePrefetch
+from synmanager.recovery import (
+    RecordingChannel, 
+    TopologyRecord, 
+    calculate_backoff
+)
+
+##################
+# Configurations #
+##################
+
+
+class StubChannel:
+    """ Channel recording all operations performed over it """
+    def __init__(self):
+        self.is_open = True
+        self.operations = []
+        self.consumer_count = 0
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.operations.append((name, args, kwargs))
+
+    def basic_consume(self, queue, on_message_callback, **kwargs):
+        self.consumer_count += 1
+        self.operations.append(('basic_consume', (queue,), kwargs))
+        return f"ctag{self.consumer_count}"
+
+##########################
+# Tests - TopologyRecord #
+##########################
+
+def test_TopologyRecord_replay():
+    """ Tests if topology declared over a channel is replayed in order.
+
+    # C1: Check that declarations are recorded, except passive ones
+    # C2: Check that entities are redeclared in dependency order
+    # C3: Check that resumed consumers are tracked by their new tags
+    # C4: Check that deleted queues are forgotten with their bindings
+    """
+    topology = TopologyRecord()
+    channel = RecordingChannel(StubChannel(), topology)
+    channel.queue_declare("jobs", durable=True)
+    channel.queue_declare(queue="jobs", passive=True)
+    channel.exchange_declare(exchange="logs", exchange_type='topic')
+    channel.queue_bind(queue="jobs", exchange="logs", routing_key="jobs.#")
+    channel.basic_qos(prefetch_size=0, prefetch_count=1)
+    channel.basic_qos(prefetch_size=0, prefetch_count=4)
+    channel.basic_consume(queue="jobs", on_message_callback=print)
+
+    # C1
+    assert list(topology.queues) == ["jobs"]
+    assert topology.queues["jobs"] == {'queue': "jobs", 'durable': True}
+    assert topology.qos == {'prefetch_size': 0, 'prefetch_count': 4}
+    # C2
+    new_channel = StubChannel()
+    new_channel.consumer_count = 1
+    topology.replay(new_channel)
+    assert [operation[0] for operation in new_channel.operations] == [
+        'exchange_declare', 'queue_declare', 'queue_bind', 'basic_qos', 'basic_consume'
+    ]
+    # C3
+    assert list(topology.consumers) == ["ctag2"]
+    # C4
+    RecordingChannel(new_channel, topology).queue_delete("jobs")
+    assert not (topology.queues or topology.bindings or topology.consumers)
+
+
+def test_TopologyRecord_reconnect(monkeypatch, consumer_operator):
+    """ Tests if dropped connections are reopened with backoff, & have their
+        topology replayed. The broker is stubbed.
+
+    # C1: Check that backoff grows exponentially within bounds
+    # C2: Check that dropped connections are detected
+    # C3: Check that failed attempts are retried until one succeeds
+    # C4: Check that the topology is replayed onto the new channel
+    """
+    # C1
+    for attempt in range(1, 10):
+        assert 0 <= calculate_backoff(attempt, 0.5, 30) <= min(30, 0.5 * 2 ** (attempt - 1))
+
+    monkeypatch.setattr('time.sleep', lambda duration: None)
+    consumer_operator.topology.queues["jobs"] = {'queue': "jobs", 'durable': True}
+    consumer_operator.connection = SimpleNamespace(is_open=False)
+    consumer_operator.channel = SimpleNamespace(is_open=False)
+    # C2
+    assert not consumer_operator.is_connected()
+    assert consumer_operator.is_recoverable()
+
+    attempts = []
+    def connect():
+        attempts.append(len(attempts) + 1)
+        if len(attempts) < 3:
+            raise pika.exceptions.AMQPConnectionError("Broker is restarting")
+        consumer_operator.connection = SimpleNamespace(is_open=True)
+        consumer_operator.channel = RecordingChannel(
+            StubChannel(), 
+            consumer_operator.topology
+        )
+    monkeypatch.setattr(consumer_operator, 'connect', connect)
+
+    consumer_operator.reconnect()
+    # C3
+    assert attempts == [1, 2, 3]
+    assert consumer_operator.is_connected()
+    # C4
+    assert consumer_operator.channel.channel.operations == [
+        ('queue_declare', (), {'queue': "jobs", 'durable': True})
+    ]
+
+
+def test_TopologyRecord_adaptive_prefetch(monkeypatch, consumer_operator):
+    """ Tests if prefetch counts adjusted by the prefetch controller survive
+        reconnections. The broker is stubbed.
+
+    # C1: Check that adjustments over the delivering channel are recorded
+    # C2: Check that the adjusted prefetch count is replayed after reconnecting
+    """
+    monkeypatch.setattr('time.sleep', lambda duration: None)
+    consumer_operator.prefetch_count = 1
+    consumer_operator.prefetch_controller = AdaptivePrefetch()
+    monkeypatch.setattr(
+        consumer_operator.prefetch_controller, 
+        'update', 
+        lambda concurrency: 8
+    )
+    adaptive_callback = consumer_operator._ConsumerOperator__adapt_prefetch(
+        lambda ch, method, properties, body: None,
+        workers=2
+    )
+
+    # C1
+    delivering_channel = StubChannel()
+    adaptive_callback(delivering_channel, None, None, b"")
+    assert delivering_channel.operations == [
+        ('basic_qos', (), {'prefetch_size': 0, 'prefetch_count': 8})
+    ]
+    assert consumer_operator.topology.qos == {'prefetch_size': 0, 'prefetch_count': 8}
+
+    def connect():
+        consumer_operator.connection = SimpleNamespace(is_open=True)
+        consumer_operator.channel = RecordingChannel(
+            StubChannel(), 
+            consumer_operator.topology
+        )
+        consumer_operator.channel.basic_qos(
+            prefetch_size=0, 
+            prefetch_count=consumer_operator.prefetch_count
+        )
+    monkeypatch.setattr(consumer_operator, 'connect', connect)
+    consumer_operator.connection = SimpleNamespace(is_open=False)
+    consumer_operator.channel = SimpleNamespace(is_open=False)
+
+    # C2
+    consumer_operator.reconnect()
+    assert consumer_operator.channel.channel.operations[-1] == (
+        'basic_qos', (), {'prefetch_size': 0, 'prefetch_count': 8}
+    )
+
+
+def test_TopologyRecord_delay_queues(producer_operator):
+    """ Tests if staging queues of delayed jobs are kept out of the topology
+        replayed after reconnecting, since they expire on their own.
+
+    # C1: Check that staging queues are declared on the broker
+    # C2: Check that staging queues are not recorded for replay
+    """
+    channel = StubChannel()
+    producer_operator.connection = SimpleNamespace(is_open=True)
+    producer_operator.channel = RecordingChannel(channel, producer_operator.topology)
+    producer_operator.publish_message("{}", delay=5)
+
+    # C1
+    declared_queues = [
+        args[0] for name, args, _ in channel.operations if name == 'queue_declare'
+    ]
+    assert [queue for queue in declared_queues if ".delayed." in queue]
+    # C2
+    assert not [
+        queue for queue in producer_operator.topology.queues if ".delayed." in queue
+    ]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+import pika
+
+# Custom
+from synmanager.retry import (
+    ATTEMPT_HEADER, 
+    ERROR_HEADER, 
+    RetryPolicy, 
+    clear_retry_headers
+)
+from conftest import TEST_QUEUE, TEST_ROUTING_KEY
+
+##################
+# Configurations #
+##################
+
+
+#######################
+# Tests - RetryPolicy #
+#######################
+
+def test_RetryPolicy_get_delay():
+    """ Tests if retries are scheduled with exponential backoff.
+
+    # C1: Check that delays grow exponentially up to the max delay
+    # C2: Check that each backoff level has its own retry queue
+    # C3: Check that jobs are quarantined after the max no. of attempts
+    """
+    retry_policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=6)
+
+    # C1
+    assert [retry_policy.get_delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 6, 6]
+    # C2
+    retry_queues = retry_policy.get_retry_queues("jobs")
+    assert list(retry_queues) == [
+        "jobs.retry.1000", 
+        "jobs.retry.2000", 
+        "jobs.retry.4000", 
+        "jobs.retry.6000"
+    ]
+    assert retry_queues["jobs.retry.1000"]['x-dead-letter-routing-key'] == "jobs"
+    # C3
+    assert not retry_policy.is_exhausted(4)
+    assert retry_policy.is_exhausted(5)
+
+
+def test_RetryPolicy_create_headers():
+    """ Tests if attempts are tracked in headers.
+
+    # C1: Check that attempts are counted from existing headers
+    # C2: Check that the last error is recorded
+    # C3: Check that retry records are cleared on replay
+    """
+    retry_policy = RetryPolicy()
+    headers = retry_policy.create_headers({'run_id': "run_1"}, ValueError("bad"))
+    headers = retry_policy.create_headers(headers, KeyError("worse"))
+
+    # C1
+    assert headers[ATTEMPT_HEADER] == 2
+    # C2
+    assert headers[ERROR_HEADER] == "KeyError: 'worse'"
+    # C3
+    assert clear_retry_headers(headers) == {'run_id': "run_1"}
+
+
+def test_RetryPolicy_consumer(test_message, consumer_operator):
+    """ Tests if failed jobs are republished for a retry, instead of being
+        requeued. The broker is stubbed, so that the frames sent are observed.
+
+    # C1: Check that retry & quarantine queues are declared before consuming
+    # C2: Check that failed jobs are republished into their retry queue,
+          before being acknowledged
+    # C3: Check that jobs exhausting their attempts are quarantined
+    """
+    frames = []
+    headers = {}
+    consumer_operator.retry_policy = RetryPolicy(max_attempts=2, base_delay=1)
+    consumer_operator.connection = SimpleNamespace(
+        is_open=True,
+        add_callback_threadsafe=lambda callback: callback(),
+        process_data_events=lambda time_limit=None: None
+    )
+    consumer_operator.channel = SimpleNamespace(
+        is_open=True,
+        queue_declare=lambda queue, durable, arguments: frames.append(
+            ('declare', queue)
+        ),
+        basic_get=lambda queue, auto_ack: (
+            SimpleNamespace(routing_key=TEST_ROUTING_KEY, delivery_tag=1),
+            pika.BasicProperties(delivery_mode=2, headers=dict(headers)),
+            test_message.encode()
+        ),
+        basic_publish=lambda exchange, routing_key, body, properties, mandatory: (
+            frames.append(('publish', routing_key)),
+            headers.update(properties.headers)
+        ),
+        basic_ack=lambda delivery_tag, multiple: frames.append(('ack', delivery_tag))
+    )
+
+    def test_failing_process(**kwargs):
+        raise RuntimeError("Poison job")
+
+    # C1
+    consumer_operator.poll_message(process_function=test_failing_process)
+    assert frames[:2] == [
+        ('declare', f"{TEST_QUEUE}.retry.1000"),
+        ('declare', f"{TEST_QUEUE}.quarantine")
+    ]
+    # C2
+    assert frames[2:] == [('publish', f"{TEST_QUEUE}.retry.1000"), ('ack', 1)]
+    assert headers[ATTEMPT_HEADER] == 1
+    # C3
+    frames.clear()
+    consumer_operator.poll_message(process_function=test_failing_process)
+    assert frames == [('publish', f"{TEST_QUEUE}.quarantine"), ('ack', 1)]
+    assert headers[ATTEMPT_HEADER] == 2
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import math
+
+# Libs
+import pytest
+
+# Custom
+from synmanager.serialization import (
+    JSON_CONTENT_TYPE, 
+    CODECS, 
+    get_codec, 
+    get_decoder
+)
+
+##################
+# Configurations #
+##################
+
+
+##################
+# Tests - Codecs #
+##################
+
+@pytest.mark.parametrize("codec_name", list(CODECS))
+def test_Codecs_roundtrip(codec_name, test_kwargs):
+    """ Tests if every available codec restores job payloads exactly.
+
+    # C1: Check that decoded payloads are identical to their originals
+    # C2: Check that payloads are decodable via their advertised content type
+    # C3: Check that received buffers are decodable without prior conversion
+    """
+    codec = get_codec(codec_name)
+    encoded = codec.encode(test_kwargs)
+    received = encoded if isinstance(encoded, bytes) else encoded.encode()
+
+    # C1
+    assert codec.decode(encoded) == test_kwargs
+    # C2
+    assert get_decoder(codec.content_type).decode(encoded) == test_kwargs
+    # C3
+    assert codec.decode(received) == test_kwargs
+    assert codec.decode(memoryview(received)) == test_kwargs
+
+
+def test_Codecs_operator_detection(test_message, test_kwargs, base_operator):
+    """ Tests if operators detect the codec of a message from its content type,
+        & default to JSON for legacy messages without one.
+
+    # C1: Check that canonical JSON remains the default wire format
+    # C2: Check that legacy messages without a content type are parsed as JSON
+    # C3: Check that messages are parsed according to their content type
+    """
+    # C1
+    assert base_operator.create_message(test_kwargs) == test_message
+    # C2
+    assert get_decoder(None).content_type == JSON_CONTENT_TYPE
+    assert base_operator.parse_message(test_message.encode()) == test_kwargs
+    # C3
+    for codec in CODECS.values():
+        assert base_operator.parse_message(
+            codec.encode(test_kwargs), 
+            content_type=codec.content_type
+        ) == test_kwargs
+
+
+def test_Codecs_json_extensions():
+    """ Tests if JSON written by the default codec remains decodable via its
+        content type, even where it goes beyond what `orjson` accepts.
+
+    # C1: Check that NaN survives a round trip
+    # C2: Check that integers wider than 64 bits survive a round trip
+    """
+    codec = get_codec('json')
+    encoded = codec.encode({'loss': float('nan'), 'seed': 2**70})
+    decoded = get_decoder(codec.content_type).decode(encoded.encode())
+
+    # C1
+    assert math.isnan(decoded['loss'])
+    # C2
+    assert decoded['seed'] == 2**70
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager.throttling import (
+    FlowState,
+    RateLimiter,
+    TokenBucket,
+    calculate_backlog_factor
+)
+
+##################
+# Configurations #
+##################
+
+
+#######################
+# Tests - RateLimiter #
+#######################
+
+def test_RateLimiter_reserve():
+    """ Tests if token buckets admit bursts, then space out publishes.
+
+    # C1: Check that a full burst is admitted without waiting
+    # C2: Check that reservations beyond the burst are spaced out at the rate
+    # C3: Check that routing keys without rates are not limited
+    """
+    bucket = TokenBucket(rate=10, capacity=5)
+
+    # C1
+    assert all(bucket.reserve() == 0 for _ in range(5))
+    # C2
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+    assert bucket.reserve(rate_factor=0.5) > 0.5
+
+    # C3
+    limiter = RateLimiter(rates={'SynMQ_topic_train': 1})
+    assert limiter.reserve('SynMQ_topic_train') == 0
+    assert limiter.reserve('SynMQ_topic_train') > 0
+    assert limiter.reserve('SynMQ_topic_evaluate') == 0
+
+
+def test_RateLimiter_backpressure(train_producer_operator):
+    """ Tests if producers report throttling from broker flow control & 
+        queue backlogs.
+
+    # C1: Check that publishing slows down gradually beyond the soft limit
+    # C2: Check that producers are throttled while their connection is blocked
+    # C3: Check that throttling is lifted once the connection is unblocked
+    """
+    # C1
+    assert calculate_backlog_factor(depth=10, max_depth=100) == 1.0
+    assert calculate_backlog_factor(depth=75, max_depth=100) == 0.5
+    assert calculate_backlog_factor(depth=100, max_depth=100) == 0.0
+
+    # C2
+    flow_state = FlowState()
+    train_producer_operator._flow_state = flow_state
+    frame = SimpleNamespace(method=SimpleNamespace(reason='low on memory'))
+    flow_state.on_blocked(connection=None, frame=frame)
+    assert train_producer_operator.is_throttled()
+    assert train_producer_operator.get_throttled_duration() > 0
+
+    # C3
+    flow_state.on_unblocked(connection=None, frame=frame)
+    assert not train_producer_operator.is_throttled()
+    assert train_producer_operator.get_throttled_duration() == 0
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+import re
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager.config import MAX_PRIORITY, TRAIN_QUEUE
+from synmanager.topology import (
+    Topology,
+    clear_verified,
+    create_default_topology
+)
+
+##################
+# Configurations #
+##################
+
+BROKER = ('topology.test', 5672)
+
+####################
+# Tests - Topology #
+####################
+
+def test_Topology_declare():
+    """ Tests if entities are only declared once per process & broker.
+
+    # C1: Check that exchanges, queues & bindings are declared in order
+    # C2: Check that verified entities are skipped on later declarations
+    # C3: Check that only new entities are declared
+    # C4: Check that forgotten brokers are verified again
+    """
+    declared = []
+    channel = SimpleNamespace(
+        exchange_declare=lambda **kwargs: declared.append(('exchange', kwargs)),
+        queue_declare=lambda queue, **kwargs: declared.append(('queue', queue)),
+        queue_bind=lambda **kwargs: declared.append(('bind', kwargs))
+    )
+    clear_verified(BROKER)
+
+    topology = Topology()
+    topology.add_exchange('test_exchange', type='topic')
+    topology.add_queue('test_queue', arguments={'x-queue-type': 'classic'})
+    topology.add_binding('test_exchange', 'test_queue', 'test_key')
+
+    # C1
+    assert topology.declare(channel, broker=BROKER) == 3
+    assert [kind for kind, _ in declared] == ['exchange', 'queue', 'bind']
+
+    # C2
+    assert Topology().merge(topology).declare(channel, broker=BROKER) == 0
+    assert len(declared) == 3
+
+    # C3
+    topology.add_binding('test_exchange', 'test_queue', 'other_key')
+    assert topology.declare(channel, broker=BROKER) == 1
+    assert declared[-1][1]['routing_key'] == 'other_key'
+
+    # C4
+    clear_verified(BROKER)
+    assert topology.declare(channel, broker=BROKER) == 4
+
+
+def test_Topology_export_definitions(tmp_path):
+    """ Tests if broker definitions are generated from the default topology,
+        while keeping all other sections of existing definitions.
+
+    # C1: Check that non-topology sections are kept
+    # C2: Check that phase queues are durable priority queues
+    # C3: Check that policies cover parked queues
+    """
+    path = tmp_path / "definitions.json"
+    path.write_text(json.dumps({'users': [{'name': 'guest'}], 'queues': []}))
+
+    definitions = create_default_topology().export_definitions(str(path))
+
+    # C1
+    assert definitions['users'] == [{'name': 'guest'}]
+    assert json.loads(path.read_text()) == definitions
+
+    # C2
+    train_queue = next(
+        queue for queue in definitions['queues']
+        if queue['name'] == TRAIN_QUEUE
+    )
+    assert train_queue['durable']
+    assert train_queue['arguments']['x-max-priority'] == MAX_PRIORITY
+
+    # C3
+    policies = {
+        policy['name']: policy
+        for policy in definitions['policies']
+    }
+    lazy_policy, quarantine_policy = policies.values()
+    assert re.search(lazy_policy['pattern'], "train.retry.5000")
+    assert re.search(lazy_policy['pattern'], "SynMQ_topic_train.delayed.60")
+    assert re.search(quarantine_policy['pattern'], "train.quarantine")
+    assert quarantine_policy['priority'] > lazy_policy['priority']
+    assert quarantine_policy['definition']['queue-mode'] == 'lazy'
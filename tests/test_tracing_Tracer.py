@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+from types import SimpleNamespace
+
+# Libs
+import pytest
+
+# Custom
+from conftest import TEST_ROUTING_KEY
+from synmanager.tracing import (
+    TRACE_ID_HEADER,
+    SPAN_ID_HEADER,
+    JsonLinesExporter,
+    SpanExporter,
+    Tracer,
+    get_critical_path,
+    load_traces
+)
+
+##################
+# Configurations #
+##################
+
+
+###########
+# Helpers #
+###########
+
+class MemoryExporter(SpanExporter):
+    """ Collects finished spans in memory """
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span.to_dict())
+
+
+def create_channel(published: list):
+    """ Creates a stub channel recording the properties of every publish """
+    return SimpleNamespace(
+        is_open=True,
+        basic_publish=lambda **kwargs: published.append(kwargs['properties']),
+        basic_ack=lambda delivery_tag: None
+    )
+
+##################
+# Tests - Tracer #
+##################
+
+def test_Tracer_propagation(
+    test_message,
+    producer_operator,
+    consumer_operator,
+    completed_producer_operator
+):
+    """ Tests if trace context is carried from a published job, through the
+        consumer processing it, into the completed job it publishes.
+
+    # C1: Check that trace context is injected into published headers
+    # C2: Check that consumers continue the trace of received jobs
+    # C3: Check that jobs published during processing join the trace
+    # C4: Check that the critical path is reconstructed from the root
+    """
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter=exporter)
+
+    published = []
+    for operator in (producer_operator, completed_producer_operator):
+        operator.tracer = tracer
+        operator.connection = SimpleNamespace(is_open=True)
+        operator.channel = create_channel(published)
+    consumer_operator.tracer = tracer
+
+    # C1
+    producer_operator.publish_message(test_message, message_id="job-1")
+    headers = published[0].headers
+    publish_span = exporter.spans[0]
+    assert headers[TRACE_ID_HEADER] == publish_span['trace_id']
+    assert headers[SPAN_ID_HEADER] == publish_span['span_id']
+    assert publish_span['parent_id'] is None
+
+    # C2
+    def test_process(**kwargs):
+        completed_producer_operator.publish_message(test_message)
+        return kwargs
+
+    callback = consumer_operator.generate_callback(test_process)
+    method = SimpleNamespace(routing_key=TEST_ROUTING_KEY, delivery_tag=1)
+    callback(
+        SimpleNamespace(basic_ack=lambda delivery_tag: None),
+        method,
+        published[0],
+        test_message.encode()
+    )
+    completed_span, process_span = exporter.spans[1:]
+    assert process_span['parent_id'] == publish_span['span_id']
+    assert process_span['attributes']['outcome'] == 'completed'
+    assert process_span['attributes']['queue_wait'] >= 0
+
+    # C3
+    assert completed_span['parent_id'] == process_span['span_id']
+    assert published[1].headers[TRACE_ID_HEADER] == publish_span['trace_id']
+    assert {span['trace_id'] for span in exporter.spans} == {publish_span['trace_id']}
+
+    # C4
+    critical_path = get_critical_path(exporter.spans)
+    assert [span['span_id'] for span in critical_path] == [
+        publish_span['span_id'],
+        process_span['span_id']
+    ]
+
+
+def test_Tracer_failed_publish(test_message, producer_operator):
+    """ Tests if spans of publishes interrupted by an error are finished.
+
+    # C1: Check that the error is raised to the caller
+    # C2: Check that the span is exported as failed, along with its error
+    """
+    exporter = MemoryExporter()
+    producer_operator.tracer = Tracer(exporter=exporter)
+    producer_operator.connection = SimpleNamespace(is_open=True)
+
+    def failing_publish(**kwargs):
+        raise RuntimeError("Failed publish")
+
+    producer_operator.channel = SimpleNamespace(
+        is_open=True,
+        basic_publish=failing_publish
+    )
+
+    # C1
+    with pytest.raises(RuntimeError):
+        producer_operator.publish_message(test_message)
+
+    # C2
+    span, = exporter.spans
+    assert span['end_time'] is not None
+    assert span['attributes']['outcome'] == 'failed'
+    assert "Failed publish" in span['attributes']['error']
+
+
+def test_Tracer_JsonLinesExporter(tmp_path):
+    """ Tests if spans exported as JSON lines are loaded back by trace.
+
+    # C1: Check that every span is written as a single line
+    # C2: Check that spans are grouped by trace, in order of start
+    """
+    path = str(tmp_path / "traces.jsonl")
+    tracer = Tracer(exporter=JsonLinesExporter(path))
+
+    root_span = tracer.start_span("publish train", queue="train")
+    with tracer.activate(root_span):
+        child_span = tracer.start_span("publish completed")
+    other_span = tracer.start_span("publish evaluate")
+    for span in (child_span, root_span, other_span):
+        tracer.finish(span)
+    tracer.exporter.shutdown()
+
+    # C1
+    with open(path) as trace_file:
+        lines = trace_file.readlines()
+    assert len(lines) == 3
+    assert json.loads(lines[1])['attributes'] == {'queue': "train"}
+
+    # C2
+    traces = load_traces(path)
+    assert len(traces) == 2
+    assert [span['span_id'] for span in traces[root_span.trace_id]] == [
+        root_span.span_id,
+        child_span.span_id
+    ]
@@ -7,6 +7,7 @@
 # Generic/Built-in
 import time
 from multiprocessing import Manager, Process
+from types import SimpleNamespace
 
 # Libs
 
@@ -43,7 +44,8 @@ def test_TrainProducerOperator_publish_message(
     declared_queue = train_producer_operator.channel.queue_declare(
         TRAIN_QUEUE, 
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=train_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 1
@@ -78,7 +80,8 @@ def test_TrainProducerOperator_process(test_kwargs, train_producer_operator):
     declared_queue = train_producer_operator.channel.queue_declare(
         TRAIN_QUEUE,
         passive=False, 
-        durable=True
+        durable=True,
+        arguments=train_producer_operator.create_queue_arguments()
     )
     queue_message_count = declared_queue.method.message_count
     assert queue_message_count == 2
@@ -109,4 +112,151 @@ def test_TrainProducerOperator_process(test_kwargs, train_producer_operator):
     p.terminate()
     p.join()
     p.close()
-    train_producer_operator.disconnect()
\ No newline at end of file
+    train_producer_operator.disconnect()
+
+def test_TrainProducerOperator_process_many(
+    test_kwargs, 
+    train_producer_operator
+):
+    """ Tests if bulk message generation is valid. Jobs are published in a
+        single batch to the `Train` queue, with confirmations awaited in bulk.
+
+    # C1: Check that every published message was confirmed by the broker
+    # C2: Check that all published messages arrived in the queue
+    """
+    train_producer_operator.connect()
+    job_combinations = enumerate_federated_conbinations(**test_kwargs)
+    confirmations = train_producer_operator.process_many(
+        iterable_of_kwargs=(
+            {
+                'process': 'train',
+                'combination_key': job_key,
+                'combination_params': job_kwargs
+            }
+            for job_key, job_kwargs in job_combinations.items()
+        ),
+        window=1
+    )
+
+    # C1
+    assert confirmations == [True] * len(job_combinations)
+    # C2
+    declared_queue = train_producer_operator.channel.queue_declare(
+        TRAIN_QUEUE,
+        passive=False, 
+        durable=True,
+        arguments=train_producer_operator.create_queue_arguments()
+    )
+    assert declared_queue.method.message_count == len(job_combinations)
+
+    train_producer_operator.channel.queue_purge(TRAIN_QUEUE)
+    train_producer_operator.disconnect()
+
+
+def test_TrainProducerOperator_process_many_timeout(
+    test_kwargs, 
+    train_producer_operator
+):
+    """ Tests if bulk submissions timing out on confirmations still report a
+        status for every job. The broker is stubbed to never confirm.
+
+    # C1: Check that a status is returned for every job submitted
+    # C2: Check that no job is reported as confirmed
+    # C3: Check that jobs are no longer published once timed out
+    """
+    published = []
+    train_producer_operator.connection = SimpleNamespace(
+        is_open=True,
+        process_data_events=lambda time_limit=None: None
+    )
+    train_producer_operator.channel = SimpleNamespace(is_open=True)
+    train_producer_operator.batch_channel = SimpleNamespace(
+        is_open=True,
+        _impl=SimpleNamespace(
+            basic_publish=lambda **kwargs: published.append(kwargs)
+        )
+    )
+    job_combinations = enumerate_federated_conbinations(**test_kwargs)
+    confirmations = train_producer_operator.process_many(
+        iterable_of_kwargs=(
+            {
+                'process': 'train',
+                'combination_key': job_key,
+                'combination_params': job_kwargs
+            }
+            for job_key, job_kwargs in job_combinations.items()
+        ),
+        window=1,
+        timeout=0
+    )
+
+    # C1
+    assert len(confirmations) == len(job_combinations) > 1
+    # C2
+    assert not any(confirmations)
+    # C3
+    assert len(published) == 1
+
+
+def test_TrainProducerOperator_process_priority(
+    test_kwargs, 
+    train_producer_operator
+):
+    """ Tests if prioritised jobs overtake jobs queued before them in the
+        `Train` queue.
+
+    # C1: Check that the job with the highest priority is delivered first
+    """
+    train_producer_operator.connect()
+    train_producer_operator.channel.queue_declare(
+        TRAIN_QUEUE,
+        durable=True,
+        arguments=train_producer_operator.create_queue_arguments()
+    )
+    for priority in [1, 1, 9]:
+        train_producer_operator.process_with(
+            {'process': 'train', 'priority_level': priority},
+            priority=priority
+        )
+
+    # C1
+    _, properties, body = train_producer_operator.channel.basic_get(
+        TRAIN_QUEUE,
+        auto_ack=True
+    )
+    assert properties.priority == 9
+    assert train_producer_operator.parse_message(body)['priority_level'] == 9
+
+    train_producer_operator.channel.queue_purge(TRAIN_QUEUE)
+    train_producer_operator.disconnect()
+
+
+def test_TrainProducerOperator_process_delay(train_producer_operator):
+    """ Tests if delayed jobs are held back on the broker before being 
+        released into the `Train` queue.
+
+    # C1: Check that a delayed job is not routed to its queue immediately
+    # C2: Check that a delayed job is released into its queue after its delay
+    """
+    train_producer_operator.connect()
+    train_producer_operator.channel.queue_declare(
+        TRAIN_QUEUE,
+        durable=True,
+        arguments=train_producer_operator.create_queue_arguments()
+    )
+    train_producer_operator.process_with({'process': 'train'}, delay=1)
+
+    # C1
+    _, _, body = train_producer_operator.channel.basic_get(TRAIN_QUEUE)
+    assert body is None
+
+    # C2
+    time.sleep(2)
+    _, _, body = train_producer_operator.channel.basic_get(
+        TRAIN_QUEUE,
+        auto_ack=True
+    )
+    assert train_producer_operator.parse_message(body) == {'process': 'train'}
+
+    train_producer_operator.channel.queue_purge(TRAIN_QUEUE)
+    train_producer_operator.disconnect()
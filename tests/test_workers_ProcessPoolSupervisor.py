@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Libs
+import pytest
+
+# Custom
+from synmanager.workers import ProcessPoolSupervisor
+
+##################
+# Configurations #
+##################
+
+
+def get_pid(**kwargs):
+    return os.getpid()
+
+
+def crash(**kwargs):
+    os._exit(1)
+
+
+def sleep(duration, **kwargs):
+    time.sleep(duration)
+    return os.getpid()
+
+#################################
+# Tests - ProcessPoolSupervisor #
+#################################
+
+def test_ProcessPoolSupervisor_submit():
+    """ Tests if jobs are executed on worker processes.
+
+    # C1: Check that results are relayed back from workers
+    # C2: Check that workers are recycled after their job limit
+    # C3: Check that crashed workers are replaced
+    """
+    supervisor = ProcessPoolSupervisor(
+        consumer=None, 
+        processes=1, 
+        max_tasks_per_child=2
+    )
+    try:
+        # C1
+        first_pid = supervisor.submit(get_pid)
+        assert first_pid != os.getpid()
+        # C2
+        assert supervisor.submit(get_pid) == first_pid
+        second_pid = supervisor.submit(get_pid)
+        assert second_pid != first_pid
+        # C3
+        with pytest.raises(BrokenProcessPool):
+            supervisor.submit(crash)
+        assert supervisor.submit(get_pid) not in (first_pid, second_pid)
+
+    finally:
+        supervisor.shutdown()
+
+
+def test_ProcessPoolSupervisor_crash_isolation():
+    """ Tests if a crashing worker only fails the job it was running.
+
+    # C1: Check that the crashing job fails
+    # C2: Check that jobs running on other workers complete
+    """
+    supervisor = ProcessPoolSupervisor(consumer=None, processes=2)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as threads:
+            supervisor.submit(get_pid)  # starts worker of this thread
+            running_job = threads.submit(supervisor.submit, sleep, duration=2)
+            time.sleep(0.5)
+
+            # C1
+            with pytest.raises(BrokenProcessPool):
+                supervisor.submit(crash)
+            # C2
+            assert running_job.result() != os.getpid()
+
+    finally:
+        supervisor.shutdown()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import threading
+from types import SimpleNamespace
+
+# Libs
+
+
+# Custom
+from synmanager.workers import ThreadsafeChannel
+
+##################
+# Configurations #
+##################
+
+
+#############################
+# Tests - ThreadsafeChannel #
+#############################
+
+def test_ThreadsafeChannel_basic_ack():
+    """ Tests if acknowledgements issued by workers are scheduled onto the
+        connection thread, instead of being sent directly.
+
+    # C1: Check that acks from the connection thread are sent directly
+    # C2: Check that acks from worker threads are deferred until the
+          connection thread runs its scheduled callbacks
+    # C3: Check that deferred acks on a closed channel are dropped
+    """
+    sent = []
+    scheduled = []
+    channel = SimpleNamespace(
+        is_open=True,
+        basic_ack=lambda **kwargs: sent.append(('ack', kwargs)),
+        basic_reject=lambda **kwargs: sent.append(('reject', kwargs))
+    )
+    connection = SimpleNamespace(add_callback_threadsafe=scheduled.append)
+    threadsafe_channel = ThreadsafeChannel(connection, channel)
+
+    # C1
+    threadsafe_channel.basic_ack(delivery_tag=1)
+    assert sent == [('ack', {'delivery_tag': 1, 'multiple': False})]
+    assert not scheduled
+
+    # C2
+    worker = threading.Thread(
+        target=lambda: (
+            threadsafe_channel.basic_ack(delivery_tag=2),
+            threadsafe_channel.basic_reject(delivery_tag=3)
+        )
+    )
+    worker.start()
+    worker.join()
+    assert len(sent) == 1 and len(scheduled) == 2
+    for callback in scheduled:
+        callback()
+    assert sent[1:] == [
+        ('ack', {'delivery_tag': 2, 'multiple': False}),
+        ('reject', {'delivery_tag': 3, 'requeue': True})
+    ]
+
+    # C3
+    scheduled.clear()
+    worker = threading.Thread(
+        target=lambda: threadsafe_channel.basic_ack(delivery_tag=4)
+    )
+    worker.start()
+    worker.join()
+    channel.is_open = False
+    scheduled[0]()
+    assert len(sent) == 3